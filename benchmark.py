@@ -0,0 +1,446 @@
+import io, os, ast, sys, time, random, argparse, tempfile, statistics, subprocess
+from contextlib import redirect_stdout
+import pandas as pd
+import storage
+from consolidate import consolidate_data, explode_frame, parse_dict_literal, _literal
+from storage import typed_master
+from media import media_dict, MediaClassifier
+
+# --- Synthetic data ---
+
+def _synthetic_day(rng, day):
+    # One day of the shapes the windows really write: 3-part grouped rows,
+    # 2-part "Section - Key" columns, bare columns and the odd dict-like cell
+    media = {"Date": day}
+    for letter in "ABCDEFGHIJ"[:rng.randint(0, 10)]:
+        media[f"YouTube {letter} - Video {letter} - title"] = f"Video {rng.randint(1, 500)}"
+        media[f"YouTube {letter} - Video {letter} - duration"] = rng.randint(3, 60)
+        media[f"YouTube {letter} - Video {letter} - rating"] = rng.randint(40, 100)
+    if rng.random() < 0.5:
+        media["Anime A - Show A - title"] = f"Show {rng.randint(1, 40)}"
+        media["Anime A - Show A - duration"] = 22
+        media["Anime A - Show A - details"] = str({"type": "episode", "number": rng.randint(1, 24), "rating": rng.randint(1, 10)})
+
+    sleep = {
+        "Date": day,
+        "Main Sleep - start": f"{rng.randint(21, 23)}:{rng.randint(0, 59):02d}",
+        "Main Sleep - end": f"0{rng.randint(5, 9)}:{rng.randint(0, 59):02d}",
+        "Main Sleep - duration": rng.randint(300, 540),
+        "Main Sleep - quality": rng.randint(1, 10),
+    }
+
+    eating = {"Date": day}
+    for i, meal in enumerate(["Breakfast", "Lunch", "Dinner", "Snack"][:rng.randint(1, 4)]):
+        letter = "ABCD"[i]
+        eating[f"Meals {letter} - {meal} - name"] = f"Food {rng.randint(1, 80)}"
+        eating[f"Meals {letter} - {meal} - calories"] = rng.randint(100, 1200)
+        eating[f"Meals {letter} - {meal} - duration"] = rng.randint(5, 45)
+
+    misc = {
+        "Date": day,
+        "Fixed - Teeth Brushed": rng.randint(0, 2),
+        "Fixed - Showers": rng.randint(0, 1),
+        "Drugs A - Pregabalin - dosage": 300,
+        "Drugs A - Pregabalin - notes": rng.choice(["Good", "Okay", "N/A"]),
+        "notes": rng.choice(["", "busy day", "rest day"]),
+    }
+    return {"Media.csv": media, "Sleep.csv": sleep, "Eating.csv": eating, "Miscellaneous.csv": misc}
+
+def synthetic_frames(years=5, seed=0):
+    """Window data frames for `years` of daily submits, parsed the way read_csv would."""
+    rng = random.Random(seed)
+    rows = {}
+    for day in pd.date_range("2021-01-01", periods=365 * years).strftime("%Y-%m-%d"):
+        for filename, row in _synthetic_day(rng, day).items():
+            rows.setdefault(filename, []).append(row)
+
+    frames = {}
+    for filename, file_rows in rows.items():
+        # Round trip through CSV text so dtypes (float columns with gaps) are realistic
+        text = pd.DataFrame(file_rows).replace("", None).to_csv(index=False)
+        frames[filename] = pd.read_csv(io.StringIO(text))
+    return frames
+
+# --- Benchmarks ---
+
+def _time(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def bench_consolidate(args):
+    frames = synthetic_frames(args.years)
+    cells = sum(int(df.drop(columns="Date").notna().sum().sum()) for df in frames.values())
+    print(f"{args.years} years of synthetic data: {len(frames)} files, {cells} non-empty cells")
+
+    totals = {"legacy": 0.0, "vectorized": 0.0}
+    for filename, df in frames.items():
+        timings = {}
+        outputs = {}
+        for engine in totals:
+            timings[engine], outputs[engine] = _time(lambda: explode_frame(df, filename, engine=engine), args.repeat)
+            totals[engine] += timings[engine]
+        # Row-for-row match, formatted as it would be in master_log.csv
+        if outputs["legacy"].to_csv(index=False) != outputs["vectorized"].to_csv(index=False):
+            raise SystemExit(f"{filename}: vectorized output differs from legacy")
+        print(f"  {filename:<20} {len(outputs['legacy']):>7} rows  "
+              f"legacy {timings['legacy']:7.3f}s  vectorized {timings['vectorized']:7.3f}s  "
+              f"{timings['legacy'] / timings['vectorized']:5.1f}x")
+
+    print(f"Total: legacy {totals['legacy']:.3f}s, vectorized {totals['vectorized']:.3f}s "
+          f"({totals['legacy'] / totals['vectorized']:.1f}x faster), outputs identical")
+    check_incremental(frames)
+
+def _session(backend, rng, days, filenames):
+    # Resubmit `days` of the given files the way a GUI session commits them
+    session = storage.Session(backend)
+    for day in days:
+        for filename, row in _synthetic_day(rng, day).items():
+            if filename in filenames:
+                session.add(filename[:-len(".csv")], row)
+    return session.commit()
+
+def check_incremental(frames, seed=0):
+    """Incremental master logs (with and without a session's changed keys) must equal a full rebuild byte for byte."""
+    rng = random.Random(seed)
+    all_days = list(frames["Sleep.csv"]["Date"])
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            os.makedirs(storage.DATA_DIR)
+            for filename, df in frames.items():
+                df.to_csv(os.path.join(storage.DATA_DIR, filename), index=False)
+            backend = storage.CsvBackend()
+            with redirect_stdout(io.StringIO()):
+                consolidate_data(backend, full=True)
+            # Media gains columns (a staged rewrite), Sleep and Misc append; a
+            # mid-file day changes rows inside the log, not just at its end
+            runs = [("incremental, --changed", {"Media.csv", "Sleep.csv"}, True),
+                    ("incremental", {"Eating.csv", "Miscellaneous.csv"}, False)]
+            for label, filenames, restricted in runs:
+                changed = _session(backend, rng, rng.sample(all_days, 3) + [all_days[-1]], filenames)
+                with redirect_stdout(io.StringIO()):
+                    started = time.perf_counter()
+                    consolidate_data(backend, changed=changed if restricted else None)
+                    seconds = time.perf_counter() - started
+                    with open(storage.MASTER_LOG, "rb") as f:
+                        incremental = f.read()
+                    consolidate_data(backend, full=True)
+                    with open(storage.MASTER_LOG, "rb") as f:
+                        full = f.read()
+                if incremental != full:
+                    raise SystemExit(f"{label}: master log differs from a full rebuild")
+                print(f"  {label:<24} {seconds:7.3f}s  master log identical to a full rebuild")
+        finally:
+            os.chdir(cwd)
+
+# --- Crash recovery ---
+
+class _Crash(Exception):
+    pass
+
+def _crash_staged(journal_path, data):
+    # Killed with every rewrite staged, before the journal is durable
+    raise _Crash()
+
+def _crash_mid_apply(journal, recovering=False):
+    # Killed halfway through the first append (or after the first rename)
+    if journal["appends"]:
+        filename, size, payload = journal["appends"][0]
+        with open(filename, "r+b") as f:
+            f.truncate(size)
+            f.seek(size)
+            f.write(payload.encode("utf-8")[:len(payload) // 2])
+    else:
+        os.replace(*journal["renames"][0])
+    raise _Crash()
+
+def _crash_applied(journal, recovering=False):
+    # Killed with every file written, before the journal is removed
+    _apply_journal(journal, recovering)
+    raise _Crash()
+
+def _crash_indexing(*args):
+    # Killed after the journal is removed, before any sidecar index is updated
+    raise _Crash()
+
+_apply_journal = storage._apply_journal
+# Crash point -> the storage functions replaced to kill commit_days there
+CRASH_POINTS = {
+    "staged": {"_write_durable": _crash_staged},
+    "mid-apply": {"_apply_journal": _crash_mid_apply},
+    "applied": {"_apply_journal": _crash_applied},
+    "indexing": {"build_index": _crash_indexing, "_restat": _crash_indexing},
+}
+
+def _recovery_case(layout, mode, crash, seed):
+    # Seed a data dir, commit one more session (killed at `crash`, if given)
+    # and return the state before the commit, the journal left behind, and the backend
+    rng = random.Random(seed)
+    backend = storage.CsvBackend(layout=layout, mode=mode)
+    for day in pd.date_range("2024-01-01", periods=20).strftime("%Y-%m-%d"):
+        _session(backend, rng, [day], {"Media.csv", "Sleep.csv", "Eating.csv", "Miscellaneous.csv"})
+    old = _data_state(backend)
+
+    # A resubmitted day (a tombstone append, or a rewrite in "rewrite" mode),
+    # a new day, and a column Sleep has never had (a rewrite in the wide layout)
+    session = storage.Session(backend)
+    for day in ["2024-01-10", "2024-01-21"]:
+        for filename, row in _synthetic_day(rng, day).items():
+            session.add(filename[:-len(".csv")], row)
+    session.add("Sleep", dict(_synthetic_day(rng, "2024-01-22")["Sleep.csv"], **{"Nap - duration": 20}))
+
+    saved = {attr: getattr(storage, attr) for attr in CRASH_POINTS.get(crash, {})}
+    storage.__dict__.update(CRASH_POINTS.get(crash, {}))
+    try:
+        session.commit()
+    except _Crash:
+        pass
+    finally:
+        storage.__dict__.update(saved)
+    journal = None
+    if os.path.exists(storage.JOURNAL_PATH):
+        with open(storage.JOURNAL_PATH, "rb") as f:
+            journal = f.read()
+    return old, journal, backend
+
+def _data_state(backend):
+    # Each category file's bytes and its rows as read through the sidecar index
+    files = {}
+    rows = {}
+    for name in sorted(backend.categories()):
+        with open(storage.category_path(name, backend.data_dir, backend.layout), "rb") as f:
+            files[name] = f.read()
+        rows[name] = backend.rows(name)
+    return files, rows
+
+def _in_scratch(fn, *args):
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            with redirect_stdout(io.StringIO()):
+                return fn(*args)
+        finally:
+            os.chdir(cwd)
+
+def _check_recovered(layout, mode, crash, seed, new):
+    old, journal, backend = _recovery_case(layout, mode, crash, seed)
+    storage.recover_journal()
+    states = [_data_state(backend)]
+    if journal is not None:
+        # Replaying the same journal again must change nothing
+        with open(storage.JOURNAL_PATH, "wb") as f:
+            f.write(journal)
+        storage.recover_journal()
+        states.append(_data_state(backend))
+    leftovers = [filename for filename in os.listdir(backend.data_dir) if filename.endswith(".commit-tmp")]
+    if leftovers or os.path.exists(storage.JOURNAL_PATH):
+        return "left " + ", ".join(leftovers or [storage.JOURNAL_PATH]) + " behind"
+    outcome = "old" if states[0] == old else "new" if states[0] == new else None
+    if outcome is None:
+        return "files or indexes are neither fully old nor fully new"
+    if any(state != states[0] for state in states[1:]):
+        return "replaying the journal again changed the files"
+    return outcome + (", replayed twice" if journal is not None else "")
+
+def check_recovery(seed=0):
+    """A commit killed at any point must recover to fully old or fully new files, and replay must be idempotent."""
+    # Before the journal is durable the commit is lost; from then on it lands
+    expected = {"staged": "old", "mid-apply": "new", "applied": "new", "indexing": "new"}
+    for layout in ["wide", "long"]:
+        for mode in ["append", "rewrite"]:
+            new = _in_scratch(lambda: _data_state(_recovery_case(layout, mode, None, seed)[2]))
+            for crash in CRASH_POINTS:
+                result = _in_scratch(_check_recovered, layout, mode, crash, seed, new)
+                if not result.startswith(expected[crash]):
+                    raise SystemExit(f"{layout}/{mode}, killed {crash}: {result}")
+                print(f"  {layout:<5} {mode:<8} killed {crash:<10} recovered {result}")
+
+def bench_recovery(args):
+    check_recovery(args.seed)
+    print("OK: every interrupted commit recovered to fully old or fully new files")
+
+def bench_literal(args):
+    # A day's dict cells mostly repeat earlier ones; `distinct` sets how many unique strings there are
+    rng = random.Random(0)
+    pool = [str({"type": rng.choice(["episode", "movie", "clip"]), "number": n, "rating": rng.randint(1, 10),
+                 "notes": f"note {n}"}) for n in range(args.distinct)]
+    cells = [rng.choice(pool) for _ in range(args.cells)]
+
+    # The parser must refuse anything that isn't a plain literal
+    for hostile in ["{__import__('os').system('echo pwned')}", "{'a': open('x')}", "{'a': (lambda: 1)()}", "{" * 5000 + "}" * 5000]:
+        assert parse_dict_literal(hostile) is None, hostile
+
+    def run_cached():
+        _literal.cache_clear()
+        return [parse_dict_literal(cell) for cell in cells]
+
+    timings = {}
+    results = {}
+    for label, fn in [
+        ("eval", lambda: [eval(cell) for cell in cells]),
+        ("ast.literal_eval", lambda: [ast.literal_eval(cell) for cell in cells]),
+        ("parse_dict_literal", run_cached),
+    ]:
+        timings[label], results[label] = _time(fn, args.repeat)
+    assert results["eval"] == results["ast.literal_eval"] == results["parse_dict_literal"]
+
+    print(f"{args.cells} dict cells, {args.distinct} distinct values")
+    for label, seconds in timings.items():
+        print(f"  {label:<20} {seconds:7.3f}s  {seconds / args.cells * 1e6:6.2f} us/cell")
+    print(f"parse_dict_literal is {timings['eval'] / timings['parse_dict_literal']:.1f}x faster than eval")
+
+def synthetic_master(years=5, copies=1):
+    """A consolidated master log (as consolidate_data builds it) from synthetic window data."""
+    frames = synthetic_frames(years)
+    master_df = pd.concat([explode_frame(df, filename) for filename, df in frames.items()], ignore_index=True)
+    master_df = pd.concat([master_df] * copies, ignore_index=True)
+    return master_df.sort_values("Date", kind="stable", ignore_index=True)
+
+def bench_memory(args):
+    master_df = synthetic_master(args.years, args.copies)
+
+    # Untyped: what reading master_log.csv back gives (object/str columns, Value mixed)
+    untyped = pd.read_csv(io.StringIO(master_df.to_csv(index=False)))
+    untyped["Date"] = pd.to_datetime(untyped["Date"], errors="coerce")
+    typed = typed_master(master_df)
+
+    print(f"{len(master_df)} master rows ({args.years} years x {args.copies})")
+    for label, frame in [("untyped (read_csv)", untyped), ("typed (typed_master)", typed)]:
+        usage = frame.memory_usage(deep=True, index=False)
+        print(f"  {label}: {usage.sum() / 2**20:.1f} MiB")
+        for col, size in usage.items():
+            print(f"    {col:<12} {str(frame[col].dtype):<16} {size / 2**20:7.2f} MiB")
+    ratio = untyped.memory_usage(deep=True).sum() / typed.memory_usage(deep=True).sum()
+    print(f"Typed master uses {ratio:.1f}x less memory")
+
+def scan_media(title, media_dict):
+    # classify_media as it was: a linear scan of media_dict per title
+    for key, (name, category) in media_dict.items():
+        if key.lower() in str(title).lower():
+            return name, category
+    return None, None
+
+def bench_media(args):
+    # Titles repeat across days like real Subtypes do; about half name a media_dict key
+    rng = random.Random(0)
+    keys = list(media_dict)
+    pool = [f"{rng.choice(['', 'New ', 'Re: '])}{rng.choice(keys + ['Vlog', 'Podcast', 'Stream'])} #{n}"
+            for n in range(args.distinct)]
+    titles = pd.Series([rng.choice(pool) for _ in range(args.titles)])
+
+    def run_compiled():
+        classifier = MediaClassifier(media_dict)
+        return [classifier.classify(title) for title in titles]
+
+    timings = {}
+    results = {}
+    for label, fn in [
+        ("linear scan", lambda: [scan_media(title, media_dict) for title in titles]),
+        ("compiled", run_compiled),
+        ("classify_series", lambda: MediaClassifier(media_dict).classify_series(titles)),
+    ]:
+        timings[label], results[label] = _time(fn, args.repeat)
+    series = results.pop("classify_series")
+    results["classify_series"] = [
+        (name, category) if isinstance(category, str) else (None, None)
+        for name, category in zip(series["media_name"], series["media_category"])
+    ]
+    assert results["linear scan"] == results["compiled"] == results["classify_series"]
+
+    print(f"{args.titles} titles, {args.distinct} distinct, {len(media_dict)} media_dict keys")
+    for label, seconds in timings.items():
+        print(f"  {label:<20} {seconds:7.3f}s  {seconds / args.titles * 1e6:6.2f} us/title")
+    print(f"classify_series is {timings['linear scan'] / timings['classify_series']:.1f}x faster than the linear scan")
+
+# Cold-start budget for `import main` (everything that runs before the selector draws)
+STARTUP_BUDGET_MS = 100
+# Modules that must not load before the selector draws; main.py imports them lazily
+# and the window modules (with tkcalendar) come from the registry on launch
+STARTUP_FORBIDDEN = ["pandas", "numpy", "matplotlib", "storage", "consolidate", "visualize", "tracker", "tkcalendar"]
+
+def import_times(module):
+    """-X importtime report of a fresh interpreter importing module and what it imports.
+
+    {name: (self_us, cumulative_us, depth)}, depth 0 being module itself. The
+    interpreter's own startup imports are left out.
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        # Names are indented one space, plus two per level of nesting
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        times[name.strip()] = (int(self_us), int(cumulative_us), depth)
+        if depth == 0:
+            # Each top-level import comes after everything it imported
+            if name.strip() == module:
+                return times
+            times = {}
+    raise ValueError(f"{module} not found in the -X importtime report")
+
+def bench_startup(args):
+    runs = [import_times("main") for _ in range(args.repeat)]
+    totals = [times["main"][1] / 1000 for times in runs]
+    median = statistics.median(totals)
+    times = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    print(f"import main: median {median:.1f} ms over {args.repeat} runs (min {min(totals):.1f}, max {max(totals):.1f}), "
+          f"budget {args.budget_ms} ms")
+    direct = sorted(((cumulative, name) for name, (_, cumulative, depth) in times.items() if depth == 1), reverse=True)
+    for cumulative, name in direct[:10]:
+        print(f"  {name:<40} {cumulative / 1000:7.1f} ms")
+
+    loaded = [name for name in STARTUP_FORBIDDEN if name in times]
+    if loaded:
+        raise SystemExit(f"FAIL: imported before the selector draws: {', '.join(loaded)}")
+    if median > args.budget_ms:
+        raise SystemExit(f"FAIL: cold start {median:.1f} ms is over the {args.budget_ms} ms budget")
+    print("OK: within budget")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Performance benchmarks on synthetic data")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    consolidate_cmd = commands.add_parser("consolidate", help="Legacy vs vectorized consolidation engine, incremental vs full master log")
+    consolidate_cmd.add_argument("--years", type=int, default=5)
+    consolidate_cmd.add_argument("--repeat", type=int, default=3)
+    consolidate_cmd.set_defaults(func=bench_consolidate)
+
+    recovery_cmd = commands.add_parser("recovery", help="Kill a session commit at each step and check that recovery is all-or-nothing")
+    recovery_cmd.add_argument("--seed", type=int, default=0)
+    recovery_cmd.set_defaults(func=bench_recovery)
+
+    literal_cmd = commands.add_parser("literal", help="eval vs cached literal parsing of dict-shaped cells")
+    literal_cmd.add_argument("--cells", type=int, default=100000)
+    literal_cmd.add_argument("--distinct", type=int, default=500)
+    literal_cmd.add_argument("--repeat", type=int, default=3)
+    literal_cmd.set_defaults(func=bench_literal)
+
+    memory_cmd = commands.add_parser("memory", help="Memory of the untyped vs typed master log")
+    memory_cmd.add_argument("--years", type=int, default=5)
+    memory_cmd.add_argument("--copies", type=int, default=10)
+    memory_cmd.set_defaults(func=bench_memory)
+
+    media_cmd = commands.add_parser("media", help="Linear scan vs compiled media classification")
+    media_cmd.add_argument("--titles", type=int, default=200000)
+    media_cmd.add_argument("--distinct", type=int, default=2000)
+    media_cmd.add_argument("--repeat", type=int, default=3)
+    media_cmd.set_defaults(func=bench_media)
+
+    startup_cmd = commands.add_parser("startup", help="Cold-start import time of main.py against a budget (-X importtime)")
+    startup_cmd.add_argument("--repeat", type=int, default=5)
+    startup_cmd.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    startup_cmd.set_defaults(func=bench_startup)
+
+    args = parser.parse_args()
+    args.func(args)
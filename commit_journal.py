@@ -0,0 +1,64 @@
+import os, json
+
+# The session commit journal (see storage.commit_days). Kept free of the data
+# stack so the GUI can recover an interrupted commit before its first paint.
+JOURNAL_PATH = "data/commit.journal"
+# Where commit_days stages "*.commit-tmp" rewrites: storage.DATA_DIR and LONG_DATA_DIR
+STAGING_DIRS = ["data/window_data", "data/long_data"]
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(path or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _write_durable(path, data):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(path))
+
+def _apply_journal(journal, recovering=False):
+    # Idempotent, so a journal left behind by a crash can simply be replayed.
+    # Only a replay may find a staged rewrite gone (renamed before the crash);
+    # during a live commit that means the rewrite was lost, which must not pass silently
+    for filename, size, payload in journal["appends"]:
+        with open(filename, "r+b") as f:
+            f.truncate(size)
+            f.seek(size)
+            f.write(payload.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+    for tmp_path, filename in journal["renames"]:
+        if os.path.exists(tmp_path):
+            os.replace(tmp_path, filename)
+        elif not recovering:
+            raise FileNotFoundError(f"Staged rewrite {tmp_path} disappeared before it was committed")
+    for directory in {os.path.dirname(filename) for _, filename in journal["renames"]}:
+        _fsync_dir(directory)
+
+def recover_journal():
+    """Finish a session commit that crashed after its commit point, or discard one that crashed before it.
+
+    Run once when a process starts, before anything commits: it removes
+    every staged "*.commit-tmp" file, including those of a commit in flight.
+    """
+    if os.path.exists(JOURNAL_PATH):
+        with open(JOURNAL_PATH, "r", encoding="utf-8") as f:
+            _apply_journal(json.load(f), recovering=True)
+        os.remove(JOURNAL_PATH)
+        print("Recovered an interrupted session commit")
+    for directory in STAGING_DIRS:
+        if os.path.isdir(directory):
+            for filename in os.listdir(directory):
+                if filename.endswith(".commit-tmp"):
+                    os.remove(os.path.join(directory, filename))
@@ -1,111 +1,548 @@
-
-import os, string
+import os, io, ast, json, time, string, hashlib, traceback
+import numpy as np
 import pandas as pd
 from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from storage import MASTER_LOG, get_backend
 
-def consolidate_data():
-    master_rows = []
-    data_dir = "data/window_data"
+MANIFEST_PATH = "data/consolidate_manifest.json"
+# Bump when the way rows are exploded changes, so old manifests force a rebuild
+MANIFEST_VERSION = 1
+MASTER_COLUMNS = ["Date", "Category", "Subtype", "Metric", "Value", "Source"]
+# "vectorized" melts each file in one pass; "legacy" is the original per-row loop,
+# kept as the reference the vectorized output is checked against
+ENGINE = "vectorized"
+# With jobs > 1 and pool="auto", inputs at least this big go to a process pool;
+# smaller ones use threads, since starting processes would cost more than it saves
+PROCESS_POOL_MIN_BYTES = 4 * 1024 * 1024
 
-    for filename in os.listdir(data_dir):
-        if not filename.endswith(".csv") or filename == "master_log.csv":
-            continue
+# Longer cells are never parsed: literal_eval's cost (and recursion) grows with the input
+MAX_LITERAL_LENGTH = 10000
+
+def _normalize_category(category):
+    # strip trailing " A", " B", etc.
+    if len(category) >= 2 and category[-2] == " " and category[-1] in string.ascii_uppercase[:23]:
+        category = category[:-2]
+    return category
+
+@lru_cache(maxsize=4096)
+def _literal(raw):
+    if len(raw) > MAX_LITERAL_LENGTH:
+        return None
+    try:
+        return ast.literal_eval(raw)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+def parse_dict_literal(raw):
+    """Parse a dict-shaped cell such as "{'title': 'X', 'rating': 8}", or return None.
+
+    Only Python literals are accepted (no names, calls or attribute access), and
+    results are cached by the raw string since the same values repeat day after
+    day. The returned dict is shared between calls, so treat it as read-only.
+    """
+    parsed = _literal(raw)
+    return parsed if isinstance(parsed, dict) else None
+
+# --- Legacy engine ---
+
+def _wide_groups(df, filename):
+    # One group set per row, split out of the "Section - Sublabel - Key" column names
+    df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+
+    for _, row in df.iterrows():
+        date = row["Date"]
+
+        # Group related fields
+        grouped = defaultdict(lambda: defaultdict(list))
+        for col in df.columns:
+            if col == "Date":
+                continue
+            value = row[col]
+            if pd.isna(value):
+                continue
+
+            parts = col.split(" - ")
+            if len(parts) == 3:
+                category, sublabel, metric = parts
+                category = _normalize_category(category)
+                grouped[(category, sublabel)][metric].append(value)
+
+            elif len(parts) == 2:
+                category, metric = parts
+                sublabel = "General"
+                category = _normalize_category(category)
+                grouped[(category, sublabel)][metric].append(value)
+
+            else:
+                # Always store the value even if the column name doesn't match expected pattern
+                grouped[(filename.replace(".csv", ""), "General")][col].append(value)
+
+        yield date, grouped
+
+def _long_groups(df, filename):
+    # Long rows already carry Section/Sublabel/Key, so nothing is re-split.
+    # Each block of adjacent rows for a date is one wide row's worth of data.
+    blocks = (df["Date"] != df["Date"].shift()).cumsum()
+    for _, rows in df.groupby(blocks, sort=False):
+        date = pd.to_datetime(rows["Date"].iloc[0], errors="coerce")
 
-        filepath = os.path.join(data_dir, filename)
-        try:
-            df = pd.read_csv(filepath)
-            if "Date" not in df.columns:
+        grouped = defaultdict(lambda: defaultdict(list))
+        for section, sublabel, metric, value in zip(rows["Section"], rows["Sublabel"], rows["Key"], rows["Value"]):
+            category = _normalize_category(section) if section else filename.replace(".csv", "")
+            grouped[(category, sublabel or "General")][metric].append(value)
+
+        yield date, grouped
+
+def _flatten_groups(master_rows, date, grouped, filename):
+    # Flatten each group
+    for (category, sublabel), metrics in grouped.items():
+        # Try to find identifier key (title, song, person, etc.)
+        id_key = next((k for k in [
+            "title", "type", "name", "purpose", "song", "person",
+            "topic", "game", "friends", "reflection", "subject"
+        ] if k in metrics), None)
+
+        identifier = sublabel
+        if id_key:
+            # Use the first identifier value if available
+            identifier = metrics[id_key][0] if metrics[id_key] else sublabel
+
+        for metric, values in metrics.items():
+            # Skip repeating identifier metric itself
+            if metric == id_key:
                 continue
-            df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-
-            for _, row in df.iterrows():
-                date = row["Date"]
-
-                # Group related fields
-                grouped = defaultdict(lambda: defaultdict(list))
-                for col in df.columns:
-                    if col == "Date":
-                        continue
-                    value = row[col]
-                    if pd.isna(value):
-                        continue
-
-                    parts = col.split(" - ")
-                    if len(parts) == 3:
-                        category, sublabel, metric = parts
-                        # normalize category (strip trailing " A", " B", etc.)
-                        if len(category) >= 2 and category[-2] == " " and category[-1] in string.ascii_uppercase[:23]:
-                            category = category[:-2]
-                        grouped[(category, sublabel)][metric].append(value)
-
-                    elif len(parts) == 2:
-                        category, metric = parts
-                        sublabel = "General"
-                        if len(category) >= 2 and category[-2] == " " and category[-1] in string.ascii_uppercase[:23]:
-                            category = category[:-2]
-                        grouped[(category, sublabel)][metric].append(value)
-
-                    else:
-                        # Always store the value even if the column name doesn't match expected pattern
-                        grouped[(filename.replace(".csv", ""), "General")][col].append(value)
-
-                # Flatten each group
-                for (category, sublabel), metrics in grouped.items():
-                    # Try to find identifier key (title, song, person, etc.)
-                    id_key = next((k for k in [
-                        "title", "type", "name", "purpose", "song", "person",
-                        "topic", "game", "friends", "reflection", "subject"
-                    ] if k in metrics), None)
-
-                    identifier = sublabel
-                    if id_key:
-                        # Use the first identifier value if available
-                        identifier = metrics[id_key][0] if metrics[id_key] else sublabel
-
-                    for metric, values in metrics.items():
-                        # Skip repeating identifier metric itself
-                        if metric == id_key:
+
+            for value in values:
+                # Handle dict-like strings
+                if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
+                    try:
+                        parsed = parse_dict_literal(value)
+                        if isinstance(parsed, dict):
+                            id_key_inner = next((k for k in ["title", "type", "name"] if k in parsed), None)
+                            identifier_inner = parsed.get(id_key_inner, identifier) if id_key_inner else identifier
+                            for k, v in parsed.items():
+                                if k == id_key_inner:
+                                    continue
+                                master_rows.append({
+                                    "Date": date,
+                                    "Category": category,
+                                    "Subtype": identifier_inner,
+                                    "Metric": k,
+                                    "Value": v,
+                                    "Source": filename
+                                })
                             continue
+                    except Exception:
+                        pass
+
+                # Normal primitive case
+                master_rows.append({
+                    "Date": date,
+                    "Category": category,
+                    "Subtype": identifier,
+                    "Metric": metric,
+                    "Value": value,
+                    "Source": filename
+                })
+
+# --- Vectorized engine ---
+
+ID_KEYS = [
+    "title", "type", "name", "purpose", "song", "person",
+    "topic", "game", "friends", "reflection", "subject"
+]
+ID_RANK = {key: rank for rank, key in enumerate(ID_KEYS)}
+# Keys that name the Subtype of a dict-like cell
+INNER_ID_KEYS = ["title", "type", "name"]
+
+def _parse_header(col, stem):
+    # "Section - Sublabel - Key" -> (category, sublabel, metric), once per column
+    parts = col.split(" - ")
+    if len(parts) == 3:
+        return _normalize_category(parts[0]), parts[1], parts[2]
+    if len(parts) == 2:
+        return _normalize_category(parts[0]), "General", parts[1]
+    return stem, "General", col
+
+def _wide_cells(df, filename):
+    # Melt to one record per non-empty cell, in the row-major order iterrows visits them
+    stem = filename.replace(".csv", "")
+    cols = [col for col in df.columns if col != "Date"]
+    headers = [_parse_header(col, stem) for col in cols]
+    categories = np.array([h[0] for h in headers], dtype=object)
+    sublabels = np.array([h[1] for h in headers], dtype=object)
+    metrics = np.array([h[2] for h in headers], dtype=object)
+
+    values = df[cols].to_numpy(dtype=object)
+    rows, pos = np.nonzero(~pd.isna(values)) if cols else (np.array([], dtype=int),) * 2
+    dates = pd.to_datetime(df["Date"], errors="coerce")
+    return pd.DataFrame({
+        "row": rows,
+        "Date": dates.to_numpy()[rows],
+        "Category": categories[pos],
+        "Sublabel": sublabels[pos],
+        "Metric": metrics[pos],
+        "Value": values[rows, pos],
+    })
+
+def _long_cells(df, filename):
+    # Long rows are already cells; each block of adjacent rows for a date is one "row"
+    stem = filename.replace(".csv", "")
+    blocks = (df["Date"] != df["Date"].shift()).cumsum().to_numpy()
+    sections = df["Section"].fillna("").astype(str)
+    categories = sections.map({s: _normalize_category(s) if s else stem for s in sections.unique()})
+    sublabels = df["Sublabel"].fillna("").astype(str)
+    return pd.DataFrame({
+        "row": blocks,
+        "Date": pd.to_datetime(df["Date"], errors="coerce").to_numpy(),
+        "Category": categories.to_numpy(dtype=object),
+        "Sublabel": sublabels.where(sublabels != "", "General").to_numpy(dtype=object),
+        "Metric": df["Key"].to_numpy(dtype=object),
+        "Value": df["Value"].to_numpy(dtype=object),
+    })
+
+def _master_frame(master_rows):
+    # Object columns so a file's values keep their own types (7 stays 7, not 7.0)
+    # the way they did when all files went into one frame together
+    frame = pd.DataFrame(master_rows, columns=MASTER_COLUMNS, dtype=object)
+    frame["Date"] = pd.to_datetime(frame["Date"])
+    return frame
+
+def _expand_dicts(out, filename):
+    # Dict-like string values become one row per inner key, in place of the original row
+    values = out["Value"].to_numpy(dtype=object)
+    candidates = [i for i, value in enumerate(values)
+                  if isinstance(value, str) and value.startswith("{") and value.endswith("}")]
+    if not candidates:
+        return out
+
+    dates, categories, subtypes = (out[col].to_numpy(dtype=object) for col in ("Date", "Category", "Subtype"))
+    expanded = []
+    positions = []
+    replaced = []
+    for i in candidates:
+        parsed = parse_dict_literal(values[i])
+        if parsed is None:
+            continue
+        date, category, subtype = dates[i], categories[i], subtypes[i]
+        id_key_inner = next((k for k in INNER_ID_KEYS if k in parsed), None)
+        identifier = parsed.get(id_key_inner, subtype) if id_key_inner else subtype
+        for k, v in parsed.items():
+            if k != id_key_inner:
+                expanded.append({"Date": date, "Category": category, "Subtype": identifier, "Metric": k, "Value": v, "Source": filename})
+                positions.append(i)
+        replaced.append(i)
+    if not replaced:
+        return out
+
+    # Splice by sorting on the original position; expanded rows sort right where theirs was
+    kept = np.setdiff1d(np.arange(len(out)), replaced)
+    merged = pd.concat([out.iloc[kept], _master_frame(expanded)], ignore_index=True)
+    order = np.argsort(np.concatenate([kept, positions]), kind="stable")
+    return merged.iloc[order].reset_index(drop=True)
+
+def _explode_cells(cells, filename):
+    if cells.empty:
+        return pd.DataFrame(columns=MASTER_COLUMNS)
+
+    # Groups are (row, category, sublabel); within one, metrics keep first-seen
+    # order and each metric's values keep column order, like the nested defaultdict
+    group = cells.groupby(["row", "Category", "Sublabel"], sort=False).ngroup().to_numpy()
+    member = cells.groupby(["row", "Category", "Sublabel", "Metric"], sort=False).ngroup().to_numpy()
+    order = np.lexsort((np.arange(len(cells)), member, group))
+    cells = cells.iloc[order].reset_index(drop=True)
+    group = group[order]
+
+    # Identifier: first value of the highest-priority id key present in the group
+    rank = cells["Metric"].map(ID_RANK)
+    is_id = (rank == rank.groupby(group).transform("min")).to_numpy()
+    identifiers = cells["Value"][is_id].groupby(group[is_id]).first()
+    subtype = pd.Series(group).map(identifiers).to_numpy(dtype=object)
+    has_id = np.isin(group, identifiers.index.to_numpy())
+    subtype = np.where(has_id, subtype, cells["Sublabel"].to_numpy(dtype=object))
+
+    keep = ~is_id
+    out = pd.DataFrame({
+        "Date": cells["Date"].to_numpy()[keep],
+        "Category": cells["Category"].to_numpy(dtype=object)[keep],
+        "Subtype": subtype[keep],
+        "Metric": cells["Metric"].to_numpy(dtype=object)[keep],
+        "Value": cells["Value"].to_numpy(dtype=object)[keep],
+        "Source": filename,
+    }, columns=MASTER_COLUMNS)
+    return _expand_dicts(out, filename)
+
+def explode_frame(df, filename, layout="wide", engine=None):
+    """Turn one category frame into master log rows (a DataFrame with MASTER_COLUMNS)."""
+    if (engine or ENGINE) == "legacy":
+        master_rows = []
+        groups = _long_groups(df.copy(), filename) if layout == "long" else _wide_groups(df.copy(), filename)
+        for date, grouped in groups:
+            _flatten_groups(master_rows, date, grouped, filename)
+        return _master_frame(master_rows)
+
+    cells = _long_cells(df, filename) if layout == "long" else _wide_cells(df, filename)
+    return _explode_cells(cells, filename)
+
+def _concat_master(frames):
+    frames = [frame for frame in frames if not frame.empty]
+    if not frames:
+        return pd.DataFrame(columns=MASTER_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
+
+# --- Change manifest ---
+
+def _date_keys(dates):
+    # The date as it is written to the master log ("" when it doesn't parse)
+    return pd.to_datetime(dates, errors="coerce").dt.strftime("%Y-%m-%d").fillna("")
+
+def _date_hashes(df):
+    # Hash every date's non-empty cells together with their column dtype,
+    # since the dtype decides how a value ends up in the master log
+    keys = _date_keys(df["Date"])
+    cols = [col for col in df.columns if col != "Date"]
+    labels = [f"{col}\x1f{df[col].dtype}\x1f" for col in cols]
+    hashes = {}
+    for key, row in zip(keys, df[cols].to_numpy(dtype=object)):
+        digest = hashes.setdefault(key, hashlib.sha1())
+        for label, value in zip(labels, row):
+            if not pd.isna(value):
+                digest.update(f"{label}{value!r}\x1e".encode("utf-8"))
+        digest.update(b"\x1d")
+    return keys, {key: digest.hexdigest() for key, digest in hashes.items()}
+
+def _load_manifest(backend):
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("backend") != _backend_key(backend):
+        return None
+    return manifest
+
+def _save_manifest(manifest):
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, MANIFEST_PATH)
+
+def _backend_key(backend):
+    return f"{type(backend).__name__}:{backend.layout}"
+
+def _master_text(new_rows):
+    # New rows formatted exactly as to_csv would write them, read back as text
+    buffer = io.StringIO()
+    new_rows.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer, dtype=str, keep_default_na=False)
+
+def _sort_master(master_df, names):
+    # Date, then the category files in backend order, keeping each file's own
+    # row order: the order a full rebuild concatenates in, so an incremental
+    # update lands every re-exploded block exactly where a full rebuild puts it
+    rank = master_df["Source"].map({f"{name}.csv": i for i, name in enumerate(names)}).fillna(len(names))
+    master_df = master_df.iloc[np.argsort(rank.to_numpy(), kind="stable")]
+    return master_df.sort_values("Date", kind="stable")
+
+def _update_master(backend, new_rows, replaced, names):
+    # Swap out the master log rows of every re-exploded (source, date) and keep the rest
+    master_df = pd.read_csv(MASTER_LOG, dtype=str, keep_default_na=False)
+    stale = pd.Series(False, index=master_df.index)
+    for filename, dates in replaced.items():
+        from_file = master_df["Source"] == filename
+        stale |= from_file if dates is None else from_file & master_df["Date"].isin(dates)
+
+    master_df = pd.concat([master_df[~stale], _master_text(new_rows)], ignore_index=True)
+    master_df["Date"] = pd.to_datetime(master_df["Date"].mask(master_df["Date"] == ""), errors="coerce")
+    backend.write_master(_sort_master(master_df, names))
+    return int(stale.sum())
+
+# --- Per-file jobs ---
+
+def _consolidate_file(backend, name, entry, dates=None):
+    """Explode one category file (only its changed dates when `entry` is its old manifest entry).
+
+    dates, with an entry, are the only dates that may have changed: just
+    those are re-hashed, and the file is neither stat'ed nor hashed whole.
+    Runs in a worker, so everything it produces comes back in the report dict:
+    status, the new manifest entry, the dates it replaces, its rows and timing.
+    """
+    filename = f"{name}.csv"
+    report = {"filename": filename, "status": "unchanged", "entry": None, "dirty": None,
+              "frame": None, "rows": 0, "seconds": 0.0, "error": None}
+    start = time.perf_counter()
+    try:
+        restricted = entry is not None and dates is not None
+        if restricted:
+            # No state or whole-file hash is recorded, so the next run
+            # without dates re-verifies every date of this file
+            state = content_hash = None
+        else:
+            state = backend.file_state(name)
+            if entry and state is not None and entry["state"] == state:
+                report["entry"] = entry
+                return report
+            content_hash = backend.content_hash(name)
+            if entry and entry["sha256"] == content_hash:
+                report["entry"] = dict(entry, state=state)
+                return report
+
+        df = backend.read_frame(name)
+        if "Date" not in df.columns:
+            report["status"] = "skipped"
+            return report
+
+        # Only dates whose rows changed (or disappeared) get re-exploded
+        if restricted:
+            df = df[_date_keys(df["Date"]).isin(dates).to_numpy()].copy()
+            keys, fresh = _date_hashes(df)
+            date_hashes = {key: digest for key, digest in entry["dates"].items() if key not in dates}
+            date_hashes.update(fresh)
+            dirty = {key for key in dates if entry["dates"].get(key) != fresh.get(key)}
+            df = df[keys.isin(dirty).to_numpy()].copy()
+            report.update(status="updated" if dirty else "unchanged", dirty=dirty)
+        elif entry:
+            keys, date_hashes = _date_hashes(df)
+            old_dates = entry["dates"]
+            dirty = {key for key, digest in date_hashes.items() if old_dates.get(key) != digest}
+            dirty |= set(old_dates) - set(date_hashes)
+            df = df[keys.isin(dirty).to_numpy()].copy()
+            report.update(status="updated" if dirty else "unchanged", dirty=dirty)
+        else:
+            keys, date_hashes = _date_hashes(df)
+            report["status"] = "rebuilt"
+
+        report["frame"] = explode_frame(df, filename, backend.layout)
+        report["rows"] = len(report["frame"])
+        report["entry"] = {"state": state, "sha256": content_hash, "dates": date_hashes}
+    except Exception as e:
+        report.update(status="failed", error=f"{type(e).__name__}: {e}", traceback=traceback.format_exc())
+    finally:
+        report["seconds"] = time.perf_counter() - start
+    return report
+
+def _choose_pool(backend, names):
+    total = 0
+    for name in names:
+        state = backend.file_state(name)
+        total += state[1] if state else 0
+    return "process" if total >= PROCESS_POOL_MIN_BYTES else "thread"
+
+def _run_jobs(backend, names, old_files, jobs, pool, progress=None, dates=None, cancelled=None):
+    # None if cancelled() turned true between files
+    cancelled = cancelled or (lambda: False)
+    entries = [old_files.get(f"{name}.csv") for name in names]
+    dates = [dates[name] for name in names] if dates is not None else [None] * len(names)
+    progress = progress or (lambda stage, done, total: None)
+    progress("consolidate", 0, len(names))
+    if jobs <= 1 or len(names) <= 1:
+        reports = []
+        for name, entry, days in zip(names, entries, dates):
+            if cancelled():
+                return None
+            reports.append(_consolidate_file(backend, name, entry, days))
+            progress("consolidate", len(reports), len(names))
+        return reports
+
+    if pool == "auto":
+        pool = _choose_pool(backend, names)
+    executor_class = ProcessPoolExecutor if pool == "process" else ThreadPoolExecutor
+    with executor_class(max_workers=jobs) as executor:
+        futures = [executor.submit(_consolidate_file, backend, name, entry, days)
+                   for name, entry, days in zip(names, entries, dates)]
+        reports = []
+        # Collected in category order, so the merged master log never depends on scheduling
+        for name, future in zip(names, futures):
+            if cancelled():
+                # Jobs not started are dropped; the running ones are waited for on exit
+                for pending in futures:
+                    pending.cancel()
+                return None
+            try:
+                reports.append(future.result())
+            except Exception as e:
+                # The worker itself died (or the job couldn't be sent to it)
+                reports.append({"filename": f"{name}.csv", "status": "failed", "entry": None, "dirty": None,
+                                "frame": None, "rows": 0, "seconds": 0.0, "error": f"{type(e).__name__}: {e}",
+                                "traceback": traceback.format_exc()})
+            progress("consolidate", len(reports), len(names))
+    return reports
+
+def _print_reports(reports, seconds):
+    for report in reports:
+        print(f"  {report['filename']:<24} {report['status']:<9} {report['rows']:>6} rows  {report['seconds'] * 1000:8.1f} ms")
+    for report in reports:
+        if report["error"]:
+            print(f"Error consolidating {report['filename']}: {report['error']}")
+            print(report["traceback"].rstrip())
+    failed = sum(report["status"] == "failed" for report in reports)
+    print(f"Consolidated {len(reports)} file(s) in {seconds:.2f}s" + (f", {failed} failed" if failed else ""))
+
+def consolidate_data(backend=None, full=False, jobs=1, pool="auto", progress=None, changed=None, cancelled=None):
+    """Build data/master_log.csv from every category, incrementally when a manifest allows.
+
+    jobs > 1 fans the category files out to a worker pool: pool="process",
+    "thread", or "auto" (processes only for big inputs). progress, if given,
+    is called as progress("consolidate", files_done, files_total). changed,
+    the (category, date) keys a GUI session wrote, limits an incremental run
+    to those files and dates; edits made elsewhere wait for a run without it.
+    cancelled() is polled between files; once it is true nothing is merged or
+    written and None is returned. Otherwise returns one report dict per file
+    with its status, row count, timing and any error.
+    """
+    backend = backend or get_backend()
+    started = time.perf_counter()
+
+    # Incremental unless asked for a full rebuild or there is nothing to build on
+    manifest = None if full else _load_manifest(backend)
+    if manifest is not None and not os.path.isfile(MASTER_LOG):
+        manifest = None
+    old_files = manifest["files"] if manifest else {}
+
+    names = order = backend.categories()
+    dates = None
+    if manifest is not None and changed is not None:
+        dates = {}
+        for name, day in changed:
+            dates.setdefault(name, set()).add(str(day))
+        names = [name for name in names if name in dates]
+    reports = _run_jobs(backend, names, old_files, jobs, pool, progress, dates, cancelled)
+    if reports is None:
+        print("Consolidation cancelled; the master log and manifest are unchanged")
+        return None
+
+    # Files outside `changed` keep their entries untouched
+    files = dict(old_files) if dates is not None else {}
+    replaced = {}
+    failed = set()
+    for report in reports:
+        filename = report["filename"]
+        if report["status"] == "failed":
+            failed.add(filename)
+            files.pop(filename, None)
+        elif report["entry"] is not None:
+            files[filename] = report["entry"]
+            if report["status"] != "unchanged":
+                replaced[filename] = report["dirty"]
+
+    master_df = _concat_master([report["frame"] for report in reports if report["frame"] is not None])
+    _print_reports(reports, time.perf_counter() - started)
+    if manifest is None:
+        backend.write_master(_sort_master(master_df, order))
+        print("Master log saved to data/master_log.csv")
+    else:
+        # Categories that no longer exist lose their rows too
+        for filename in set(old_files) - set(files) - failed:
+            if filename not in replaced:
+                replaced[filename] = None
+        if replaced:
+            removed = _update_master(backend, master_df, replaced, order)
+            print(f"Master log updated: {removed} rows replaced by {len(master_df)} from {len(replaced)} changed file(s)")
+        else:
+            print("Master log is up to date")
 
-                        for value in values:
-                            # Handle dict-like strings
-                            if isinstance(value, str) and value.startswith("{") and value.endswith("}"):
-                                try:
-                                    parsed = eval(value)
-                                    if isinstance(parsed, dict):
-                                        id_key_inner = next((k for k in ["title", "type", "name"] if k in parsed), None)
-                                        identifier_inner = parsed.get(id_key_inner, identifier) if id_key_inner else identifier
-                                        for k, v in parsed.items():
-                                            if k == id_key_inner:
-                                                continue
-                                            master_rows.append({
-                                                "Date": date,
-                                                "Category": category,
-                                                "Subtype": identifier_inner,
-                                                "Metric": k,
-                                                "Value": v,
-                                                "Source": filename
-                                            })
-                                        continue
-                                except Exception:
-                                    pass
-
-                            # Normal primitive case
-                            master_rows.append({
-                                "Date": date,
-                                "Category": category,
-                                "Subtype": identifier,
-                                "Metric": metric,
-                                "Value": value,
-                                "Source": filename
-                            })
-
-        except Exception as e:
-            print(f"Error consolidating {filename}: {e}")
-
-    master_df = pd.DataFrame(master_rows)
-    master_df.sort_values("Date", inplace=True)
-    master_df.to_csv(os.path.join("data", "master_log.csv"), index=False)
-    print("Master log saved to data/master_log.csv")
-
-    
\ No newline at end of file
+    _save_manifest({"version": MANIFEST_VERSION, "backend": _backend_key(backend), "files": files})
+    return reports
@@ -0,0 +1,90 @@
+import os, json
+
+DRAFTS_PATH = "data/drafts.journal"
+
+class DraftJournal:
+    """What the open windows hold before it is committed, as an append-only JSON-lines journal.
+
+    Each line is {"window": key, "fields": flat row} (the latest line per key
+    wins), {"window": key, "fields": null} once the window is closed without
+    submitting, or the same with "submitted": true when its entry is handed to
+    the session. Lines are flushed, not fsynced: a crash of the app keeps
+    everything up to the last save, a power cut may lose the last few.
+    load() replays the journal at startup; compact() rewrites it with one line
+    per draft still to restore once the session's commit has landed.
+    """
+
+    def __init__(self, path=DRAFTS_PATH):
+        self.path = path
+        self.file = None
+        # key -> flat row; submitted keys are kept until the commit lands
+        self.drafts = {}
+        self.submitted = set()
+
+    def load(self):
+        """Replay the journal; returns {key: flat row} for every window left with a draft."""
+        self.drafts, self.submitted = {}, set()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        key, fields = record["window"], record["fields"]
+                    except (ValueError, KeyError, TypeError):
+                        # A line torn by the crash ends the journal
+                        break
+                    if fields is None:
+                        self.drafts.pop(key, None)
+                    else:
+                        self.drafts[key] = fields
+        except FileNotFoundError:
+            return {}
+        # A submitted draft whose session never committed is restored like any other,
+        # and rewriting now drops a torn tail before anything is appended after it
+        self.compact()
+        return dict(self.drafts)
+
+    def draft(self, key):
+        return self.drafts.get(key)
+
+    def save(self, key, fields, submitted=False):
+        if fields == self.drafts.get(key) and not submitted:
+            return
+        self.drafts[key] = fields
+        record = {"window": key, "fields": fields}
+        if submitted:
+            self.submitted.add(key)
+            record["submitted"] = True
+        self._append(record)
+
+    def discard(self, key):
+        if self.drafts.pop(key, None) is not None:
+            self.submitted.discard(key)
+            self._append({"window": key, "fields": None})
+
+    def _append(self, record):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.file = open(self.path, "a", encoding="utf-8")
+        self.file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.file.flush()
+
+    def compact(self):
+        """Forget submitted drafts (call once their commit has landed) and rewrite the journal with the rest."""
+        for key in self.submitted:
+            self.drafts.pop(key, None)
+        self.submitted = set()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        if not self.drafts:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for key, fields in self.drafts.items():
+                f.write(json.dumps({"window": key, "fields": fields}, separators=(",", ":")) + "\n")
+        os.replace(tmp_path, self.path)
+
+DRAFTS = DraftJournal()
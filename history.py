@@ -0,0 +1,200 @@
+import re, threading
+from datetime import date
+
+# Ranking: every day a value was entered on adds 2 ** ((day - EPOCH) / HALF_LIFE_DAYS)
+# to its score, i.e. a frequency in which a day HALF_LIFE_DAYS older counts half
+HALF_LIFE_DAYS = 30
+EPOCH = date(2020, 1, 1).toordinal()
+SUGGESTIONS = 8
+# Trie levels; longer prefixes filter the few keys bucketed at the deepest node
+TRIE_DEPTH = 12
+
+class PrefixIndex:
+    """Case-insensitive prefix trie over one field's past values, ranked by score.
+
+    Each node caches its best SUGGESTIONS keys in score order. Scores only
+    ever grow, so add() keeps those lists exact by re-offering the key to the
+    nodes on its own path, and a lookup is a walk of len(prefix) nodes.
+    """
+
+    def __init__(self, limit=SUGGESTIONS, depth=TRIE_DEPTH):
+        self.limit = limit
+        self.depth = depth
+        # key -> [display text (latest spelling), score, latest day]
+        self.values = {}
+        # (key, day) pairs already counted, so re-reading or resubmitting a day is a no-op
+        self.seen = set()
+        # node: [children by character, top keys, keys at or below the deepest level]
+        self.root = [{}, [], None]
+
+    def __len__(self):
+        return len(self.values)
+
+    def add(self, value, day):
+        text = str(value).strip()
+        if not text or text == "N/A":
+            return
+        key = text.casefold()
+        day = str(day)
+        if (key, day) in self.seen:
+            return
+        try:
+            weight = 2 ** ((date.fromisoformat(day).toordinal() - EPOCH) / HALF_LIFE_DAYS)
+        except ValueError:
+            return
+        self.seen.add((key, day))
+
+        entry = self.values.get(key)
+        if entry is None:
+            entry = self.values[key] = [text, 0.0, day]
+        entry[1] += weight
+        if day >= entry[2]:
+            entry[0], entry[2] = text, day
+
+        node = self.root
+        self._offer(node, key, entry[1])
+        for ch in key[:self.depth]:
+            node = node[0].setdefault(ch, [{}, [], None])
+            self._offer(node, key, entry[1])
+        if len(key) > self.depth:
+            if node[2] is None:
+                node[2] = set()
+            node[2].add(key)
+
+    def _offer(self, node, key, score):
+        top = node[1]
+        if key in top:
+            top.remove(key)
+        i = 0
+        while i < len(top) and self.values[top[i]][1] >= score:
+            i += 1
+        if i < self.limit:
+            top.insert(i, key)
+            del top[self.limit:]
+
+    def suggest(self, prefix, limit=None):
+        """Best completions of prefix, highest score first; the prefix itself is left out."""
+        key = prefix.strip().casefold()
+        node = self.root
+        for ch in key[:self.depth]:
+            node = node[0].get(ch)
+            if node is None:
+                return []
+        if len(key) <= self.depth:
+            keys = node[1]
+        else:
+            keys = sorted((k for k in node[2] or () if k.startswith(key)), key=lambda k: -self.values[k][1])
+        return [self.values[k][0] for k in keys if k != key][:limit or self.limit]
+
+class History:
+    """Past entries the windows draw on, shared by every window of the process.
+
+    The GUI hands use() a factory for storage backends; each background read
+    opens its own and closes it when done. A category's history is read the
+    first time one of its windows opens, and submits are added as they
+    happen, so neither autocomplete nor prefill re-reads a category file after
+    that.
+    """
+
+    def __init__(self):
+        self.backend = None
+        self.lock = threading.Lock()
+        self.indexes = {}
+        self.loading = {}
+        # category -> its most recent flat row ("Section - Sublabel - Key" columns)
+        self.latest_rows = {}
+        self.latest_loading = {}
+
+    def use(self, backend):
+        self.backend = backend
+
+    def _start(self, loading, category, target, *args):
+        # Caller holds the lock; one daemon thread per category and kind of load
+        if category in loading or self.backend is None:
+            return None
+        thread = threading.Thread(target=target, args=(category,) + args, name=f"history-{category}", daemon=True)
+        loading[category] = thread
+        thread.start()
+        return thread
+
+    def load(self, category, fields):
+        """Fill the indexes of fields ({field id: column regex}) from category's history, in a daemon thread.
+
+        Returns the thread, or None if it was already loaded (or no backend is attached).
+        """
+        with self.lock:
+            for field_id in fields:
+                self.indexes.setdefault(field_id, PrefixIndex())
+            return self._start(self.loading, category, self._load, fields)
+
+    def _read(self, loading, category, label, read):
+        # A failed read is forgotten, so the category's next window retries it
+        backend = None
+        try:
+            backend = self.backend()
+            return True, read(backend)
+        except Exception as e:
+            print(f"{label} unavailable: {type(e).__name__}: {e}")
+            with self.lock:
+                loading.pop(category, None)
+            return False, None
+        finally:
+            close = getattr(backend, "close", None)
+            if close is not None:
+                close()
+
+    def _load(self, category, fields):
+        ok, rows = self._read(self.loading, category, f"History for {category}", lambda backend: backend.rows(category))
+        if not ok:
+            return
+        patterns = [(field_id, re.compile(pattern)) for field_id, pattern in fields.items()]
+        columns = {}
+        for row in rows:
+            day = row.get("Date")
+            hits = []
+            for col, value in row.items():
+                if col not in columns:
+                    columns[col] = next((field_id for field_id, pattern in patterns if pattern.match(col)), None)
+                if columns[col] is not None and value not in (None, ""):
+                    hits.append((columns[col], value))
+            # One short lock per row keeps keystroke lookups responsive during the load
+            with self.lock:
+                for field_id, value in hits:
+                    self.indexes[field_id].add(value, day)
+
+    def load_latest(self, category):
+        """Fetch category's most recent row in a daemon thread, unless it is already cached or on its way."""
+        with self.lock:
+            if category in self.latest_rows:
+                return None
+            return self._start(self.latest_loading, category, self._load_latest)
+
+    def _load_latest(self, category):
+        ok, row = self._read(self.latest_loading, category, f"Latest {category} entry", lambda backend: backend.latest_row(category))
+        if ok and row is not None:
+            self.remember(category, row)
+
+    def record(self, day, values):
+        """Add a submitted day's (field id, value) pairs."""
+        with self.lock:
+            for field_id, value in values:
+                self.indexes.setdefault(field_id, PrefixIndex()).add(value, day)
+
+    def remember(self, category, row):
+        """Keep row as category's latest entry unless a later day is already cached."""
+        with self.lock:
+            current = self.latest_rows.get(category)
+            if current is None or str(row["Date"]) >= str(current["Date"]):
+                self.latest_rows[category] = dict(row)
+
+    def suggest(self, field_id, prefix):
+        with self.lock:
+            index = self.indexes.get(field_id)
+            return index.suggest(prefix) if index is not None else []
+
+    def latest(self, category):
+        """category's most recent row, or None if it has none (or it is still loading)."""
+        with self.lock:
+            return self.latest_rows.get(category)
+
+HISTORY = History()
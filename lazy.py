@@ -0,0 +1,39 @@
+import importlib, threading
+
+class LazyModule:
+    """Stands in for a module and imports it on first attribute access.
+
+    Lets the GUI start with only tkinter loaded: `storage = LazyModule("storage")`
+    reads like the plain import everywhere it is used.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def load(self):
+        # The import system's own per-module lock makes a race with warm() safe
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<LazyModule {self._name!r} ({state})>"
+
+def warm(*modules):
+    """Import the lazy modules in a background thread; returns the (daemon) thread."""
+    def run():
+        for module in modules:
+            try:
+                module.load()
+            except Exception:
+                # Raised again, where it can be handled, on first real use
+                pass
+
+    thread = threading.Thread(target=run, name="warm-imports", daemon=True)
+    thread.start()
+    return thread
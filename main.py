@@ -1,41 +1,30 @@
-
-from collections import defaultdict
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.colors as mcolors
-from matplotlib.backends.backend_pdf import PdfPages
 import tkinter as tk
-import csv
-from datetime import date, timedelta
-from tkcalendar import DateEntry
-import os, string
-
-# Import all your window classes here
-from windows.work_day_window import WorkDayWindow
-from windows.cooking_window import CookingWindow
-from windows.workouts_window import WorkoutsWindow
-from windows.learning_window import LearningWindow
-from windows.driving_window import DrivingWindow
-from windows.leetcode_window import LeetcodeWindow
-from windows.coding_projects_window import CodingProjectsWindow
-from windows.career_prep_window import CareerPrepWindow
-from windows.sleep_window import SleepWindow
-from windows.meditating_window import MeditatingWindow
-from windows.music_window import MusicWindow
-from windows.gaming_window import GamingWindow
-from windows.texting_calling_window import TextingCallingWindow
-from windows.socializing_window import SocializingWindow
-from windows.eating_window import EatingWindow
-from windows.media_window import MediaWindow
-from windows.miscellaneous_window import MiscellaneousWindow
-from windows.dummy_window import DummyWindow
+from tkinter import ttk, messagebox
+from lazy import LazyModule, warm
+from commit_journal import recover_journal
+from drafts import DRAFTS
+from history import HISTORY
+from pipeline import PIPELINE_LOG, BackgroundRebuild
+from registry import default_registry
+
+# The data stack (pandas, numpy) is only needed once a window submits, so the
+# selector draws with just tkinter loaded; warm() imports it after first paint
+storage = LazyModule("storage")
+
+# Progress panel labels for the stages tracker.rebuild reports
+PIPELINE_STAGES = {"consolidate": "Consolidating files", "reports": "Rendering reports"}
 
 class CategorySelector:
     def __init__(self, root):
         self.root = root
         self.root.title("Daily Health Tracker")
         self.open_windows = 0
+        self.backend = None
+        self._writer = None
+        self.pipeline = None
+        self.cancelling = False
+        # Autocomplete and prefill history is read off the GUI thread, through backends of its own
+        HISTORY.use(lambda: storage.get_backend())
 
         # Center window and set to half screen
         screen_width = root.winfo_screenwidth()
@@ -50,34 +39,24 @@ class CategorySelector:
         header_font = ("Helvetica", 18, "bold") 
         checkbox_font = ("Helvetica", 14)
 
-        # Map all categories to their window classes
-        self.category_windows = {
-            "Work Day": WorkDayWindow,
-            "Cooking": CookingWindow,
-            "Workouts": WorkoutsWindow,
-            "Learning": LearningWindow,
-            "Driving": DrivingWindow,
-            "Leetcode": LeetcodeWindow,
-            "Coding Projects": CodingProjectsWindow,
-            "Career Prep": CareerPrepWindow,
-            "Miscellaneous": MiscellaneousWindow,
-            "Sleep": SleepWindow,
-            "Meditating": MeditatingWindow,
-            "Music": MusicWindow,
-            "Gaming": GamingWindow,
-            "Messaging/Calling": TextingCallingWindow,
-            "Socializing": SocializingWindow,
-            "Eating": EatingWindow,
-            "Media": MediaWindow
-        }
+        # Category name -> window class, each imported only when first launched
+        self.registry = default_registry()
 
         # Split into breakdown and rebuild categories
-        self.breakdown = [key for key in list(self.category_windows)[:9]]
-        self.rebuild = [key for key in list(self.category_windows)[9:]]
+        self.breakdown = self.registry.names("breakdown")
+        self.rebuild = self.registry.names("rebuild")
 
         self.vars = {}
         self.selected = []
 
+        # Drafts a crash left in the journal; their categories start out checked and reopen filled in
+        self.drafts = DRAFTS.load()
+        for name in [name for name in self.drafts if name not in self.registry]:
+            DRAFTS.discard(name)
+            del self.drafts[name]
+        if self.drafts:
+            print("Restoring unsaved drafts:", ", ".join(self.drafts))
+
         # Layout frames
         breakdown_frame = tk.LabelFrame(root, text="BREAKDOWN", font=header_font, padx=10, pady=10)
         rebuild_frame = tk.LabelFrame(root, text="REBUILD", font=header_font, padx=10, pady=10)
@@ -86,13 +65,13 @@ class CategorySelector:
 
         # Add checkboxes
         for category in self.breakdown:
-            var = tk.BooleanVar()
+            var = tk.BooleanVar(value=category in self.drafts)
             chk = tk.Checkbutton(breakdown_frame, text=category, variable=var, font=checkbox_font, anchor="w")
             chk.pack(fill="x", padx=5, pady=2)
             self.vars[category] = var
 
         for category in self.rebuild:
-            var = tk.BooleanVar()
+            var = tk.BooleanVar(value=category in self.drafts)
             chk = tk.Checkbutton(rebuild_frame, text=category, variable=var, font=checkbox_font, anchor="w")
             chk.pack(fill="x", padx=5, pady=2)
             self.vars[category] = var
@@ -113,6 +92,14 @@ class CategorySelector:
             command=self.submit)
         submit_btn.pack(pady=30)
 
+    @property
+    def writer(self):
+        # Opened on first use, by which time warm() has usually imported storage
+        if self._writer is None:
+            self.backend = storage.get_backend()
+            self._writer = storage.SessionWriter(self.backend)
+        return self._writer
+
     def submit(self):
         self.selected = [name for name, var in self.vars.items() if var.get()]
         print("Selected categories:", self.selected)
@@ -122,89 +109,142 @@ class CategorySelector:
 
     def launch_selected_windows(self):
         for name in self.selected:
-            window_class = self.category_windows.get(name)
+            try:
+                window_class = self.registry.load(name)
+            except Exception as e:
+                messagebox.showerror("Window failed to load", f"{name}: {type(e).__name__}: {e}")
+                continue
             if window_class:
                 self.open_windows += 1
-                window_class(tk.Toplevel(), self.handle_data)
+                top = tk.Toplevel()
+                window = window_class(top, self.handle_data)
+                top.protocol("WM_DELETE_WINDOW", lambda top=top, window=window: self.window_closed(top, window))
+                # Form windows journal their fields under the category name (plugins may not)
+                if hasattr(window, "keep_drafts"):
+                    window.keep_drafts(name)
+
+    def window_closed(self, top, window):
+        # A window closed without submitting still counts towards finishing the session
+        if hasattr(window, "discard_draft"):
+            window.discard_draft()
+        top.destroy()
+        self.open_windows -= 1
+        self.finish_if_done()
 
     def handle_data(self, name, data):
         print(f"{name} returned:", data)
         self.open_windows -= 1
         print(f"Remaining open windows: {self.open_windows}")
     
-        # Step 1: Get selected date from data (or default to today)
-        selected_date = data.get("Date", date.today().isoformat())
-    
-        # Step 2: Flatten nested data
-        flat_data = {"Date": data.get("Date", date.today().isoformat())}
-        
-        for section, values in data.items():
-            if section == "Date":
-                continue
-            if isinstance(values, dict):
-                for sublabel, subvalues in values.items():
-                    if isinstance(subvalues, dict):
-                        for key, value in subvalues.items():
-                            flat_data[f"{section} - {sublabel} - {key}"] = value
-                    else:
-                        flat_data[f"{section} - {sublabel}"] = subvalues
-            else:
-                flat_data[section] = values
-    
-        # Step 3: Prepare CSV file
-        filename = os.path.join("data/window_data", f"{name}.csv")
-        rows = []
+        # Step 1: Flatten nested data
+        flat_data = storage.flatten_data(data)
     
-        # Step 4: Load existing data if file exists
-        if os.path.isfile(filename):
-            with open(filename, "r", newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                existing_fieldnames = reader.fieldnames or []
-                new_fieldnames = list(flat_data.keys())
-                fieldnames = list(dict.fromkeys(existing_fieldnames + new_fieldnames))
-                for row in reader:
-                    rows.append(row)
-        else:
-            fieldnames = flat_data.keys()
-    
-        # Step 5: Replace row if date matches, else append
-        updated = False
-        for i, row in enumerate(rows):
-            if row.get("Date") == selected_date:
-                rows[i] = flat_data
-                updated = True
-                break
-        if not updated:
-            rows.append(flat_data)
-    
-        # Step 6: Write updated data back to file
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+        # Step 2: Queue the day for the writer thread; the whole session is written in one commit
+        self.writer.add(name, flat_data)
+        # Keep the cached latest entry current without re-reading the file
+        HISTORY.remember(name, flat_data)
     
-        # Step 7: Exit if all windows are closed
+        # Step 3: Exit if all windows are closed
+        self.finish_if_done()
+
+    def finish_if_done(self):
         if self.open_windows == 0:
-            print("All windows closed. Consolidating Data into one .csv file...")
-            function_caller()
+            # The writer drains its queue and commits; consolidation waits for it
+            self.writer.close()
+            self.root.after(50, self.wait_for_writer)
+
+    def wait_for_writer(self):
+        # Checked before draining, so a notice posted as the thread ends is still shown
+        finished = self.writer.done()
+        for kind, detail in self.writer.events():
+            if kind == "failed":
+                messagebox.showerror("Saving failed", f"This session's entries could not be saved.\n\n{detail}")
+        if not finished:
+            self.root.after(50, self.wait_for_writer)
+            return
+        if self.writer.error is not None:
+            # The drafts stay in the journal and reopen on the next start
             self.root.quit()
+            return
+        DRAFTS.compact()
 
-from consolidate import consolidate_data
-from visualize import visualize_reports
-
-def function_caller():
-    # Generate master_log.csv
-    consolidate_data()
-    
-    # Get data as dataframe object
-    master_df = pd.read_csv("data/master_log.csv")
-    master_df["Date"] = pd.to_datetime(master_df["Date"], errors="coerce")
-    
-    # Call visualization generator functions
-    visualize_reports(master_df)
+        changed = self.writer.changed
+        if changed is not None and not changed:
+            print("Nothing was submitted; skipping consolidation and reports.")
+            self.root.quit()
+            return
+        if changed:
+            print("Changed:", ", ".join(f"{name} {day}" for name, day in sorted(changed)))
+        print("All windows closed. Consolidating data and rendering reports in the background...")
+        # Consolidation and rendering run in a child process; the UI stays responsive
+        self.pipeline = BackgroundRebuild(self.backend.name, changed=changed)
+        self.show_progress()
+
+    def show_progress(self):
+        # The selector window turns into the pipeline's progress panel
+        for widget in self.root.pack_slaves():
+            widget.destroy()
+        self.root.title("Daily Health Tracker — Processing")
+
+        panel = tk.Frame(self.root, padx=30, pady=30)
+        panel.pack(expand=True)
+        self.status_label = tk.Label(panel, text="Starting...", font=("Helvetica", 14))
+        self.status_label.pack(pady=10)
+        self.progress_bar = ttk.Progressbar(panel, length=400, mode="determinate")
+        self.progress_bar.pack(pady=10)
+
+        buttons = tk.Frame(panel)
+        buttons.pack(pady=10)
+        self.cancel_btn = tk.Button(buttons, text="Cancel", font=("Helvetica", 12), command=self.cancel_pipeline)
+        self.cancel_btn.pack(side="left", padx=10)
+        self.background_btn = tk.Button(buttons, text="Finish in background", font=("Helvetica", 12), command=self.finish_in_background)
+        self.background_btn.pack(side="left", padx=10)
+
+        # Closing the window leaves the work running, like "Finish in background"
+        self.root.protocol("WM_DELETE_WINDOW", self.finish_in_background)
+        self.root.deiconify()
+        self.root.after(100, self.poll_pipeline)
+
+    def poll_pipeline(self):
+        if self.pipeline is None:
+            return
+        for stage, done, total in self.pipeline.poll():
+            if not self.cancelling:
+                self.status_label.config(text=f"{PIPELINE_STAGES.get(stage, stage)}: {done}/{total}")
+            self.progress_bar.config(maximum=max(total, 1), value=done)
+
+        code = self.pipeline.returncode()
+        if code is None:
+            self.root.after(100, self.poll_pipeline)
+            return
+        self.pipeline.detach()
+        if code == 0 or self.cancelling:
+            self.root.quit()
+        else:
+            self.status_label.config(text=f"Processing failed; see {self.pipeline.log_path}")
+            self.cancel_btn.config(state="disabled")
+            self.background_btn.config(text="Close", command=self.root.quit)
+            self.root.protocol("WM_DELETE_WINDOW", self.root.quit)
+
+    def cancel_pipeline(self):
+        # Stops after the current file or report; what finished is kept for the next run
+        self.cancelling = True
+        self.pipeline.cancel()
+        self.status_label.config(text="Cancelling...")
+        self.cancel_btn.config(state="disabled")
+
+    def finish_in_background(self):
+        self.pipeline.detach()
+        self.pipeline = None
+        print(f"Finishing in the background; see {PIPELINE_LOG} for progress.")
+        self.root.quit()
 
 # Run the app
 if __name__ == "__main__":
+    # Before any backend exists: the writer and history threads only ever see a settled tree
+    recover_journal()
     root = tk.Tk()
     app = CategorySelector(root)
+    # Once the selector has drawn, load the data stack before the first submit needs it
+    root.after_idle(lambda: root.after(0, warm, storage))
     root.mainloop()
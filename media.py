@@ -0,0 +1,93 @@
+import re, json, hashlib
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+# --- Media Dictionary ---
+media_dict = {
+    "BDE": ["Baseball Doesn't Exist","Sports"],
+    "Big A": ["Atrioc", "Current Events"],
+    "LASSI": ["LASSI", "Sports"],
+    "Gachiakuta": ["Classic Shonen", "Anime"],
+    "One Punch Man": ["Seinen", "Anime"],
+    "Kuroko": ["Sports Shonen", "Anime"],
+    "Idoled Out":["Idoled Out", "Reality TV"],
+    "Shorts":["Shorts", "Shorts"],
+    "Music": ["Music","Music"],
+    "AIM": ["Anime in Minutes", "Anime"],
+    "TDS": ["The Daily Show","Current Events"],
+    "Veritasium": ["Veritasium", "Science"],
+    "JHR": ["Jimmy High Roller", "Sports"],
+    "Nintendo": ["Nintendo", "Gaming"],
+    "NBA": ["Basketball", "Sports"],
+    "Ethanimale": ["Big Brother", "Reality TV"],
+    "HHM": ["Hip Hop Madness", "Music"],
+    "Xevi": ["Xevi", "Current Events"],
+    "RWJ": ["Ray William Johnson", "Life"],
+    "VGD": ["Video Game Dunkey", "Gaming"],
+    "SJJ": ["Solid JJ", "Comedy"],
+    "Gigguk": ["Gigguk", "Anime"],
+    "JA": ["Jaden Animations", "Life"],
+    "Tier Zoo": ["Tier Zoo", "Science"],
+    "RTwBM": ["Bill Maher", "Current Events"],
+    "Shawn Cee": ["Shawn Cee", "Music"],
+    "Economics Explained": ["Economics Explained", "Science"],
+    "Hank Green": ["Hank Green", "Current Events"],
+    "Branch Education": ["Branch Education", "Science"],
+    "Alenxander Bromley": ["Alexander Bromley", "Science"],
+    "CGP": ["CGP Grey", "Science"],
+    "poi": ["poi", "Science"]
+}
+
+# --- Compiled classifier ---
+
+class MediaClassifier:
+    """media_dict compiled into one regex, with a per-title result cache.
+
+    Classifies exactly like the linear scan it replaces: a title belongs to the
+    first key (in dict order) that occurs anywhere in it, case-insensitively.
+    The regex is a plain alternation of the keys (so the engine can skip ahead
+    on their first characters); a hit at one position is the earliest key
+    starting there, and searching on from the next position finds the rest.
+    """
+
+    def __init__(self, media_dict):
+        self.media_dict = media_dict
+        self.entries = [tuple(entry) for entry in media_dict.values()]
+        self.index = {}
+        for i, key in enumerate(media_dict):
+            self.index.setdefault(key.lower(), i)
+        self.pattern = re.compile("|".join(re.escape(key.lower()) for key in media_dict), re.DOTALL) if media_dict else None
+        # Fingerprint of the dict, for caches of classified data (snapshot, report manifest)
+        self.code = hashlib.sha1(json.dumps(media_dict).encode("utf-8")).hexdigest()
+        self.classify = lru_cache(maxsize=4096)(self._classify)
+
+    def _classify(self, title):
+        # -> (name, category), or (None, None) when no key occurs in the title
+        text = str(title).lower()
+        best = None
+        match = self.pattern.search(text) if self.pattern else None
+        while match and best != 0:
+            index = self.index[match.group()]
+            best = index if best is None else min(best, index)
+            match = self.pattern.search(text, match.start() + 1)
+        return (None, None) if best is None else self.entries[best]
+
+    def classify_series(self, series):
+        """DataFrame of media_name / media_category for each value of series (same index).
+
+        Each distinct value is classified once; missing values stay unclassified.
+        """
+        codes, uniques = pd.factorize(series)
+        labels = [self.classify(value) for value in uniques] + [(None, None)]
+        names = np.array([name for name, _ in labels], dtype=object)
+        categories = np.array([category for _, category in labels], dtype=object)
+        return pd.DataFrame({"media_name": names[codes], "media_category": categories[codes]}, index=series.index)
+
+MEDIA_CLASSIFIER = MediaClassifier(media_dict)
+
+def classify_media(title, media_dict=None):
+    # The module's dict goes through the shared compiled classifier; any other is compiled on the spot
+    if media_dict is None or media_dict is MEDIA_CLASSIFIER.media_dict:
+        return MEDIA_CLASSIFIER.classify(title)
+    return MediaClassifier(media_dict).classify(title)
@@ -0,0 +1,68 @@
+import os, sys, subprocess
+
+TRACKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tracker.py")
+PIPELINE_LOG = "data/pipeline.log"
+# Must match tracker.PROGRESS_PREFIX; not imported so the GUI never loads the data stack for it
+PROGRESS_PREFIX = "@progress"
+
+class BackgroundRebuild:
+    """`tracker.py rebuild` in a child process that outlives the GUI if asked to.
+
+    Its output goes to a log file rather than a pipe, so the GUI can stop
+    reading (and exit) at any time without the child dying on a broken pipe.
+    poll() tails that log for progress lines; cancel() asks the child to stop
+    at its next safe point through a cancel file, which works on every platform
+    and never interrupts a master log write.
+    """
+
+    def __init__(self, backend_name=None, log_path=PIPELINE_LOG, changed=None):
+        self.log_path = log_path
+        self.cancel_path = log_path + ".cancel"
+        if os.path.exists(self.cancel_path):
+            os.remove(self.cancel_path)
+        os.makedirs(os.path.dirname(log_path) or ".", exist_ok=True)
+
+        command = [sys.executable, TRACKER, "rebuild", "--progress", "--cancel-file", self.cancel_path]
+        if backend_name:
+            command += ["--backend", backend_name]
+        # The session's (category, date) keys, so the child only re-checks what it wrote
+        for name, day in sorted(changed or ()):
+            command += ["--changed", f"{name}={day}"]
+        if os.name == "nt":
+            # No console window, and not killed along with the GUI's console
+            detach = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW}
+        else:
+            detach = {"start_new_session": True}
+        with open(log_path, "w", encoding="utf-8") as log:
+            self.process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, **detach)
+        self._reader = open(log_path, "r", encoding="utf-8")
+        self._partial = ""
+
+    def poll(self):
+        """Progress events (stage, done, total) logged since the last call."""
+        if self._reader is None:
+            return []
+        events = []
+        text = self._partial + self._reader.read()
+        lines = text.split("\n")
+        # A line still being written is kept for next time
+        self._partial = lines.pop()
+        for line in lines:
+            parts = line.split()
+            if len(parts) == 4 and parts[0] == PROGRESS_PREFIX:
+                events.append((parts[1], int(parts[2]), int(parts[3])))
+        return events
+
+    def returncode(self):
+        """None while running; then 0 if it finished, non-zero if it failed or was cancelled."""
+        return self.process.poll()
+
+    def cancel(self):
+        with open(self.cancel_path, "w"):
+            pass
+
+    def detach(self):
+        # Stop watching; the child keeps running and logging on its own
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
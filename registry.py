@@ -0,0 +1,113 @@
+import os, ast, sys, importlib, importlib.util
+
+PLUGIN_DIR = "plugins"
+# Selector panes, in display order
+PANES = ("breakdown", "rebuild")
+
+# Built-in categories in selector order: (display name, also the CSV name; "module:Class"; pane)
+BUILTIN_WINDOWS = [
+    ("Work Day", "windows.categories:WorkDayWindow", "breakdown"),
+    ("Cooking", "windows.categories:CookingWindow", "breakdown"),
+    ("Workouts", "windows.categories:WorkoutsWindow", "breakdown"),
+    ("Learning", "windows.categories:LearningWindow", "breakdown"),
+    ("Driving", "windows.categories:DrivingWindow", "breakdown"),
+    ("Leetcode", "windows.categories:LeetcodeWindow", "breakdown"),
+    ("Coding Projects", "windows.categories:CodingProjectsWindow", "breakdown"),
+    ("Career Prep", "windows.categories:CareerPrepWindow", "breakdown"),
+    ("Miscellaneous", "windows.categories:MiscellaneousWindow", "breakdown"),
+    ("Sleep", "windows.categories:SleepWindow", "rebuild"),
+    ("Meditating", "windows.categories:MeditatingWindow", "rebuild"),
+    ("Music", "windows.categories:MusicWindow", "rebuild"),
+    ("Gaming", "windows.categories:GamingWindow", "rebuild"),
+    ("Messaging/Calling", "windows.categories:TextingCallingWindow", "rebuild"),
+    ("Socializing", "windows.categories:SocializingWindow", "rebuild"),
+    ("Eating", "windows.categories:EatingWindow", "rebuild"),
+    ("Media", "windows.categories:MediaWindow", "rebuild"),
+]
+
+class WindowRegistry:
+    """Category name -> window class, imported the first time the category is launched.
+
+    Each entry is a "module:Class" path (or "path/to/file.py:Class" for
+    plugins) plus the selector pane it is listed in; nothing is imported until
+    load(), and the class is cached after that.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.classes = {}
+
+    def register(self, name, path, pane="rebuild"):
+        if pane not in PANES:
+            raise ValueError(f"{name}: pane must be one of {PANES}, not {pane!r}")
+        self.entries[name] = (path, pane)
+        self.classes.pop(name, None)
+
+    def names(self, pane=None):
+        return [name for name, (_, entry_pane) in self.entries.items() if pane is None or entry_pane == pane]
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def load(self, name):
+        """The window class for a category, imported on first use."""
+        if name not in self.classes:
+            path, _ = self.entries[name]
+            module_path, class_name = path.rsplit(":", 1)
+            if module_path.endswith(".py"):
+                module = _import_file(module_path)
+            else:
+                module = importlib.import_module(module_path)
+            self.classes[name] = getattr(module, class_name)
+        return self.classes[name]
+
+    def load_plugins(self, plugin_dir=PLUGIN_DIR):
+        # A plugin is a .py file declaring, as plain string literals:
+        #   CATEGORY = "Reading"        display name (and CSV name)
+        #   WINDOW = "ReadingWindow"    class taking (master, callback), like windows/*
+        #   PANE = "rebuild"            optional, "breakdown" or "rebuild"
+        # The declarations are read with ast, so the plugin is only imported when launched
+        if not os.path.isdir(plugin_dir):
+            return
+        for filename in sorted(os.listdir(plugin_dir)):
+            if not filename.endswith(".py") or filename.startswith("_"):
+                continue
+            filepath = os.path.join(plugin_dir, filename)
+            try:
+                declared = _plugin_declarations(filepath)
+                self.register(declared["CATEGORY"], f"{filepath}:{declared['WINDOW']}", declared.get("PANE", "rebuild"))
+            except (OSError, SyntaxError, KeyError, ValueError) as e:
+                print(f"Skipping plugin {filepath}: {type(e).__name__}: {e}")
+
+def _plugin_declarations(filepath):
+    with open(filepath, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filepath)
+    declared = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and node.targets[0].id in ("CATEGORY", "WINDOW", "PANE")
+                and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)):
+            declared[node.targets[0].id] = node.value.value
+    return declared
+
+def _import_file(filepath):
+    name = "plugins." + os.path.splitext(os.path.basename(filepath))[0]
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+def default_registry(plugin_dir=PLUGIN_DIR):
+    """The built-in categories plus any plugins found in plugin_dir."""
+    registry = WindowRegistry()
+    for name, path, pane in BUILTIN_WINDOWS:
+        registry.register(name, path, pane)
+    registry.load_plugins(plugin_dir)
+    return registry
@@ -0,0 +1,214 @@
+import os, io, csv, json, hashlib, sqlite3, threading
+import pandas as pd
+from storage import DATA_DIR, resolve_rows, write_master_csv
+
+DB_PATH = "data/tracker.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    date TEXT NOT NULL,
+    dup INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS days_category_date ON days(category, date, dup);
+
+CREATE TABLE IF NOT EXISTS columns (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    UNIQUE(category, name)
+);
+
+CREATE TABLE IF NOT EXISTS master_log (
+    date TEXT,
+    category TEXT,
+    subtype TEXT,
+    metric TEXT,
+    value TEXT,
+    source TEXT,
+    value_num REAL
+);
+CREATE INDEX IF NOT EXISTS master_log_date ON master_log(date, metric);
+"""
+
+# One row per (category, date) holds the flattened window result as JSON.
+# "dup" only numbers legacy duplicate dates imported from CSV; submits always
+# upsert dup 0, which is the row an in-place CSV rewrite would have replaced.
+UPSERT_DAY = """
+INSERT INTO days(category, date, dup, data) VALUES (?, ?, 0, ?)
+ON CONFLICT(category, date, dup) DO UPDATE SET data = excluded.data
+"""
+
+class SqliteBackend:
+    name = "sqlite"
+    layout = "wide"
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._connect()
+        self.conn.executescript(SCHEMA)
+
+    def _connect(self):
+        # Consolidation worker threads share the connection, one query at a time
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # Worker processes open their own connection to the same database
+        return {"db_path": self.db_path}
+
+    def __setstate__(self, state):
+        self.db_path = state["db_path"]
+        self._connect()
+
+    def close(self):
+        self.conn.close()
+
+    # --- Category data ---
+
+    def _upsert(self, name, flat_data):
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO columns(category, name) VALUES (?, ?)",
+            [(name, col) for col in flat_data]
+        )
+        self.conn.execute(UPSERT_DAY, (name, str(flat_data["Date"]), json.dumps(flat_data, default=str)))
+
+    def write_day(self, name, flat_data):
+        with self.conn:
+            self._upsert(name, flat_data)
+
+    def commit_days(self, items):
+        # One transaction for the whole session
+        with self.conn:
+            for name, flat_data in items:
+                self._upsert(name, flat_data)
+
+    def categories(self):
+        rows = self.conn.execute("SELECT category FROM days GROUP BY category ORDER BY min(id)")
+        return [name for (name,) in rows]
+
+    def fieldnames(self, name):
+        rows = self.conn.execute("SELECT name FROM columns WHERE category = ? ORDER BY id", (name,))
+        return [col for (col,) in rows]
+
+    def rows(self, name, start=None, end=None):
+        query = "SELECT data FROM days WHERE category = ?"
+        params = [name]
+        if start is not None:
+            query += " AND date >= ?"
+            params.append(start)
+        if end is not None:
+            query += " AND date <= ?"
+            params.append(end)
+        return [json.loads(data) for (data,) in self.conn.execute(query + " ORDER BY id", params)]
+
+    def latest_row(self, name):
+        # Served by the (category, date, dup) index; the GLOB skips imported non-date rows
+        row = self.conn.execute(
+            "SELECT data FROM days WHERE category = ? AND date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+            " ORDER BY date DESC, dup LIMIT 1", (name,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def file_state(self, name):
+        # No cheap change marker; consolidation always compares content hashes
+        return None
+
+    def content_hash(self, name):
+        with self.lock:
+            digest = hashlib.sha256(json.dumps(self.fieldnames(name)).encode("utf-8"))
+            for (data,) in self.conn.execute("SELECT data FROM days WHERE category = ? ORDER BY id", (name,)):
+                digest.update(data.encode("utf-8"))
+        return digest.hexdigest()
+
+    def write_csv(self, name, f):
+        writer = csv.DictWriter(f, fieldnames=self.fieldnames(name))
+        writer.writeheader()
+        writer.writerows(self.rows(name))
+
+    def read_frame(self, name):
+        # Parse the exported text so dtypes match reading the CSV file itself
+        buffer = io.StringIO(newline="")
+        with self.lock:
+            self.write_csv(name, buffer)
+        buffer.seek(0)
+        return pd.read_csv(buffer)
+
+    # --- Master log ---
+
+    def write_master(self, master_df):
+        write_master_csv(master_df)
+
+        dates = master_df["Date"].dt.strftime("%Y-%m-%d").astype(object)
+        table = pd.DataFrame({
+            "date": dates.where(master_df["Date"].notna(), None),
+            "category": master_df["Category"].astype(str),
+            "subtype": master_df["Subtype"].astype(str),
+            "metric": master_df["Metric"].astype(str),
+            "value": master_df["Value"].astype(str),
+            "source": master_df["Source"].astype(str),
+            "value_num": pd.to_numeric(master_df["Value"], errors="coerce"),
+        })
+        with self.conn:
+            self.conn.execute("DELETE FROM master_log")
+            self.conn.executemany(
+                "INSERT INTO master_log VALUES (?, ?, ?, ?, ?, ?, ?)",
+                table.astype(object).where(table.notna(), None).itertuples(index=False, name=None)
+            )
+
+    def duration_totals(self):
+        # Explicit "duration" minutes per (day, source file), summed in SQL
+        rows = self.conn.execute("""
+            SELECT date, source, TOTAL(value_num)
+            FROM master_log
+            WHERE lower(metric) = 'duration' AND date IS NOT NULL
+            GROUP BY date, source
+            ORDER BY date, source
+        """)
+        totals = {}
+        for day, source, total in rows:
+            totals.setdefault(day, {})[source] = total
+        return totals
+
+    # --- CSV import / export ---
+
+    def import_csv(self, data_dir=DATA_DIR):
+        with self.conn:
+            for filename in sorted(os.listdir(data_dir)):
+                if not filename.endswith(".csv"):
+                    continue
+                name = filename[:-4]
+                with open(os.path.join(data_dir, filename), "r", newline="", encoding="utf-8") as f:
+                    reader = csv.DictReader(f)
+                    fieldnames = reader.fieldnames or []
+                    rows = resolve_rows(list(reader))
+
+                self.conn.execute("DELETE FROM days WHERE category = ?", (name,))
+                self.conn.execute("DELETE FROM columns WHERE category = ?", (name,))
+                self.conn.executemany(
+                    "INSERT INTO columns(category, name) VALUES (?, ?)",
+                    [(name, col) for col in fieldnames]
+                )
+                seen = {}
+                for row in rows:
+                    day = row.get("Date") or ""
+                    data = {k: v for k, v in row.items() if k is not None and v not in (None, "")}
+                    self.conn.execute(
+                        "INSERT INTO days(category, date, dup, data) VALUES (?, ?, ?, ?)",
+                        (name, day, seen.get(day, 0), json.dumps(data))
+                    )
+                    seen[day] = seen.get(day, 0) + 1
+                print(f"Imported {filename}: {len(rows)} days")
+
+    def export_csv(self, dest_dir=DATA_DIR):
+        # Reproduces the compacted data/window_data files byte for byte
+        os.makedirs(dest_dir, exist_ok=True)
+        for name in self.categories():
+            with open(os.path.join(dest_dir, f"{name}.csv"), "w", newline="", encoding="utf-8") as f:
+                self.write_csv(name, f)
+            print(f"Exported {name}.csv")
@@ -0,0 +1,785 @@
+import os, io, csv, json, hashlib, queue, threading
+import numpy as np
+import pandas as pd
+from datetime import date
+from media import MEDIA_CLASSIFIER
+from commit_journal import JOURNAL_PATH, _apply_journal, _write_durable, recover_journal
+
+DATA_DIR = "data/window_data"
+MASTER_LOG = "data/master_log.csv"
+MASTER_SNAPSHOT = "data/master_snapshot"
+LONG_DATA_DIR = "data/long_data"
+
+# "wide" keeps one row per day with a "Section - Sublabel - Key" column per value
+# "long" keeps one (Date, Section, Sublabel, Key, Value) row per value under LONG_DATA_DIR
+LAYOUT = "wide"
+LONG_FIELDS = ["Date", "Section", "Sublabel", "Key", "Value"]
+
+# "append" adds a row per submit, plus a tombstone when the day is already on file
+# (resolved at read time, last record wins)
+# "rewrite" splices the new row over the indexed day, or appends a new day
+# Either way a submit that adds columns rewrites the whole file with the merged header
+WRITE_MODE = "append"
+
+# Date prefix of the tombstone record written ahead of every appended day
+TOMBSTONE = "DELETED "
+
+# "csv" keeps one file per category (WRITE_MODE / LAYOUT above apply)
+# "sqlite" keeps every category in one WAL-mode database (see sqlite_store.py)
+BACKEND = "csv"
+
+def category_path(name, data_dir=None, layout=LAYOUT):
+    if data_dir is None:
+        data_dir = LONG_DATA_DIR if layout == "long" else DATA_DIR
+    return os.path.join(data_dir, f"{name}.csv")
+
+def flatten_data(data):
+    # Nested window results become "Section - Sublabel - Key" columns
+    flat_data = {"Date": data.get("Date", date.today().isoformat())}
+
+    for section, values in data.items():
+        if section == "Date":
+            continue
+        if isinstance(values, dict):
+            for sublabel, subvalues in values.items():
+                if isinstance(subvalues, dict):
+                    for key, value in subvalues.items():
+                        flat_data[f"{section} - {sublabel} - {key}"] = value
+                else:
+                    flat_data[f"{section} - {sublabel}"] = subvalues
+        else:
+            flat_data[section] = values
+    return flat_data
+
+def split_column(col):
+    # Wide column name -> (Section, Sublabel, Key), following the same rules
+    # consolidate_data uses: a blank Sublabel means "General" and a blank
+    # Section means the value belongs to the file's own category
+    parts = col.split(" - ")
+    if len(parts) == 3:
+        return tuple(parts)
+    if len(parts) == 2:
+        return parts[0], "", parts[1]
+    return "", "", col
+
+def to_long_rows(flat_data):
+    day = flat_data["Date"]
+    rows = []
+    for col, value in flat_data.items():
+        if col == "Date" or value is None or value == "":
+            continue
+        section, sublabel, key = split_column(col)
+        rows.append({"Date": day, "Section": section, "Sublabel": sublabel, "Key": key, "Value": value})
+    return rows
+
+def from_long_rows(rows):
+    # Long rows back to one flat dict per day, the inverse of to_long_rows
+    days = {}
+    for row in rows:
+        flat_data = days.setdefault(row["Date"], {"Date": row["Date"]})
+        section, sublabel, key = row["Section"], row["Sublabel"], row["Key"]
+        col = " - ".join(part for part in (section, sublabel) if part)
+        flat_data[f"{col} - {key}" if col else key] = row["Value"]
+    return list(days.values())
+
+def _resolve_order(dates):
+    # Replay tombstones: each one drops the earlier rows for its date and the
+    # next block of rows for that date (one row in a wide file, the adjacent
+    # rows of one submit in a long file) takes the first dropped slot, which
+    # is what an in-place rewrite would have produced. Rows never tombstoned
+    # are untouched.
+    slots = []
+    positions = {}
+    pending = {}
+    previous = None
+    for i, day in enumerate(dates):
+        if isinstance(day, str) and day.startswith(TOMBSTONE):
+            day = day[len(TOMBSTONE):]
+            dropped = positions.pop(day, [])
+            for slot in dropped:
+                slots[slot] = None
+            if dropped:
+                pending[day] = dropped[0]
+            previous = None
+            continue
+        if previous is not None and day == dates[i - 1] and slots[previous] is not None:
+            slots[previous].append(i)
+            continue
+        if day in pending:
+            slot = pending.pop(day)
+            slots[slot] = [i]
+        else:
+            slot = len(slots)
+            slots.append([i])
+        positions.setdefault(day, []).append(slot)
+        previous = slot
+    return [i for block in slots if block is not None for i in block]
+
+def resolve_rows(rows):
+    return [rows[i] for i in _resolve_order([row.get("Date") for row in rows])]
+
+def read_long_frame(filepath):
+    # Long rows with tombstones resolved; every column stays text and empty
+    # values are dropped, just as consolidation skips NaN cells in wide files
+    labels = ["Section", "Sublabel", "Key"]
+    df = pd.read_csv(filepath, dtype={"Section": str, "Sublabel": str, "Key": str, "Value": str})
+    df = df.iloc[_resolve_order(df["Date"].tolist())]
+    df[labels] = df[labels].fillna("")
+    return df[df["Value"].notna()]
+
+def read_category_frame(filepath):
+    df = pd.read_csv(filepath)
+    if "Date" not in df.columns or not df["Date"].astype(str).str.startswith(TOMBSTONE).any():
+        return df
+
+    # Compact the raw text and parse it again so column dtypes come out exactly
+    # as they would for a rewritten file (tombstones would turn ints into floats)
+    raw = pd.read_csv(filepath, dtype=str, keep_default_na=False)
+    compacted = raw.iloc[_resolve_order(raw["Date"].tolist())]
+    buffer = io.StringIO()
+    compacted.to_csv(buffer, index=False)
+    buffer.seek(0)
+    return pd.read_csv(buffer)
+
+# --- Date offset index (sidecar "<name>.csv.idx") ---
+
+def index_path(filename):
+    return filename + ".idx"
+
+def _format_rows(fieldnames, rows):
+    buffer = io.StringIO()
+    csv.DictWriter(buffer, fieldnames=fieldnames).writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+def _format_csv(fieldnames, rows):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+def _iter_records(f):
+    # Yield (offset, raw bytes) per CSV record; quoted fields may span lines
+    offset = f.tell()
+    record = b""
+    for line in iter(f.readline, b""):
+        record += line
+        if record.count(b'"') % 2 == 0:
+            yield offset, record
+            offset += len(record)
+            record = b""
+    if record:
+        yield offset, record
+
+def build_index(filename):
+    # Map each live date to the [offset, length] of its row (of its block of
+    # adjacent rows in a long file), replaying tombstones as _resolve_order does
+    dates = {}
+    header = []
+    previous = None
+    with open(filename, "rb") as f:
+        for offset, record in _iter_records(f):
+            fields = next(csv.reader([record.decode("utf-8")]), [])
+            if offset == 0:
+                header = fields
+                date_col = header.index("Date") if "Date" in header else None
+                contiguous = header == LONG_FIELDS
+                continue
+            if date_col is None or date_col >= len(fields):
+                continue
+            day = fields[date_col]
+            if day.startswith(TOMBSTONE):
+                dates.pop(day[len(TOMBSTONE):], None)
+            elif day not in dates:
+                dates[day] = [offset, len(record)]
+            elif contiguous and day == previous and sum(dates[day]) == offset:
+                dates[day][1] += len(record)
+            previous = day
+        ends_with_newline = not header or record.endswith((b"\n", b"\r"))
+
+    stat = os.stat(filename)
+    index = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "header": header,
+        "ends_with_newline": ends_with_newline,
+        "dates": dates,
+    }
+    save_index(filename, index)
+    return index
+
+def save_index(filename, index):
+    # Threads and worker processes may rebuild the same index at once; each writes its own temp file
+    tmp_path = f"{index_path(filename)}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path(filename))
+
+def _restat(filename, index):
+    stat = os.stat(filename)
+    index["mtime_ns"] = stat.st_mtime_ns
+    index["size"] = stat.st_size
+    save_index(filename, index)
+
+def load_index(filename):
+    # The sidecar is only trusted while the CSV's mtime and size match it,
+    # so hand-edited files simply get re-indexed
+    if not os.path.isfile(filename):
+        return None
+    try:
+        with open(index_path(filename), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        stat = os.stat(filename)
+        if index["mtime_ns"] == stat.st_mtime_ns and index["size"] == stat.st_size:
+            return index
+    except (OSError, ValueError, KeyError):
+        pass
+    return build_index(filename)
+
+def read_days(name, start=None, end=None, data_dir=None, layout=LAYOUT):
+    # Seek straight to the rows for dates in [start, end] (ISO strings, inclusive)
+    filename = category_path(name, data_dir, layout)
+    index = load_index(filename)
+    if index is None:
+        return []
+    spans = sorted(
+        (offset, length) for day, (offset, length) in index["dates"].items()
+        if (start is None or day >= start) and (end is None or day <= end)
+    )
+    rows = []
+    with open(filename, "rb") as f:
+        for offset, length in spans:
+            f.seek(offset)
+            text = f.read(length).decode("utf-8")
+            rows.extend(csv.DictReader(io.StringIO(text, newline=""), fieldnames=index["header"]))
+    return rows
+
+# --- Writes ---
+
+def _append_rows(filename, index, day, rows):
+    fieldnames = index["header"]
+    payload = b"" if index["ends_with_newline"] else b"\r\n"
+    # Only a day that is already on file needs a tombstone
+    if day in index["dates"]:
+        payload += _format_rows(fieldnames, [{"Date": TOMBSTONE + day}])
+    block = _format_rows(fieldnames, rows)
+
+    offset = index["size"] + len(payload)
+    with open(filename, "ab") as f:
+        f.write(payload + block)
+
+    index["dates"][day] = [offset, len(block)]
+    index["ends_with_newline"] = True
+    _restat(filename, index)
+
+def _splice_rows(filename, index, day, rows):
+    # Replace the indexed day in place; only the bytes after it move
+    offset, length = index["dates"][day]
+    block = _format_rows(index["header"], rows)
+    with open(filename, "r+b") as f:
+        if len(block) == length:
+            f.seek(offset)
+            f.write(block)
+        else:
+            f.seek(offset + length)
+            tail = f.read()
+            f.seek(offset)
+            f.write(block + tail)
+            f.truncate()
+
+    shift = len(block) - length
+    for span in index["dates"].values():
+        if span[0] > offset:
+            span[0] += shift
+    index["dates"][day] = [offset, len(block)]
+    _restat(filename, index)
+
+def _merged_rows(filename, days, layout=LAYOUT):
+    rows = []
+    fieldnames = []
+
+    # Load existing data if file exists
+    if os.path.isfile(filename):
+        with open(filename, "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or []
+            for row in reader:
+                rows.append(row)
+
+    # Compact any appended upsert records, then replace each day if its date matches, else append
+    rows = resolve_rows(rows)
+    for flat_data in days:
+        day = flat_data["Date"]
+        if layout == "long":
+            fieldnames = LONG_FIELDS
+            hits = [i for i, row in enumerate(rows) if row.get("Date") == day]
+            block = to_long_rows(flat_data)
+            if hits:
+                rest = [row for row in rows[hits[0]:] if row.get("Date") != day]
+                rows = rows[:hits[0]] + block + rest
+            else:
+                rows.extend(block)
+            continue
+
+        fieldnames = list(dict.fromkeys(fieldnames + list(flat_data.keys())))
+        updated = False
+        for i, row in enumerate(rows):
+            if row.get("Date") == day:
+                rows[i] = flat_data
+                updated = True
+                break
+        if not updated:
+            rows.append(flat_data)
+    return fieldnames, rows
+
+def _rewrite_file(filename, flat_data):
+    fieldnames, rows = _merged_rows(filename, [flat_data], "wide")
+    _write_csv(filename, fieldnames, rows)
+
+def _write_csv(filename, fieldnames, rows):
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    with open(filename, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    build_index(filename)
+
+def write_day(name, flat_data, mode=WRITE_MODE, layout=LAYOUT, data_dir=None):
+    filename = category_path(name, data_dir, layout)
+    index = load_index(filename)
+    day = str(flat_data["Date"])
+
+    if layout == "long":
+        rows = to_long_rows(flat_data)
+        if index is None:
+            _write_csv(filename, LONG_FIELDS, rows)
+            return
+    else:
+        rows = [flat_data]
+        # The index carries the header: any new column forces a full rewrite
+        if not (index and index["header"] and set(flat_data) <= set(index["header"])):
+            _rewrite_file(filename, flat_data)
+            return
+
+    if mode == "rewrite" and day in index["dates"]:
+        _splice_rows(filename, index, day, rows)
+    else:
+        _append_rows(filename, index, day, rows)
+
+# --- Session group commit ---
+
+def _plan_commit(filename, days, mode, layout):
+    # Append when the header already covers every column, otherwise stage a rewrite
+    index = load_index(filename)
+    appendable = index is not None and bool(index["header"])
+    if appendable and layout != "long":
+        appendable = all(set(flat_data) <= set(index["header"]) for flat_data in days)
+    if appendable and mode == "rewrite":
+        appendable = not any(str(flat_data["Date"]) in index["dates"] for flat_data in days)
+
+    if not appendable:
+        fieldnames, rows = _merged_rows(filename, days, layout)
+        content = _format_csv(fieldnames, rows)
+        return {"file": filename, "content": content}
+
+    payload = b"" if index["ends_with_newline"] else b"\r\n"
+    spans = {}
+    for flat_data in days:
+        day = str(flat_data["Date"])
+        if day in index["dates"] or day in spans:
+            payload += _format_rows(index["header"], [{"Date": TOMBSTONE + day}])
+        block = _format_rows(index["header"], to_long_rows(flat_data) if layout == "long" else [flat_data])
+        spans[day] = [index["size"] + len(payload), len(block)]
+        payload += block
+    return {"file": filename, "size": index["size"], "payload": payload, "index": index, "spans": spans}
+
+def commit_days(items, mode=WRITE_MODE, layout=LAYOUT):
+    # Write every buffered (name, flat_data) in one all-or-nothing pass:
+    # staged rewrites and the appends journal are made durable first, then
+    # renaming the journal into place is the commit point
+    by_category = {}
+    for name, flat_data in items:
+        by_category.setdefault(name, []).append(flat_data)
+
+    plans = []
+    for name, days in by_category.items():
+        filename = category_path(name, None, layout)
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        plans.append(_plan_commit(filename, days, mode, layout))
+
+    journal = {"appends": [], "renames": []}
+    for plan in plans:
+        if "content" in plan:
+            tmp_path = plan["file"] + ".commit-tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(plan["content"])
+                f.flush()
+                os.fsync(f.fileno())
+            journal["renames"].append([tmp_path, plan["file"]])
+        else:
+            journal["appends"].append([plan["file"], plan["size"], plan["payload"].decode("utf-8")])
+
+    _write_durable(JOURNAL_PATH, json.dumps(journal).encode("utf-8"))
+    _apply_journal(journal)
+    os.remove(JOURNAL_PATH)
+
+    # Sidecar indexes are caches; bring them up to date after the fact
+    for plan in plans:
+        if "content" in plan:
+            build_index(plan["file"])
+        else:
+            plan["index"]["dates"].update(plan["spans"])
+            plan["index"]["ends_with_newline"] = True
+            _restat(plan["file"], plan["index"])
+
+class Session:
+    # Buffers each window's flattened row until the session is committed as a group
+    def __init__(self, backend):
+        self.backend = backend
+        self.pending = {}
+
+    def add(self, name, flat_data):
+        self.pending[(name, str(flat_data["Date"]))] = flat_data
+
+    def commit(self):
+        # Returns the (category, date) keys that changed, for the downstream stages
+        changed = set(self.pending)
+        if self.pending:
+            self.backend.commit_days([(name, flat_data) for (name, _), flat_data in self.pending.items()])
+        self.pending = {}
+        return changed
+
+class SessionWriter:
+    """A Session fed through a queue and committed by one writer thread, so the Tk thread never touches disk.
+
+    add() only enqueues. The thread folds each submit into the session in
+    arrival order (a later submit for the same category and date replaces the
+    earlier one) and, after close(), commits everything as one group commit,
+    one write per category file. The GUI polls events() for ("committed",
+    changed keys) or ("failed", message) and done() before it moves on.
+    """
+
+    def __init__(self, backend):
+        self.session = Session(backend)
+        self.queue = queue.Queue()
+        self.notices = queue.Queue()
+        self.changed = None
+        self.error = None
+        self.thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self.thread.start()
+
+    def add(self, name, flat_data):
+        self.queue.put((name, flat_data))
+
+    def close(self):
+        # Everything queued before this is still committed
+        self.queue.put(None)
+
+    def done(self):
+        return not self.thread.is_alive()
+
+    def events(self):
+        events = []
+        while True:
+            try:
+                events.append(self.notices.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _run(self):
+        for name, flat_data in iter(self.queue.get, None):
+            self.session.add(name, flat_data)
+        try:
+            self.changed = self.session.commit()
+        except Exception as e:
+            self.error = e
+            self.notices.put(("failed", f"{type(e).__name__}: {e}"))
+        else:
+            self.notices.put(("committed", self.changed))
+
+# --- Master log snapshot ---
+
+# Bump when the snapshot's columns change; older snapshots are rebuilt from the CSV
+SNAPSHOT_VERSION = 3
+# Dimension columns stored (and loaded) as pandas categoricals
+CATEGORICAL_COLUMNS = ["Category", "Subtype", "Metric", "metric_key", "Source", "media_name", "media_category"]
+# The typed master: dimensions as categoricals, Metric lowercased once into metric_key,
+# Subtype classified once against media_dict, and Value split by kind so downstream
+# code never re-coerces it
+TYPED_COLUMNS = [
+    "Date", "Category", "Subtype", "Metric", "metric_key", "Source",
+    "media_name", "media_category", "value_num", "value_text", "value_time",
+]
+# Text values that are clock times ("17:00", "1:30", "07:15:30") also land in value_time
+CLOCK_TIME = r"\d{1,2}:\d{2}(?::\d{2})?"
+
+def _cell_text(value):
+    # A cell as the CSV export writes it (7 -> "7", 22.0 -> "22.0"); blanks are missing
+    if isinstance(value, str):
+        return value if value != "" else np.nan
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return np.nan
+    return str(value)
+
+def _as_category(series, transform=None):
+    # Factorize first so the per-value work runs once per distinct value
+    codes, uniques = pd.factorize(series)
+    labels = [_cell_text(value) for value in uniques]
+    if transform:
+        labels = [label if pd.isna(label) else transform(label) for label in labels]
+    labels = np.array(labels + [np.nan], dtype=object)
+    return pd.Series(labels[codes], dtype=object).astype("category")
+
+def typed_master(master_df):
+    """The master log (as consolidated, or read back from the CSV as text) in its typed form."""
+    master_df = master_df.reset_index(drop=True)
+    values = master_df["Value"].astype(object).map(_cell_text)
+    raw = master_df["Value"].astype(object).where(values.notna())
+
+    value_num = pd.to_numeric(raw, errors="coerce").astype(float)
+    value_text = values.where(value_num.isna())
+    is_time = value_text.str.fullmatch(CLOCK_TIME, na=False)
+    clock = value_text[is_time]
+    clock = clock.where(clock.str.count(":") == 2, clock + ":00")
+    value_time = pd.Series(pd.NaT, index=master_df.index, dtype="timedelta64[ns]")
+    value_time[is_time] = pd.to_timedelta(clock, errors="coerce")
+
+    subtype = _as_category(master_df["Subtype"])
+    media = MEDIA_CLASSIFIER.classify_series(subtype)
+
+    return pd.DataFrame({
+        "Date": pd.to_datetime(master_df["Date"], errors="coerce").astype("datetime64[ns]"),
+        "Category": _as_category(master_df["Category"]),
+        "Subtype": subtype,
+        "Metric": _as_category(master_df["Metric"]),
+        "metric_key": _as_category(master_df["Metric"], str.lower),
+        "Source": _as_category(master_df["Source"]),
+        "media_name": media["media_name"].astype("category"),
+        "media_category": media["media_category"].astype("category"),
+        "value_num": value_num,
+        "value_text": value_text,
+        "value_time": value_time,
+    }, columns=TYPED_COLUMNS)
+
+def read_master_csv(path=MASTER_LOG):
+    # Read as text, the same form incremental consolidation works on
+    master_df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    master_df["Date"] = pd.to_datetime(master_df["Date"].mask(master_df["Date"] == ""), errors="coerce")
+    return typed_master(master_df)
+
+def _save_array(path, array):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+def _csv_state(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+def save_snapshot(master_df, snapshot_dir=MASTER_SNAPSHOT):
+    # One .npy per column: datetimes as datetime64[ns], numbers as-is, text as
+    # int32 codes into a sorted value list kept in meta.json (-1 for missing)
+    os.makedirs(snapshot_dir, exist_ok=True)
+    columns = []
+    for col in master_df.columns:
+        series = master_df[col]
+        spec = {"name": col, "dtype": str(series.dtype)}
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            spec.update(kind="category", dtype=str(series.cat.categories.dtype), values=series.cat.categories.tolist())
+            array = series.cat.codes.to_numpy(dtype=np.int32)
+        elif pd.api.types.is_datetime64_any_dtype(series):
+            spec["kind"] = "datetime"
+            array = series.to_numpy(dtype="datetime64[ns]")
+        elif pd.api.types.is_timedelta64_dtype(series):
+            spec["kind"] = "timedelta"
+            array = series.to_numpy(dtype="timedelta64[ns]")
+        elif pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+            spec["kind"] = "numeric"
+            array = series.to_numpy()
+        else:
+            codes, values = pd.factorize(series, sort=True)
+            spec.update(kind="category" if col in CATEGORICAL_COLUMNS else "text", values=values.tolist())
+            array = codes.astype(np.int32)
+        _save_array(os.path.join(snapshot_dir, f"{col}.npy"), array)
+        columns.append(spec)
+
+    # meta.json goes last and is what makes the new column files current
+    meta = {
+        "version": SNAPSHOT_VERSION, "rows": len(master_df), "csv_state": _csv_state(MASTER_LOG),
+        "media": MEDIA_CLASSIFIER.code, "columns": columns,
+    }
+    tmp_path = os.path.join(snapshot_dir, "meta.json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, os.path.join(snapshot_dir, "meta.json"))
+
+def load_snapshot(snapshot_dir=MASTER_SNAPSHOT):
+    """The master log as a typed frame from the binary snapshot, or None if it is missing or stale."""
+    try:
+        with open(os.path.join(snapshot_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # A CSV changed behind the snapshot's back (e.g. edited by hand) wins, and an
+    # edited media_dict means the stored classification is out of date
+    if meta.get("version") != SNAPSHOT_VERSION or meta["csv_state"] != _csv_state(MASTER_LOG):
+        return None
+    if meta.get("media") != MEDIA_CLASSIFIER.code:
+        return None
+
+    data = {}
+    try:
+        for spec in meta["columns"]:
+            array = np.load(os.path.join(snapshot_dir, f"{spec['name']}.npy"), mmap_mode="r")
+            if len(array) != meta["rows"]:
+                return None
+            if spec["kind"] == "category":
+                values = pd.Index(spec["values"], dtype=spec["dtype"] if spec["values"] else object)
+                data[spec["name"]] = pd.Categorical.from_codes(array, categories=values)
+            elif spec["kind"] == "text":
+                values = np.array(spec["values"] + [np.nan], dtype=object)
+                data[spec["name"]] = pd.Series(values[array], dtype=spec["dtype"])
+            else:
+                data[spec["name"]] = array
+    except (OSError, ValueError):
+        return None
+    return pd.DataFrame(data)
+
+def write_master_csv(master_df):
+    # The CSV is the export; the typed snapshot is what readers load
+    master_df.to_csv(MASTER_LOG, index=False)
+    save_snapshot(typed_master(master_df))
+
+def load_master():
+    """The current master log in its typed form (TYPED_COLUMNS), without parsing the CSV when possible."""
+    master_df = load_snapshot()
+    if master_df is None:
+        master_df = read_master_csv()
+        save_snapshot(master_df)
+    return master_df
+
+# --- Backends ---
+
+class CsvBackend:
+    name = "csv"
+
+    def __init__(self, layout=LAYOUT, mode=WRITE_MODE):
+        self.layout = layout
+        self.mode = mode
+        self.data_dir = LONG_DATA_DIR if layout == "long" else DATA_DIR
+
+    def write_day(self, name, flat_data):
+        write_day(name, flat_data, mode=self.mode, layout=self.layout)
+
+    def commit_days(self, items):
+        commit_days(items, mode=self.mode, layout=self.layout)
+
+    def categories(self):
+        if not os.path.isdir(self.data_dir):
+            return []
+        return [
+            filename[:-4] for filename in os.listdir(self.data_dir)
+            if filename.endswith(".csv") and filename != "master_log.csv"
+        ]
+
+    def rows(self, name, start=None, end=None):
+        # Live flat rows (text values) for dates in [start, end], read through the date index
+        rows = read_days(name, start, end, self.data_dir, self.layout)
+        return from_long_rows(rows) if self.layout == "long" else rows
+
+    def latest_row(self, name):
+        # The most recent day's flat row, read with one seek through the date index
+        index = load_index(category_path(name, self.data_dir, self.layout))
+        if not index:
+            return None
+        days = [day for day in index["dates"] if _is_day(day)]
+        if not days:
+            return None
+        day = max(days)
+        rows = self.rows(name, day, day)
+        return rows[0] if rows else None
+
+    def file_state(self, name):
+        stat = os.stat(category_path(name, self.data_dir))
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def content_hash(self, name):
+        digest = hashlib.sha256()
+        with open(category_path(name, self.data_dir), "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def read_frame(self, name):
+        filepath = category_path(name, self.data_dir)
+        if self.layout == "long":
+            return read_long_frame(filepath)
+        return read_category_frame(filepath)
+
+    def write_master(self, master_df):
+        write_master_csv(master_df)
+
+    def duration_totals(self):
+        # No precomputed aggregates; visualize_reports sums durations in pandas
+        return None
+
+def _is_day(text):
+    # Stray lines (merge markers, blanks) can index as dates; only ISO days count
+    try:
+        date.fromisoformat(text)
+        return True
+    except ValueError:
+        return False
+
+def get_backend(name=None):
+    name = name or BACKEND
+    if name == "sqlite":
+        from sqlite_store import SqliteBackend
+        return SqliteBackend()
+    return CsvBackend()
+
+# --- Long layout migration ---
+
+def migrate_to_long(data_dir=DATA_DIR, long_dir=LONG_DATA_DIR):
+    # Convert every wide category file into its long-format counterpart
+    os.makedirs(long_dir, exist_ok=True)
+    for filename in sorted(os.listdir(data_dir)):
+        if not filename.endswith(".csv"):
+            continue
+        with open(os.path.join(data_dir, filename), "r", newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            if "Date" not in (reader.fieldnames or []):
+                continue
+            rows = resolve_rows(list(reader))
+
+        long_rows = []
+        for row in rows:
+            long_rows.extend(to_long_rows(row))
+        _write_csv(os.path.join(long_dir, filename), LONG_FIELDS, long_rows)
+        print(f"Migrated {filename}: {len(rows)} days -> {len(long_rows)} rows")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Maintenance commands for the per-category data files")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    migrate = subparsers.add_parser("migrate-long", help="convert data/window_data into the long layout")
+    migrate.add_argument("--src", default=DATA_DIR)
+    migrate.add_argument("--dest", default=LONG_DATA_DIR)
+    import_sqlite = subparsers.add_parser("import-sqlite", help="load data/window_data into the SQLite database")
+    import_sqlite.add_argument("--src", default=DATA_DIR)
+    export_csv = subparsers.add_parser("export-csv", help="write the SQLite database back out as data/window_data files")
+    export_csv.add_argument("--dest", default=DATA_DIR)
+    args = parser.parse_args()
+
+    recover_journal()
+    if args.command == "migrate-long":
+        migrate_to_long(args.src, args.dest)
+    elif args.command == "import-sqlite":
+        get_backend("sqlite").import_csv(args.src)
+    elif args.command == "export-csv":
+        get_backend("sqlite").export_csv(args.dest)
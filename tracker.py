@@ -0,0 +1,114 @@
+# Headless entry point: consolidate and render reports without the GUI, e.g.
+#   python -m tracker rebuild --since 2025-11-01 --reports daily,weekly
+# Only the data stack (pandas, matplotlib on Agg) is imported, never tkinter
+# or the window modules, so it runs from cron on a machine without a display.
+import os, sys, time, argparse
+from datetime import date
+
+import matplotlib
+matplotlib.use("Agg")
+
+from storage import get_backend, load_master, recover_journal
+from consolidate import consolidate_data
+from visualize import REPORT_LEVELS, visualize_reports
+
+# Progress lines a parent process (pipeline.BackgroundRebuild) reads back from the output
+PROGRESS_PREFIX = "@progress"
+
+def rebuild(backend=None, since=None, until=None, levels=REPORT_LEVELS, full=False, force=False, jobs=1, consolidate=True,
+            progress=None, cancelled=None, changed=None):
+    """Consolidate the master log, then render the selected reports. Returns seconds per stage.
+
+    changed, the (category, date) keys a GUI session wrote, limits
+    consolidation to those files and dates and, unless since/until are
+    given, the reports to the span of those dates.
+
+    progress(stage, done, total) reports files consolidated and reports
+    rendered. cancelled() is polled between files, between stages and between
+    reports; the master log is never left half-written.
+    """
+    backend = backend or get_backend()
+    cancelled = cancelled or (lambda: False)
+    timings = {}
+    if changed and since is None and until is None:
+        days = sorted(date.fromisoformat(str(day)) for _, day in changed)
+        since, until = days[0], days[-1]
+
+    if consolidate:
+        started = time.perf_counter()
+        consolidate_data(backend, full=full, jobs=jobs, progress=progress, changed=changed, cancelled=cancelled)
+        timings["consolidate"] = time.perf_counter() - started
+    if cancelled():
+        return timings
+
+    started = time.perf_counter()
+    master_df = load_master()
+    timings["load master"] = time.perf_counter() - started
+
+    if levels:
+        report_timings = visualize_reports(master_df, backend, force=force, jobs=jobs, levels=levels, since=since, until=until,
+                                           progress=progress, cancelled=cancelled)
+        timings.update((f"reports: {stage}", seconds) for stage, seconds in report_timings.items())
+    return timings
+
+def _levels(text):
+    levels = [level.strip() for level in text.split(",") if level.strip()]
+    unknown = [level for level in levels if level not in REPORT_LEVELS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown report level(s): {', '.join(unknown)} (choose from {', '.join(REPORT_LEVELS)})")
+    return tuple(levels)
+
+def _changed_key(text):
+    name, sep, day = text.rpartition("=")
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        name = ""
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected CATEGORY=YYYY-MM-DD, not {text!r}")
+    return name, day
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m tracker", description="Headless consolidation and report runs")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild_cmd = commands.add_parser("rebuild", help="consolidate the master log and render reports")
+    rebuild_cmd.add_argument("--since", type=date.fromisoformat, help="only reports covering days from this date (YYYY-MM-DD)")
+    rebuild_cmd.add_argument("--until", type=date.fromisoformat, help="only reports covering days up to this date (YYYY-MM-DD)")
+    rebuild_cmd.add_argument("--reports", type=_levels, default=REPORT_LEVELS,
+                             help="comma-separated report levels (default: daily,weekly,monthly); empty for none")
+    rebuild_cmd.add_argument("--backend", choices=["csv", "sqlite"], help="storage backend (default: storage.BACKEND)")
+    rebuild_cmd.add_argument("--full", action="store_true", help="rebuild the master log from scratch")
+    rebuild_cmd.add_argument("--force", action="store_true", help="re-render the selected reports even if unchanged")
+    rebuild_cmd.add_argument("--skip-consolidate", action="store_true", help="render from the current master log as is")
+    rebuild_cmd.add_argument("--jobs", type=int, default=1, help="worker processes for consolidation and rendering")
+    rebuild_cmd.add_argument("--progress", action="store_true", help=f"print machine-readable '{PROGRESS_PREFIX} stage done total' lines")
+    rebuild_cmd.add_argument("--cancel-file", help="stop at the next safe point once this file exists")
+    rebuild_cmd.add_argument("--changed", type=_changed_key, action="append", metavar="CATEGORY=YYYY-MM-DD",
+                             help="a day the session wrote (repeatable); limits consolidation and reports to these days")
+    args = parser.parse_args(argv)
+
+    progress = None
+    if args.progress:
+        progress = lambda stage, done, total: print(f"{PROGRESS_PREFIX} {stage} {done} {total}", flush=True)
+    cancelled = (lambda: os.path.exists(args.cancel_file)) if args.cancel_file else None
+
+    # Nothing else in this process has touched the category files yet
+    recover_journal()
+    started = time.perf_counter()
+    timings = rebuild(
+        get_backend(args.backend), since=args.since, until=args.until, levels=args.reports,
+        full=args.full, force=args.force, jobs=args.jobs, consolidate=not args.skip_consolidate,
+        progress=progress, cancelled=cancelled, changed=set(args.changed) if args.changed else None,
+    )
+    print("Timings:")
+    for stage, seconds in timings.items():
+        print(f"  {stage:<20} {seconds:8.3f}s")
+    print(f"  {'total':<20} {time.perf_counter() - started:8.3f}s")
+    if cancelled and cancelled():
+        print("Cancelled; the next run picks up the remaining files and reports.")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,55 +2,86 @@
 import warnings
 warnings.filterwarnings("ignore")
 
-import os
+import os, json, time, hashlib, argparse
 import numpy as np
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
 from matplotlib.backends.backend_pdf import PdfPages
 import pandas as pd
+from storage import get_backend, load_master, typed_master
+from media import media_dict
 
-# --- Media Dictionary ---
-media_dict = {
-    "BDE": ["Baseball Doesn't Exist","Sports"],
-    "Big A": ["Atrioc", "Current Events"],
-    "LASSI": ["LASSI", "Sports"],
-    "Gachiakuta": ["Classic Shonen", "Anime"],
-    "One Punch Man": ["Seinen", "Anime"],
-    "Kuroko": ["Sports Shonen", "Anime"],
-    "Idoled Out":["Idoled Out", "Reality TV"],
-    "Shorts":["Shorts", "Shorts"],
-    "Music": ["Music","Music"],
-    "AIM": ["Anime in Minutes", "Anime"],
-    "TDS": ["The Daily Show","Current Events"],
-    "Veritasium": ["Veritasium", "Science"],
-    "JHR": ["Jimmy High Roller", "Sports"],
-    "Nintendo": ["Nintendo", "Gaming"],
-    "NBA": ["Basketball", "Sports"],
-    "Ethanimale": ["Big Brother", "Reality TV"],
-    "HHM": ["Hip Hop Madness", "Music"],
-    "Xevi": ["Xevi", "Current Events"],
-    "RWJ": ["Ray William Johnson", "Life"],
-    "VGD": ["Video Game Dunkey", "Gaming"],
-    "SJJ": ["Solid JJ", "Comedy"],
-    "Gigguk": ["Gigguk", "Anime"],
-    "JA": ["Jaden Animations", "Life"],
-    "Tier Zoo": ["Tier Zoo", "Science"],
-    "RTwBM": ["Bill Maher", "Current Events"],
-    "Shawn Cee": ["Shawn Cee", "Music"],
-    "Economics Explained": ["Economics Explained", "Science"],
-    "Hank Green": ["Hank Green", "Current Events"],
-    "Branch Education": ["Branch Education", "Science"],
-    "Alenxander Bromley": ["Alexander Bromley", "Science"],
-    "CGP": ["CGP Grey", "Science"],
-    "poi": ["poi", "Science"]
-}
+REPORT_MANIFEST = "reports/report_manifest.json"
+# Bump when what a report shows changes without its input rows changing
+REPORT_VERSION = 1
+REPORT_LEVELS = ("daily", "weekly", "monthly")
+
+# --- Report manifest ---
+
+class ReportManifest:
+    """Input hash of every rendered report, so unchanged reports are not rendered again."""
+
+    def __init__(self, path=REPORT_MANIFEST, force=False):
+        self.path = path
+        # The media dictionary decides labels too, so editing it rebuilds everything
+        self.code = hashlib.sha1(json.dumps([REPORT_VERSION, media_dict]).encode("utf-8")).hexdigest()
+        self.force = force
+        self.reports = {}
+        self.rendered = 0
+        self.skipped = 0
+        # Loaded even when forced: a partial run keeps the other reports' entries
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return
+        if manifest.get("code") == self.code:
+            self.reports = manifest["reports"]
+
+    def needs(self, pdf_path, digest):
+        if not self.force and self.reports.get(pdf_path) == digest and os.path.isfile(pdf_path):
+            self.skipped += 1
+            return False
+        self.reports.pop(pdf_path, None)
+        return True
+
+    def record(self, pdf_path, digest):
+        self.reports[pdf_path] = digest
+        self.rendered += 1
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"code": self.code, "reports": self.reports}, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+def _rows_hash(row_hashes, index):
+    # Sorted, since a day's reports only depend on which rows it has (every
+    # aggregation is a sorted groupby), not on their order in the master log
+    return hashlib.sha1(np.sort(row_hashes.loc[index].to_numpy()).tobytes()).hexdigest()
 
-def classify_media(title, media_dict):
-    for key, (name, category) in media_dict.items():
-        if key.lower() in str(title).lower():
-            return name, category
-    return None, None
+def _combined_hash(day_hashes, days):
+    return hashlib.sha1("\n".join(f"{day}:{day_hashes[day]}" for day in sorted(days)).encode("utf-8")).hexdigest()
+
+@contextmanager
+def _atomic_pdf(pdf_path):
+    # Written under a temporary name and renamed into place, so a crash never
+    # leaves a truncated report; no CreationDate, so the same input gives the same bytes
+    tmp_path = pdf_path + ".tmp"
+    try:
+        with PdfPages(tmp_path, metadata={"CreationDate": None}) as pdf:
+            yield pdf
+        # PdfPages writes no file at all when no page was saved
+        if os.path.exists(tmp_path):
+            os.replace(tmp_path, pdf_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 def plot_media_pie(data_dict, title, pdf):
     if not data_dict:
@@ -67,431 +98,479 @@ def plot_media_pie(data_dict, title, pdf):
     pdf.savefig(fig)
     plt.close(fig)
 
-def visualize_reports(master_df):
-    
-    output_dir="reports/daily_reports"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # Load work summary file safely
-    work_file = "data/window_data/Work_Day.csv"
-    
-    if os.path.exists(work_file):
-        work_df = pd.read_csv(work_file)
-    
-        # Normalize column names
-        work_df.columns = work_df.columns.str.strip().str.lower()
-    
-        # Ensure date column exists and is datetime
-        if "date" in work_df.columns:
-            work_df["date"] = pd.to_datetime(work_df["date"], errors="coerce")
-        else:
-            work_df["date"] = pd.NaT
+# --- Daily aggregates ---
+
+WORKOUT_CATEGORIES = ["chest", "back", "shoulders", "legs", "triceps", "biceps", "abs"]
+# Minutes added per day on top of the explicit durations, in the order they are added
+VIRTUAL_DURATIONS = ["Eating", "Workouts", "Miscellaneous"]
+
+def get_week_start(date_obj):
+    # Ensure week starts on Sunday
+    return date_obj - timedelta(days=(date_obj.weekday() + 1) % 7)
+
+def get_month_start(date, start_day=9):
+    if not (1 <= start_day <= 28):
+        raise ValueError("start_day must be between 1 and 28")
+
+    # If the day of the month is >= start_day, month start is this month's start_day
+    if date.day >= start_day:
+        return date.replace(day=start_day)
     else:
-        # Empty fallback if file doesn't exist yet
-        work_df = pd.DataFrame({"date": []})
+        # Otherwise, month start is the previous month's start_day
+        prev_month = date.month - 1 or 12
+        prev_year = date.year if date.month > 1 else date.year - 1
+        return date.replace(year=prev_year, month=prev_month, day=start_day)
 
-    all_daily_durations = {}
+class DailyAggregates:
+    """Per-day totals for every report level, computed once from the master log.
 
-    # --- Daily Reports ---
+    minutes: date x category matrix of the day's activity minutes, normalized
+    to 1440 (NaN where a category has no entry that day). media: date x media
+    Subtype matrix of duration minutes, with media_names / media_categories
+    mapping each Subtype column to its media_dict entry (the typed master's
+    media_name / media_category columns). Daily, weekly and monthly reports
+    are reductions over these rows.
+    """
 
-    for date, group in master_df.groupby(master_df["Date"].dt.date):
-        pdf_path = os.path.join(output_dir, f"daily_report_{date}.pdf")
-        with PdfPages(pdf_path) as pdf:
+    def __init__(self, master_df, duration_totals=None):
+        dates = master_df["Date"].dt.date
+        self.days = sorted(dates.dropna().unique())
+        category = master_df["Category"].astype(object).str.lower()
+        is_duration = master_df["metric_key"] == "duration"
 
-            # --- Daily Activity Pie Chart ---
-            durations = {}
-            
-            # Existing explicit durations
-            activity = group[group["Metric"].str.lower() == "duration"].copy()
-            activity["Value"] = pd.to_numeric(activity["Value"], errors="coerce")
-            for src, val in activity.groupby("Source")["Value"].sum().items():
-                durations[src.replace(".csv", "")] = val
-            
-            # Meals & Snacks (virtual durations → grouped as "Eating")
-            meal_count = len(group[group["Category"].str.lower() == "meals"]["Subtype"].unique())
-            snack_count = len(group[group["Category"].str.lower() == "snacks"]["Subtype"].unique())
-            eating_duration = meal_count * 20 + snack_count * 10
-            if eating_duration > 0:
-                durations["Eating"] = durations.get("Eating", 0) + eating_duration
-            
-            # Workouts (muscle groups with sets metric × 3 minutes)
-            workout_categories = ["chest", "back", "shoulders", "legs", "triceps", "biceps", "abs"]
-            for subtype, workout_group in group[group["Category"].str.lower().isin(workout_categories)].groupby("Subtype"):
-                sets = pd.to_numeric(
-                    workout_group.loc[workout_group["Metric"].str.lower() == "sets", "Value"],
-                    errors="coerce"
-                ).sum()
-                workout_duration = float(sets * 2.5)
-                if workout_duration > 0:
-                    durations["Workouts"] = durations.get("Workouts", 0) + workout_duration
-            
-            # Miscellaneous (showers and teeth brushing)
-            misc_group = group[group["Category"].str.lower() == "fixed"]
-            if not misc_group.empty:
-                showers = pd.to_numeric(
-                    misc_group.loc[misc_group["Metric"].str.lower() == "showers", "Value"],
-                    errors="coerce"
-                ).sum()
-                teeth = pd.to_numeric(
-                    misc_group.loc[misc_group["Metric"].str.lower().isin(["teeth", "teeth brushed"]), "Value"],
-                    errors="coerce"
-                ).sum()
-            
-                misc_duration = showers * 15 + teeth * 3
-                if misc_duration > 0:
-                    durations["Miscellaneous"] = durations.get("Miscellaneous", 0) + misc_duration
-            
-            # Missing category (whatever is left out of 1440 minutes)
-            accounted_total = sum(durations.values())
-            missing_duration = max(0, 1440 - accounted_total)
-            if missing_duration > 0:
-                durations["Missing"] = missing_duration
-            
-            # Normalize to 1440 minutes
-            total = sum(durations.values())
-            if total > 0:
-                durations = {k: v / total * 1440 for k, v in durations.items()}
-            
-            all_daily_durations[str(date)] = durations
-            
-            fig1, ax1 = plt.subplots(figsize=(12, 12))
-            ax1.pie(durations.values(), labels=durations.keys(), autopct="%1.1f%%", startangle=90, textprops={"fontsize": 8})
-            ax1.set_title(f"Daily Activity Breakdown ({date})")
-            pdf.savefig(fig1)
-            plt.close(fig1)
-
-            # --- Meals Pie Charts and Tables ---
-            meals = group[group["Category"].str.lower().isin(["meals", "snacks"])]
-            if not meals.empty:
-                meal_data = {}
-                for subtype, meal_group in meals.groupby("Subtype"):
-                    carbs = pd.to_numeric(meal_group.loc[meal_group["Metric"].str.lower() == "carbs", "Value"], errors="coerce").sum() * 4
-                    protein = pd.to_numeric(meal_group.loc[meal_group["Metric"].str.lower() == "proteins", "Value"], errors="coerce").sum() * 4
-                    fat = pd.to_numeric(meal_group.loc[meal_group["Metric"].str.lower() == "fats", "Value"], errors="coerce").sum() * 9
-                    meal_data[subtype] = {"Carbs": carbs, "Protein": protein, "Fat": fat}
-            
-                # Flatten into (meal, macro, value)
-                flat_data = [(meal, macro, val) for meal, macros in meal_data.items() for macro, val in macros.items()]
-            
-                # Sort by macro type: Carbs → Protein → Fat
-                macro_order = {"Carbs": 0, "Protein": 1, "Fat": 2}
-                flat_data.sort(key=lambda x: macro_order[x[1]])
+        # Explicit durations per (day, source file), from the backend when it aggregates them itself
+        if duration_totals is not None:
+            sources = pd.DataFrame.from_dict(duration_totals, orient="index")
+            sources.index = pd.to_datetime(sources.index).date
+            sources = sources.reindex(columns=sorted(sources.columns))
+        else:
+            rows = master_df[is_duration]
+            sources = rows.groupby([dates[is_duration], rows["Source"].astype(object)])["value_num"].sum().unstack()
+        sources = sources.reindex(index=self.days)
+        sources.columns = [src.replace(".csv", "") for src in sources.columns]
+
+        # Meals & Snacks (virtual durations → grouped as "Eating")
+        meal_count = master_df[category == "meals"].groupby(dates)["Subtype"].nunique(dropna=False)
+        snack_count = master_df[category == "snacks"].groupby(dates)["Subtype"].nunique(dropna=False)
+        eating = meal_count.reindex(self.days, fill_value=0) * 20 + snack_count.reindex(self.days, fill_value=0) * 10
+
+        # Workouts (muscle groups with sets metric × 3 minutes), summed over subtypes that did any
+        workouts = master_df[category.isin(WORKOUT_CATEGORIES)]
+        sets = workouts["value_num"].where(workouts["metric_key"] == "sets")
+        per_subtype = sets.groupby([dates[workouts.index], workouts["Subtype"].astype(object)]).sum() * 2.5
+        workout_minutes = per_subtype[per_subtype > 0].groupby(level=0).sum()
+
+        # Miscellaneous (showers and teeth brushing)
+        fixed = master_df[category == "fixed"]
+        fixed_dates = dates[fixed.index]
+        showers = fixed["value_num"].where(fixed["metric_key"] == "showers").groupby(fixed_dates).sum()
+        teeth = fixed["value_num"].where(fixed["metric_key"].isin(["teeth", "teeth brushed"])).groupby(fixed_dates).sum()
+        misc = showers * 15 + teeth * 3
+
+        raw = sources.copy()
+        virtual = {}
+        for key, minutes in zip(VIRTUAL_DURATIONS, [eating, workout_minutes, misc]):
+            minutes = minutes.reindex(self.days)
+            virtual[key] = minutes > 0
+            current = raw[key] if key in raw.columns else pd.Series(np.nan, index=raw.index)
+            raw[key] = current.where(~virtual[key], current.fillna(0) + minutes)
+
+        # Missing category (whatever is left out of 1440 minutes)
+        missing = (1440 - raw.sum(axis=1)).clip(lower=0)
+        raw["Missing"] = missing.where(missing > 0)
+
+        # Normalize to 1440 minutes
+        total = raw.sum(axis=1)
+        self.minutes = raw.div(total, axis=0).mul(1440).where(total > 0, raw, axis=0)
+
+        # Each day's categories in the order the pie has always listed them:
+        # its sources, then the virtual durations not already among them, then Missing
+        source_present = sources.notna()
+        self.day_keys = {}
+        for day in self.days:
+            keys = [src for src in sources.columns if source_present.at[day, src]]
+            keys += [key for key in VIRTUAL_DURATIONS if virtual[key][day] and key not in keys]
+            if missing[day] > 0:
+                keys.append("Missing")
+            self.day_keys[day] = keys
+
+        # Media minutes per (day, Subtype), for the Subtypes classified during consolidation
+        is_media = is_duration & master_df["media_category"].notna()
+        rows = master_df[is_media]
+        media = rows.groupby([dates[is_media], rows["Subtype"].astype(object)])["value_num"].sum()
+        self.media = media.unstack().reindex(index=self.days)
+        labels = rows[["Subtype", "media_name", "media_category"]].astype(object).drop_duplicates("Subtype")
+        self.media_names = labels.set_index("Subtype")["media_name"]
+        self.media_categories = labels.set_index("Subtype")["media_category"]
+
+    def day_durations(self, day):
+        row = self.minutes.loc[day]
+        return {key: row[key] for key in self.day_keys[day]}
+
+    def period_durations(self, days):
+        # Totals keep the order categories first show up across the period's days
+        totals = self.minutes.loc[days].sum()
+        keys = dict.fromkeys(key for day in days for key in self.day_keys[day])
+        return {key: totals[key] for key in keys}
+
+    def media_totals(self, days):
+        """(minutes by media category, minutes by media name) over the given days."""
+        totals = self.media.loc[days].sum()
+        totals = totals[totals != 0]
+        by_category = totals.groupby(self.media_categories[totals.index].to_numpy(), sort=False).sum()
+        by_name = totals.groupby(self.media_names[totals.index].to_numpy(), sort=False).sum()
+        return {k: float(v) for k, v in by_category.items()}, {k: float(v) for k, v in by_name.items()}
+
+# --- Report rendering (module level, so worker processes can run it) ---
+
+def render_daily_report(pdf_path, date, durations, meals, media_by_category, media_by_name):
+    """One day's PDF: activity pie, meal pie and macro table (from its meal/snack rows), media pies."""
+    with _atomic_pdf(pdf_path) as pdf:
+
+        # --- Daily Activity Pie Chart ---
+        fig1, ax1 = plt.subplots(figsize=(12, 12))
+        ax1.pie(durations.values(), labels=durations.keys(), autopct="%1.1f%%", startangle=90, textprops={"fontsize": 8})
+        ax1.set_title(f"Daily Activity Breakdown ({date})")
+        pdf.savefig(fig1)
+        plt.close(fig1)
+
+        # --- Meals Pie Charts and Tables ---
+        if not meals.empty:
+            meal_data = {}
+            for subtype, meal_group in meals.groupby("Subtype"):
+                carbs = meal_group.loc[meal_group["metric_key"] == "carbs", "value_num"].sum() * 4
+                protein = meal_group.loc[meal_group["metric_key"] == "proteins", "value_num"].sum() * 4
+                fat = meal_group.loc[meal_group["metric_key"] == "fats", "value_num"].sum() * 9
+                meal_data[subtype] = {"Carbs": carbs, "Protein": protein, "Fat": fat}
+        
+            # Flatten into (meal, macro, value)
+            flat_data = [(meal, macro, val) for meal, macros in meal_data.items() for macro, val in macros.items()]
+        
+            # Sort by macro type: Carbs → Protein → Fat
+            macro_order = {"Carbs": 0, "Protein": 1, "Fat": 2}
+            flat_data.sort(key=lambda x: macro_order[x[1]])
+        
+            labels, values, colors = [], [], []
+            base_colors = {"Carbs": "orange", "Protein": "red", "Fat": "gold"}
+            shade_factors = np.linspace(0.6, 1.2, len(meal_data))
+        
+            def wrap_label_at_space(label, max_width=20):
+                words = label.split(" ")
+                lines, current_line = [], ""
+                for word in words:
+                    if len(current_line) + len(word) + 1 <= max_width:
+                        current_line += (" " if current_line else "") + word
+                    else:
+                        lines.append(current_line)
+                        current_line = word
+                if current_line:
+                    lines.append(current_line)
+                return "\n".join(lines)
+        
+            for meal, macro, val in flat_data:
+                # Bold macro name
+                bold_macro = r"$\mathbf{" + macro + "}$"
+                label = wrap_label_at_space(f"{meal} - {bold_macro}", 15)
+                labels.append(label)
+                values.append(val)
+        
+                # Shade colors by meal index
+                meal_idx = list(meal_data.keys()).index(meal)
+                shade = shade_factors[meal_idx]
+                base_rgb = np.array(mcolors.to_rgb(base_colors[macro]))
+                shaded_rgb = np.clip(base_rgb * shade, 0, 1)
+                colors.append(shaded_rgb)
+        
+            fig2, ax2 = plt.subplots(figsize=(12, 12))
+            ax2.pie(
+                values,
+                labels=labels,
+                colors=colors,
+                autopct="%1.1f%%",
+                startangle=90,
+                textprops={"fontsize": 8}
+            )
+            ax2.set_title(f"Meal Breakdown ({date})")
+            pdf.savefig(fig2)
+            plt.close(fig2)
             
-                labels, values, colors = [], [], []
-                base_colors = {"Carbs": "orange", "Protein": "red", "Fat": "gold"}
-                shade_factors = np.linspace(0.6, 1.2, len(meal_data))
+            # --- Table of Macronutrients ---
+            fig3, ax3 = plt.subplots(figsize=(10, 6))
+            ax3.axis("off")
             
-                def wrap_label_at_space(label, max_width=20):
-                    words = label.split(" ")
-                    lines, current_line = [], ""
-                    for word in words:
-                        if len(current_line) + len(word) + 1 <= max_width:
-                            current_line += (" " if current_line else "") + word
-                        else:
-                            lines.append(current_line)
-                            current_line = word
-                    if current_line:
+            # Define the wrapping function once
+            def wrap_label_at_space(label, max_width=20):
+                words = label.split(" ")
+                lines, current_line = [], ""
+                for word in words:
+                    if len(current_line) + len(word) + 1 <= max_width:
+                        current_line += (" " if current_line else "") + word
+                    else:
                         lines.append(current_line)
-                    return "\n".join(lines)
+                        current_line = word
+                if current_line:
+                    lines.append(current_line)
+                return "\n".join(lines)
             
-                for meal, macro, val in flat_data:
-                    # Bold macro name
-                    bold_macro = r"$\mathbf{" + macro + "}$"
-                    label = wrap_label_at_space(f"{meal} - {bold_macro}", 15)
-                    labels.append(label)
-                    values.append(val)
+            table_data = []
+            cumulative_carbs = cumulative_protein = cumulative_fat = cumulative_total = 0
             
-                    # Shade colors by meal index
-                    meal_idx = list(meal_data.keys()).index(meal)
-                    shade = shade_factors[meal_idx]
-                    base_rgb = np.array(mcolors.to_rgb(base_colors[macro]))
-                    shaded_rgb = np.clip(base_rgb * shade, 0, 1)
-                    colors.append(shaded_rgb)
+            for meal, macros in meal_data.items():
+                total_cal = macros["Carbs"] + macros["Protein"] + macros["Fat"]
+                cumulative_carbs += macros["Carbs"]
+                cumulative_protein += macros["Protein"]
+                cumulative_fat += macros["Fat"]
+                cumulative_total += total_cal
+            
+                # Wrap long meal names at spaces instead of fixed character chunks
+                wrapped_meal = wrap_label_at_space(meal, max_width=20)
             
-                fig2, ax2 = plt.subplots(figsize=(12, 12))
-                ax2.pie(
-                    values,
-                    labels=labels,
-                    colors=colors,
-                    autopct="%1.1f%%",
-                    startangle=90,
-                    textprops={"fontsize": 8}
-                )
-                ax2.set_title(f"Meal Breakdown ({date})")
-                pdf.savefig(fig2)
-                plt.close(fig2)
-                
-                # --- Table of Macronutrients ---
-                fig3, ax3 = plt.subplots(figsize=(10, 6))
-                ax3.axis("off")
-                
-                # Define the wrapping function once
-                def wrap_label_at_space(label, max_width=20):
-                    words = label.split(" ")
-                    lines, current_line = [], ""
-                    for word in words:
-                        if len(current_line) + len(word) + 1 <= max_width:
-                            current_line += (" " if current_line else "") + word
-                        else:
-                            lines.append(current_line)
-                            current_line = word
-                    if current_line:
-                        lines.append(current_line)
-                    return "\n".join(lines)
-                
-                table_data = []
-                cumulative_carbs = cumulative_protein = cumulative_fat = cumulative_total = 0
-                
-                for meal, macros in meal_data.items():
-                    total_cal = macros["Carbs"] + macros["Protein"] + macros["Fat"]
-                    cumulative_carbs += macros["Carbs"]
-                    cumulative_protein += macros["Protein"]
-                    cumulative_fat += macros["Fat"]
-                    cumulative_total += total_cal
-                
-                    # Wrap long meal names at spaces instead of fixed character chunks
-                    wrapped_meal = wrap_label_at_space(meal, max_width=20)
-                
-                    table_data.append([
-                        wrapped_meal,
-                        f"{macros['Carbs']:.0f}",
-                        f"{macros['Protein']:.0f}",
-                        f"{macros['Fat']:.0f}",
-                        f"{total_cal:.0f}"
-                    ])
-                
-                # Add cumulative totals row
                 table_data.append([
-                    "TOTAL",
-                    f"{cumulative_carbs:.0f}",
-                    f"{cumulative_protein:.0f}",
-                    f"{cumulative_fat:.0f}",
-                    f"{cumulative_total:.0f}"
+                    wrapped_meal,
+                    f"{macros['Carbs']:.0f}",
+                    f"{macros['Protein']:.0f}",
+                    f"{macros['Fat']:.0f}",
+                    f"{total_cal:.0f}"
                 ])
-                
-                col_labels = ["Meal/Snack", "Carbs (cal)", "Protein (cal)", "Fat (cal)", "Total (cal)"]
-                
-                table = ax3.table(cellText=table_data, colLabels=col_labels, loc="center")
-                table.auto_set_font_size(False)
-                table.set_fontsize(10)
-                table.scale(1.2, 1.2)
-                
-                # Adjust row heights consistently across all columns
-                for row_idx in range(len(table_data)):
-                    meal_text = table.get_celld()[(row_idx+1, 0)].get_text().get_text()  # +1 because row 0 is header
-                    num_lines = meal_text.count("\n") + 1
-                    row_height = 0.08 * num_lines
-                
-                    for col_idx in range(len(col_labels)):
-                        cell = table.get_celld()[(row_idx+1, col_idx)]
-                        cell.set_height(row_height)
-                
-                # Optionally adjust header row height too
-                for col_idx in range(len(col_labels)):
-                    table.get_celld()[(0, col_idx)].set_height(0.1)
-                
-                ax3.set_title(f"Meal & Snack Macro Table ({date})", pad=20)
-                plt.tight_layout()
-                pdf.savefig(fig3)
-                plt.close(fig3) 
-                
-            # --- Daily Media Pie Charts ---
-            media_counts_by_category = {}
-            media_counts_by_name = {}
             
-            # Filter to duration rows and ensure numeric
-            media_group = group[group["Metric"].str.lower() == "duration"].copy()
-            media_group["Value"] = pd.to_numeric(media_group["Value"], errors="coerce")
+            # Add cumulative totals row
+            table_data.append([
+                "TOTAL",
+                f"{cumulative_carbs:.0f}",
+                f"{cumulative_protein:.0f}",
+                f"{cumulative_fat:.0f}",
+                f"{cumulative_total:.0f}"
+            ])
             
-            # Aggregate by Subtype (the key field for media_dict)
-            for subtype, val in media_group.groupby("Subtype")["Value"].sum().items():
-                if pd.isna(val) or val == 0:
-                    continue
-                name, category = classify_media(subtype, media_dict)
-                if category:
-                    media_counts_by_category[category] = media_counts_by_category.get(category, 0) + float(val)
-                if name:
-                    media_counts_by_name[name] = media_counts_by_name.get(name, 0) + float(val)
+            col_labels = ["Meal/Snack", "Carbs (cal)", "Protein (cal)", "Fat (cal)", "Total (cal)"]
             
-            plot_media_pie(media_counts_by_category, f"Daily Media Breakdown by Category ({date})", pdf)
-            plot_media_pie(media_counts_by_name, f"Daily Media Breakdown by Name ({date})", pdf)
-              
-    # --- Weekly Reports ---
-    weekly_folder = "reports/weekly_reports"
-    os.makedirs(weekly_folder, exist_ok=True)
-    
-    def get_week_start(date_obj):
-        # Ensure week starts on Sunday
-        return date_obj - timedelta(days=(date_obj.weekday() + 1) % 7)
-    
-    grouped_weeks = {}
-    for date_str, day_durations in all_daily_durations.items():
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        week_start = get_week_start(date_obj)
-        week_key = week_start.strftime("%Y-%m-%d")
-        grouped_weeks.setdefault(week_key, {})[date_obj] = day_durations
-    
-    for week_start, week_days in grouped_weeks.items():
-        # Aggregate totals
-        weekly_totals = {}
-        for day, durations in week_days.items():
-            for cat, mins in durations.items():
-                weekly_totals[cat] = weekly_totals.get(cat, 0) + mins
-    
-        # Rank categories by total minutes
-        ranked = sorted(weekly_totals.items(), key=lambda x: x[1], reverse=True)
-        top3 = [c for c, _ in ranked[:4]]
-        mid = [c for c, _ in ranked[4:8]]
-        rest = [c for c, _ in ranked[8:]]
-    
-        def plot_group(categories, ax, title, day_map, monthly=False):
-            """Plot line chart for given categories across days in day_map."""
-            days = sorted(day_map.keys())
-            for cat in categories:
-                y = [day_map.get(day, {}).get(cat, 0) for day in days]
-                ax.plot(days, y, marker="o", label=cat)
-            ax.set_title(title)
-            ax.set_ylabel("Minutes")
-    
-            # Only add legend if something was plotted
-            handles, labels = ax.get_legend_handles_labels()
-            if handles:
-                ax.legend()
-    
-            # Show fewer ticks if many days
-            step = max(1, len(days)//10)
-            ax.set_xticks(days[::step])
-    
-            if monthly:
-                ax.set_xticklabels([d.strftime("%b %d") for d in days[::step]], rotation=45)
-            else:
-                ax.set_xticklabels([d.strftime("%a") for d in days[::step]], rotation=45)
-    
-        # Line charts
-        fig, axes = plt.subplots(3, 1, figsize=(12, 18))
-        plot_group(top3, axes[0], "Top 3 Categories", week_days, monthly=False)
-        plot_group(mid, axes[1], "Ranked 4–8 Categories", week_days, monthly=False)
-        plot_group(rest, axes[2], "Remaining Categories", week_days, monthly=False)
-        plt.tight_layout()
-    
-        pdf_path = os.path.join(weekly_folder, f"weekly_report_{week_start}.pdf")
-        with PdfPages(pdf_path) as pdf:
-            pdf.savefig(fig)
-            plt.close(fig)
-    
-            # --- Weekly Pie Chart ---
-            fig_pie, ax_pie = plt.subplots(figsize=(8, 8))
-            ax_pie.pie(
-                weekly_totals.values(),
-                labels=weekly_totals.keys(),
-                autopct="%1.1f%%",
-                startangle=90,
-                textprops={"fontsize": 8}
-            )
-            ax_pie.set_title(f"Weekly Activity Breakdown (Week of {week_start})")
-            pdf.savefig(fig_pie)
-            plt.close(fig_pie)
+            table = ax3.table(cellText=table_data, colLabels=col_labels, loc="center")
+            table.auto_set_font_size(False)
+            table.set_fontsize(10)
+            table.scale(1.2, 1.2)
             
-            # --- Weekly Media Pie Charts ---
-            weekly_media_counts_by_category = {}
-            weekly_media_counts_by_name = {}
+            # Adjust row heights consistently across all columns
+            for row_idx in range(len(table_data)):
+                meal_text = table.get_celld()[(row_idx+1, 0)].get_text().get_text()  # +1 because row 0 is header
+                num_lines = meal_text.count("\n") + 1
+                row_height = 0.08 * num_lines
             
-            # Collect rows belonging to the week and filter to duration
-            week_group = master_df[master_df["Date"].dt.date.isin(week_days.keys())].copy()
-            week_group = week_group[week_group["Metric"].str.lower() == "duration"]
-            week_group["Value"] = pd.to_numeric(week_group["Value"], errors="coerce")
+                for col_idx in range(len(col_labels)):
+                    cell = table.get_celld()[(row_idx+1, col_idx)]
+                    cell.set_height(row_height)
             
-            for subtype, val in week_group.groupby("Subtype")["Value"].sum().items():
-                if pd.isna(val) or val == 0:
-                    continue
-                name, category = classify_media(subtype, media_dict)
-                if category:
-                    weekly_media_counts_by_category[category] = weekly_media_counts_by_category.get(category, 0) + float(val)
-                if name:
-                    weekly_media_counts_by_name[name] = weekly_media_counts_by_name.get(name, 0) + float(val)
+            # Optionally adjust header row height too
+            for col_idx in range(len(col_labels)):
+                table.get_celld()[(0, col_idx)].set_height(0.1)
             
-            plot_media_pie(weekly_media_counts_by_category, f"Weekly Media Breakdown by Category (Week of {week_start})", pdf)
-            plot_media_pie(weekly_media_counts_by_name, f"Weekly Media Breakdown by Name (Week of {week_start})", pdf)
+            ax3.set_title(f"Meal & Snack Macro Table ({date})", pad=20)
+            plt.tight_layout()
+            pdf.savefig(fig3)
+            plt.close(fig3) 
             
-    # --- Monthly Reports ---
-    monthly_dir = "reports/monthly_reports"
-    os.makedirs(monthly_dir, exist_ok=True)
-    
-    def get_month_start(date, start_day=9):
-        if not (1 <= start_day <= 28):
-            raise ValueError("start_day must be between 1 and 28")
-    
-        # If the day of the month is >= start_day, month start is this month's start_day
-        if date.day >= start_day:
-            return date.replace(day=start_day)
-        else:
-            # Otherwise, month start is the previous month's start_day
-            prev_month = date.month - 1 or 12
-            prev_year = date.year if date.month > 1 else date.year - 1
-            return date.replace(year=prev_year, month=prev_month, day=start_day)
-    
-    grouped_months = {}
-    for date_str, day_durations in all_daily_durations.items():
-        date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-        month_start = get_month_start(date_obj)
-        month_key = month_start.strftime("%Y-%m-%d")
-        grouped_months.setdefault(month_key, {})[date_obj] = day_durations
-    
-    for month_start, month_days in grouped_months.items():
-        monthly_totals = {}
-        for day, durations in month_days.items():
-            for cat, mins in durations.items():
-                monthly_totals[cat] = monthly_totals.get(cat, 0) + mins
-    
-        ranked = sorted(monthly_totals.items(), key=lambda x: x[1], reverse=True)
-        top3 = [c for c, _ in ranked[:4]]
-        mid = [c for c, _ in ranked[4:8]]
-        rest = [c for c, _ in ranked[8:]]
+        # --- Daily Media Pie Charts ---
+        plot_media_pie(media_by_category, f"Daily Media Breakdown by Category ({date})", pdf)
+        plot_media_pie(media_by_name, f"Daily Media Breakdown by Name ({date})", pdf)
+
+PERIOD_LABELS = {
+    "weekly": ("Weekly", "Week of"),
+    "monthly": ("Monthly", "Starting"),
+}
+
+def plot_group(categories, ax, title, day_map, monthly=False):
+    """Plot line chart for given categories across days in day_map."""
+    days = sorted(day_map.keys())
+    for cat in categories:
+        y = [day_map.get(day, {}).get(cat, 0) for day in days]
+        ax.plot(days, y, marker="o", label=cat)
+    ax.set_title(title)
+    ax.set_ylabel("Minutes")
+
+    # Only add legend if something was plotted
+    handles, labels = ax.get_legend_handles_labels()
+    if handles:
+        ax.legend()
+
+    # Show fewer ticks if many days
+    step = max(1, len(days)//10)
+    ax.set_xticks(days[::step])
+
+    if monthly:
+        ax.set_xticklabels([d.strftime("%b %d") for d in days[::step]], rotation=45)
+    else:
+        ax.set_xticklabels([d.strftime("%a") for d in days[::step]], rotation=45)
+
+def render_period_report(pdf_path, period, start, period_days, totals, media_by_category, media_by_name):
+    """A weekly or monthly PDF: ranked line charts, activity pie, media pies."""
+    label, prefix = PERIOD_LABELS[period]
+    monthly = period == "monthly"
+
+    # Rank categories by total minutes
+    ranked = sorted(totals.items(), key=lambda x: x[1], reverse=True)
+    top3 = [c for c, _ in ranked[:4]]
+    mid = [c for c, _ in ranked[4:8]]
+    rest = [c for c, _ in ranked[8:]]
+
+    # Line charts
+    fig, axes = plt.subplots(3, 1, figsize=(12, 18))
+    plot_group(top3, axes[0], "Top 3 Categories", period_days, monthly=monthly)
+    plot_group(mid, axes[1], "Ranked 4–8 Categories", period_days, monthly=monthly)
+    plot_group(rest, axes[2], "Remaining Categories", period_days, monthly=monthly)
+    plt.tight_layout()
+
+    with _atomic_pdf(pdf_path) as pdf:
+        pdf.savefig(fig)
+        plt.close(fig)
+
+        # Pie chart
+        fig_pie, ax_pie = plt.subplots(figsize=(8, 8))
+        ax_pie.pie(
+            totals.values(),
+            labels=totals.keys(),
+            autopct="%1.1f%%",
+            startangle=90,
+            textprops={"fontsize": 8}
+        )
+        ax_pie.set_title(f"{label} Activity Breakdown ({prefix} {start})")
+        pdf.savefig(fig_pie)
+        plt.close(fig_pie)
+
+        # --- Media Pie Charts ---
+        plot_media_pie(media_by_category, f"{label} Media Breakdown by Category ({prefix} {start})", pdf)
+        plot_media_pie(media_by_name, f"{label} Media Breakdown by Name ({prefix} {start})", pdf)
+
+# --- Render scheduling ---
+
+def _init_worker():
+    # Workers only ever write PDFs; never start a GUI backend there
+    matplotlib.use("Agg")
+
+def run_render_jobs(render_jobs, manifest, jobs=1, progress=None, cancelled=None):
+    """Render every job, in a process pool when jobs > 1, and record each one that finishes.
+
+    progress(stage, done, total) is called as jobs finish; once cancelled()
+    returns true no further job starts. Returns how many jobs were left unrendered.
+    """
+    progress = progress or (lambda stage, done, total: None)
+    cancelled = cancelled or (lambda: False)
+    done = 0
+    progress("reports", done, len(render_jobs))
+    try:
+        if jobs <= 1 or len(render_jobs) <= 1:
+            for pdf_path, digest, render, args in render_jobs:
+                if cancelled():
+                    break
+                render(*args)
+                manifest.record(pdf_path, digest)
+                done += 1
+                progress("reports", done, len(render_jobs))
+            return len(render_jobs) - done
+
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+            futures = [(pdf_path, digest, executor.submit(render, *args)) for pdf_path, digest, render, args in render_jobs]
+            errors = []
+            for pdf_path, digest, future in futures:
+                if cancelled():
+                    # Jobs already running finish; queued ones never start
+                    executor.shutdown(wait=True, cancel_futures=True)
+                if future.cancelled():
+                    continue
+                try:
+                    future.result()
+                    manifest.record(pdf_path, digest)
+                    done += 1
+                    progress("reports", done, len(render_jobs))
+                except Exception as e:
+                    errors.append(f"{pdf_path}: {type(e).__name__}: {e}")
+            if errors:
+                raise RuntimeError("Rendering failed for:\n" + "\n".join(errors))
+        return len(render_jobs) - done
+    finally:
+        # Whatever did render is kept, so a rerun only retries the rest
+        manifest.save()
+
+def visualize_reports(master_df, backend=None, force=False, jobs=1, levels=REPORT_LEVELS, since=None, until=None,
+                      progress=None, cancelled=None):
+    """Render the daily/weekly/monthly PDFs whose input rows changed (all of them with force=True).
+
+    jobs > 1 renders the reports in that many worker processes. levels picks
+    which of REPORT_LEVELS to render; since/until (dates, inclusive) limit it
+    to the reports covering those days. progress/cancelled are passed on to
+    run_render_jobs. Returns the seconds spent per stage.
+    """
+    started = time.perf_counter()
     
-        # Line charts
-        fig, axes = plt.subplots(3, 1, figsize=(12, 18))
-        plot_group(top3, axes[0], "Top 3 Categories", month_days, monthly=True)
-        plot_group(mid, axes[1], "Ranked 4–8 Categories", month_days, monthly=True)
-        plot_group(rest, axes[2], "Remaining Categories", month_days, monthly=True)
-        plt.tight_layout()
+    output_dir="reports/daily_reports"
+    os.makedirs(output_dir, exist_ok=True)
     
-        pdf_path = os.path.join(monthly_dir, f"monthly_report_{month_start}.pdf")
-        with PdfPages(pdf_path) as pdf:
-            pdf.savefig(fig)
-            plt.close(fig)
+    backend = backend or get_backend()
+
+    # A plain read_csv frame still works; it's typed once here instead of per group
+    if "value_num" not in master_df.columns:
+        master_df = typed_master(master_df)
+
+    # Explicit durations per day and source, when the backend can aggregate them itself
+    duration_totals = backend.duration_totals()
     
-            # Pie chart
-            fig_pie, ax_pie = plt.subplots(figsize=(8, 8))
-            ax_pie.pie(
-                monthly_totals.values(),
-                labels=monthly_totals.keys(),
-                autopct="%1.1f%%",
-                startangle=90,
-                textprops={"fontsize": 8}
-            )
-            ax_pie.set_title(f"Monthly Activity Breakdown (Starting {month_start})")
-            pdf.savefig(fig_pie)
-            plt.close(fig_pie)
-            
-            # --- Monthly Media Pie Charts ---
-            monthly_media_counts_by_category = {}
-            monthly_media_counts_by_name = {}
-            
-            # Collect rows for the month and filter to duration
-            month_group = master_df[master_df["Date"].dt.date.isin(month_days.keys())].copy()
-            month_group = month_group[month_group["Metric"].str.lower() == "duration"]
-            month_group["Value"] = pd.to_numeric(month_group["Value"], errors="coerce")
-            
-            for subtype, val in month_group.groupby("Subtype")["Value"].sum().items():
-                if pd.isna(val) or val == 0:
-                    continue
-                name, category = classify_media(subtype, media_dict)
-                if category:
-                    monthly_media_counts_by_category[category] = monthly_media_counts_by_category.get(category, 0) + float(val)
-                if name:
-                    monthly_media_counts_by_name[name] = monthly_media_counts_by_name.get(name, 0) + float(val)
-            
-            plot_media_pie(monthly_media_counts_by_category, f"Monthly Media Breakdown by Category (Starting {month_start})", pdf)
-            plot_media_pie(monthly_media_counts_by_name, f"Monthly Media Breakdown by Name (Starting {month_start})", pdf)
+    # Each report's input hash: daily from its own rows, weekly/monthly from their days'
+    manifest = ReportManifest(force=force)
+    row_hashes = pd.util.hash_pandas_object(master_df, index=False)
+    dates = master_df["Date"].dt.date
+    day_hashes = {day: _rows_hash(row_hashes, index) for day, index in master_df.groupby(dates).groups.items()}
+    # (pdf path, input hash, render function, its arguments); rendered together at the end
+    render_jobs = []
+
+    aggregates = DailyAggregates(master_df, duration_totals)
+    all_daily_durations = {day: aggregates.day_durations(day) for day in aggregates.days}
+    in_range = [
+        day for day in aggregates.days
+        if (since is None or day >= since) and (until is None or day <= until)
+    ]
+
+    # --- Daily Reports ---
+    is_meal = master_df["Category"].astype(object).str.lower().isin(["meals", "snacks"])
+    meal_rows = dict(list(master_df[is_meal].groupby(dates[is_meal])))
+    for day in in_range if "daily" in levels else []:
+        pdf_path = os.path.join(output_dir, f"daily_report_{day}.pdf")
+        if manifest.needs(pdf_path, day_hashes[day]):
+            meals = meal_rows.get(day, master_df.iloc[:0])
+            args = (pdf_path, day, all_daily_durations[day], meals, *aggregates.media_totals([day]))
+            render_jobs.append((pdf_path, day_hashes[day], render_daily_report, args))
+
+    # --- Weekly and Monthly Reports ---
+    periods = [
+        ("weekly", "reports/weekly_reports", "weekly_report", get_week_start),
+        ("monthly", "reports/monthly_reports", "monthly_report", get_month_start),
+    ]
+    for period, folder, prefix, period_start in periods:
+        if period not in levels:
+            continue
+        os.makedirs(folder, exist_ok=True)
+        grouped = {}
+        for day in aggregates.days:
+            grouped.setdefault(period_start(day).strftime("%Y-%m-%d"), []).append(day)
+        # A period is in range when any of its days is
+        wanted = {period_start(day).strftime("%Y-%m-%d") for day in in_range}
+
+        for start, days in grouped.items():
+            if start not in wanted:
+                continue
+            pdf_path = os.path.join(folder, f"{prefix}_{start}.pdf")
+            period_hash = _combined_hash(day_hashes, days)
+            if not manifest.needs(pdf_path, period_hash):
+                continue
+            period_days = {day: all_daily_durations[day] for day in days}
+            args = (pdf_path, period, start, period_days, aggregates.period_durations(days), *aggregates.media_totals(days))
+            render_jobs.append((pdf_path, period_hash, render_period_report, args))
 
+    prepared = time.perf_counter()
+    left = run_render_jobs(render_jobs, manifest, jobs, progress, cancelled)
+    print(f"Reports: {manifest.rendered} rendered, {manifest.skipped} unchanged" + (f", {left} cancelled" if left else ""))
+    return {"aggregate": prepared - started, "render": time.perf_counter() - prepared}
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render reports from the consolidated master log")
+    parser.add_argument("--force", action="store_true", help="re-render every report, not just changed ones")
+    parser.add_argument("--jobs", type=int, default=1, help="render in N worker processes")
+    args = parser.parse_args()
+    visualize_reports(load_master(), force=args.force, jobs=args.jobs)
@@ -0,0 +1,344 @@
+from windows.forms import FormWindow, field, repeat, group, optional, values, checklist
+
+# One schema per category window (see windows/forms.py for the format).
+# "category" is the name passed to the callback, i.e. the data/window_data folder.
+
+# Shared by the compact windows (Coding Projects, Career Prep)
+COMPACT = {
+    "pad": (10, 5), "title_size": 16, "row_label": (12, 2), "label_size": 12, "entry_size": 12, "padx": 2,
+    "submit": {"size": 12, "bg": "#FF9800", "active_bg": "#FB8C00", "height": 1},
+    "buttons": {"pad": (10, 5), "size": 12, "width": 16, "height": 1, "add_bg": "#4CAF50", "add_active": "#388E3C"},
+}
+# Messages of the windows that name the row first ("Meal A 'carbs' must be a whole number.")
+ROW_FIRST = {"int": ("Invalid Input", "{label} '{key}' must be a whole number.")}
+
+WORK_DAY = {
+    "category": "Work Day", "title": "Work Day Tracker", "header": "Work Day Summary",
+    "style": {"submit": {"bg": "#FFEB3B", "active_bg": "#FBC02D"}},
+    "sections": [
+        repeat("Block", [
+            field("type", "Type", 14),          # e.g., "Meetings", "Projects"
+            field("duration", "Duration", 4, "int"),
+            field("notes", "Notes", 16),
+        ], add="Add Work Block", remove="Remove Last Block"),
+    ],
+}
+
+COOKING = {
+    "category": "Cooking", "title": "Cooking Tracker", "header": "Cooking Session",
+    "style": {"layout": "stacked", "submit": {"size": 16, "bg": "#FF9800", "active_bg": "#F57C00"}},
+    "sections": [
+        values([
+            field("minutes", "Minutes spent cooking:", kind="int", strip=False,
+                  error=("Invalid Input", "Please enter cooking time in whole minutes.")),
+            field("meal", "What meal did you make?", kind="required",
+                  error=("Missing Meal", "Please enter the name of the meal you made.")),
+        ]),
+    ],
+}
+
+MUSCLE_FIELDS = [
+    field("exercises", "Exercises", 8, "int"),
+    field("sets", "Sets", 8, "int"),
+    field("rep_min", "Rep Min", 8, "int"),
+    field("rep_max", "Rep Max", 8, "int"),
+]
+CARDIO_FIELDS = [field("distance", "Distance (m)", 8, "int")]
+
+WORKOUTS = {
+    "category": "Workouts", "title": "Workout Tracker", "header": "Workout Summary",
+    "style": {"label_size": 12, "entry_size": 12},
+    "sections": [
+        checklist(
+            [(name, MUSCLE_FIELDS) for name in ["Chest", "Back", "Shoulders", "Legs", "Triceps", "Biceps", "Abs"]]
+            + [(name, CARDIO_FIELDS) for name in ["Running", "Swimming"]]
+            + [("Sport", [
+                field("duration", "Duration", 8, "int"),
+                field("type", "Sport", 8, "required", error=("Missing Input", "Please enter the type of sport.")),
+            ])]
+        ),
+    ],
+}
+
+LEARNING_SUBJECTS = [
+    "Philosophy", "Art", "Mathematics", "Physics", "Chemistry", "Biology",
+    "Psychology", "Computer Science", "Business/Finance", "Economics", "Politics"
+]
+
+LEARNING = {
+    "category": "Learning", "title": "Learning Tracker", "header": "Learning Summary",
+    "style": {"row_label": (13, 5), "label_size": 13, "entry_size": 12,
+              "submit": {"bg": "#2196F3", "active_bg": "#1976D2"}},
+    "sections": [
+        repeat("Subject", [
+            field("subject", "Subject", kind="choice", choices=LEARNING_SUBJECTS),
+            field("duration", "Duration", 3, "int"),
+            field("topic", "Topic", 9, "required"),
+            field("concept", "Learned", 16, "required"),
+        ]),
+    ],
+}
+
+DRIVING = {
+    "category": "Driving", "title": "Driving Tracker", "header": "Driving Summary",
+    "style": {"submit": {"bg": "#FF5722", "active_bg": "#E64A19"},
+              "buttons": {"width": 14, "add_bg": "#2196F3", "add_active": "#1976D2"}},
+    "sections": [
+        repeat("Drive", [
+            field("purpose", "Purpose", 10),
+            field("destination", "Destination", 8),
+            field("duration", "Duration", 4, "int"),
+            field("distance", "Distance", 4, "int"),
+        ]),
+    ],
+}
+
+LEETCODE = {
+    "category": "Leetcode", "title": "Leetcode Tracker", "header": "Leetcode Summary",
+    "style": {"label_size": 13, "entry_size": 12, "padx": 2,
+              "submit": {"bg": "#FF9800", "active_bg": "#FB8C00"},
+              "buttons": {"width": 16, "add_bg": "#4CAF50", "add_active": "#388E3C"}},
+    "sections": [
+        repeat("Problem", [
+            field("number", "#", 4),
+            field("name", "Name", 14),
+            field("difficulty", "Difficulty", 4),
+            field("duration", "Time", 3, "int"),
+            field("concept", "Concept(s)", 14),
+        ]),
+    ],
+}
+
+CODING_PROJECTS = {
+    "category": "Coding Projects", "title": "Coding Projects Tracker", "header": "Coding Projects Summary",
+    "style": COMPACT,
+    "sections": [
+        repeat("Project", [
+            field("name", "Name", 20),
+            field("duration", "Time", 3, "int"),
+            field("changes", "Change(s)", 16),
+            field("fixes", "Fix(s)", 16),
+        ]),
+    ],
+}
+
+CAREER_PREP = {
+    "category": "Career Prep", "title": "Career Prep Tracker", "header": "Career Prep Summary",
+    "style": COMPACT,
+    "sections": [
+        repeat("Interview", [
+            field("title", "Title", 12),
+            field("pay_range", "Pay Range", 10),
+            field("duration", "Duration", 4, "int"),
+            field("link", "Link", 16),
+        ]),
+        # Rows 100+ sort below the interviews; the checkboxes sit under the date picker
+        optional("Resume", [
+            field("duration", "Duration", 6, "int", error=("Invalid Input", "Resume duration must be a whole number.")),
+            field("file_name", "File Name", 14),
+        ], row=100),
+        optional("LinkedIn", [
+            field("duration", "Duration", 6, "int", error=("Invalid Input", "LinkedIn duration must be a whole number.")),
+            field("last_activity", "Last Activity", 12),
+        ], row=101),
+        values([
+            field("count", "# Applications", 6, "int",
+                  error=("Invalid Input", "Number of job applications must be a whole number.")),
+        ], key="Applications", row=999, column=3, pady=10, sticky=True),
+    ],
+}
+
+MISCELLANEOUS = {
+    "category": "Miscellaneous", "title": "Miscellaneous Tracker", "header": "Miscellaneous Summary",
+    "style": {"date_first": True,
+              "submit": {"bg": "#FFF9C4", "active_bg": "#F0F4C3", "active_fg": "darkgreen", "width": None},
+              "buttons": {"layout": "row", "pad": (5, 5), "width": None}},
+    "messages": ROW_FIRST,
+    "sections": [
+        values([
+            field(label, label, 5, "int", error=("Invalid Input", "{label} must be a whole number."))
+            for label in ["Teeth Brushed", "Showers", "Liters of Water Drank"]
+        ], key="Fixed"),
+        repeat("Drug", [
+            field("name", "Name", 12),
+            field("dosage", "Dosage", 4),
+            field("notes", "Notes", 12),
+        ], key="Drugs", row=10, add=("+ Drug", "#FFAB91", "blue"), remove=("- Drug", "#FF8A65", "red")),
+        repeat("Other", [
+            field("description", "Description", 12),
+            field("duration", "Duration", 4, "int"),
+            field("notes", "Notes", 12),
+        ], key="Other", row=100, add=("+ Other", "#B39DDB", "purple"), remove=("- Other", "#CE93D8", "darkred")),
+    ],
+}
+
+SLEEP_FIELDS = [
+    field("start", "Start", 8),
+    field("end", "End", 8),
+    field("duration", "Duration (mins)", 4, "digits"),
+    field("quality", "Quality (1–10)", 3, "digits"),
+]
+
+SLEEP = {
+    "category": "Sleep", "title": "Sleep Tracker", "header": "Sleep Summary",
+    "style": {"title_size": 24, "label_size": 15, "padx": 3,
+              "submit": {"size": 18, "bg": "#E8F5E9", "active_bg": "#C8E6C9", "active_fg": "darkgreen", "width": 14}},
+    "messages": ROW_FIRST,
+    "sections": [
+        group("Main Sleep", SLEEP_FIELDS, row=0, row_label=(14, 5)),
+        optional("Nap", [dict(spec, label="Duration (min)") if spec["key"] == "duration" else spec for spec in SLEEP_FIELDS],
+                 row=2, toggle="Include Nap", toggle_row=1, toggle_size=16, row_label=(15, 3)),
+    ],
+}
+
+MEDITATING = {
+    "category": "Meditating", "title": "Meditation Tracker", "header": "Meditation Summary",
+    "style": {"submit": {"bg": "#8BC34A", "active_bg": "#689F38"}},
+    "sections": [
+        repeat("Meditation", [
+            field("duration", "Duration", 4, "int"),
+            field("reflection", "Reflection", 20),
+            field("music", "Music", 12),
+        ]),
+    ],
+}
+
+MUSIC = {
+    "category": "Music", "title": "Music Tracker", "header": "Music Summary",
+    "style": {"submit": {"bg": "#FFEB3B", "active_bg": "#FBC02D"}},
+    "sections": [
+        repeat("Song", [
+            field("song", "Song", 20, autocomplete=True),
+            field("duration", "Duration", 4, "int"),
+            field("rating", "Rating (1–10)", 4, "int"),
+        ]),
+    ],
+}
+
+GAMING = {
+    "category": "Gaming", "title": "Gaming Tracker", "header": "Gaming Summary",
+    "style": {"row_label": (15, 5), "label_size": 15, "submit": {"bg": "#FF9800", "active_bg": "#FB8C00"}},
+    "sections": [
+        repeat("Game", [
+            field("game", "Game", 11, autocomplete=True),
+            field("duration", "Duration", 4, "int"),
+            field("console", "Console", 7),
+            field("rating", "Rating (1–10)", 4, "int"),
+        ]),
+    ],
+}
+
+MESSAGING_CALLING = {
+    "category": "Messaging_Calling", "title": "Texting/Calling Tracker", "header": "Texting/Calling Summary",
+    "style": {"submit": {"bg": "#AED581", "active_bg": "#8BC34A"}},
+    "sections": [
+        repeat("Person", [
+            field("person", "Person", 12, autocomplete=True),
+            field("duration", "Duration", 4, "int"),
+            field("context", "Context", 20),
+        ]),
+    ],
+}
+
+SOCIALIZING = {
+    "category": "Socializing", "title": "Socializing Tracker", "header": "Socializing Summary",
+    "style": {"submit": {"bg": "#FFEB3B", "active_bg": "#FBC02D"}},
+    "sections": [
+        repeat("Plan", [
+            field("friends", "Friend(s)", 14, autocomplete=True),
+            field("duration", "Duration", 4, "int"),
+            field("activity", "Activity", 16),
+        ]),
+    ],
+}
+
+EATING_FIELDS = [
+    field("type", "Type", 10, autocomplete=True),
+    field("carbs", "Carbs", 5, "int"),
+    field("fats", "Fats", 5, "int"),
+    field("proteins", "Proteins", 5, "int"),
+]
+
+EATING = {
+    "category": "Eating", "title": "Eating Tracker", "header": "Eating Summary",
+    "style": {"submit": {"bg": "#C8E6C9", "active_bg": "#A5D6A7", "active_fg": "darkgreen", "width": 14},
+              "buttons": {"layout": "row", "width": 16, "padx": 5}},
+    "messages": ROW_FIRST,
+    "sections": [
+        repeat("Meal", EATING_FIELDS, key="Meals", add=("Add Meal", "#FFCC80", "blue"), remove=("Remove Meal", "#FF8A65", "red")),
+        repeat("Snack", EATING_FIELDS, key="Snacks", row=100,
+               add=("Add Snack", "#B39DDB", "purple"), remove=("Remove Snack", "#CE93D8", "darkred")),
+    ],
+}
+
+MEDIA_FIELDS = [
+    field("title", "Title", 20, autocomplete=True),
+    field("duration", "Duration", 5, "int"),
+    field("rating", "Rating (1–100)", 5, "int", range=(1, 100)),
+]
+
+MEDIA = {
+    "category": "Media", "title": "Media Tracker", "header": "Media Summary",
+    "style": {"date_first": True,
+              "submit": {"bg": "#FFF176", "active_bg": "#FDD835", "active_fg": "darkgreen", "width": None},
+              "buttons": {"layout": "row", "pad": (5, 5), "width": None}},
+    "messages": ROW_FIRST,
+    "sections": [
+        repeat("YouTube", MEDIA_FIELDS, key="YouTube", add=("+ YouTube", "#FF8A65", "blue"), remove=("- YouTube", "#FF7043", "red")),
+        repeat("Anime", MEDIA_FIELDS, key="Anime", row=100,
+               add=("+ Anime", "#CE93D8", "purple"), remove=("- Anime", "#BA68C8", "darkred")),
+        repeat("Series", MEDIA_FIELDS, key="Series", row=200,
+               add=("+ Series", "#90CAF9", "navy"), remove=("- Series", "#64B5F6", "darkblue")),
+    ],
+}
+
+class WorkDayWindow(FormWindow):
+    schema = WORK_DAY
+
+class CookingWindow(FormWindow):
+    schema = COOKING
+
+class WorkoutsWindow(FormWindow):
+    schema = WORKOUTS
+
+class LearningWindow(FormWindow):
+    schema = LEARNING
+
+class DrivingWindow(FormWindow):
+    schema = DRIVING
+
+class LeetcodeWindow(FormWindow):
+    schema = LEETCODE
+
+class CodingProjectsWindow(FormWindow):
+    schema = CODING_PROJECTS
+
+class CareerPrepWindow(FormWindow):
+    schema = CAREER_PREP
+
+class MiscellaneousWindow(FormWindow):
+    schema = MISCELLANEOUS
+
+class SleepWindow(FormWindow):
+    schema = SLEEP
+
+class MeditatingWindow(FormWindow):
+    schema = MEDITATING
+
+class MusicWindow(FormWindow):
+    schema = MUSIC
+
+class GamingWindow(FormWindow):
+    schema = GAMING
+
+class TextingCallingWindow(FormWindow):
+    schema = MESSAGING_CALLING
+
+class SocializingWindow(FormWindow):
+    schema = SOCIALIZING
+
+class EatingWindow(FormWindow):
+    schema = EATING
+
+class MediaWindow(FormWindow):
+    schema = MEDIA
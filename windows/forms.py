@@ -0,0 +1,824 @@
+from tkcalendar import DateEntry
+from datetime import date
+import re
+import tkinter as tk
+from tkinter import messagebox
+from drafts import DRAFTS
+from history import HISTORY
+
+# Every category window is a schema rendered by FormWindow:
+#   {"category": callback name, "title": window title, "header": header text,
+#    "style": overrides of STYLE, "messages": overrides of MESSAGES,
+#    "sections": [...]}
+# Sections are built by the helpers below and fill `result` in list order,
+# which is also the order their fields are validated in.
+
+STYLE = {
+    "layout": "grid",       # "grid" (header with SUBMIT on the right) or "stacked" (one centered column)
+    "pad": (20, 10),        # padx, pady of the header, grid and optional-checkbox frames
+    "title_size": 20,
+    "row_label": (16, 5),   # bold font size, padx of row labels ("Song A")
+    "label_size": 16,
+    "entry_size": 14,
+    "padx": 5,
+    "visible_rows": 6,      # repeated rows in view before a section scrolls
+    "date_first": False,    # date picker above the grid instead of below the buttons
+    "check_size": 14,       # checklist checkboxes
+    "submit": {"size": 14, "bg": "#4CAF50", "active_bg": "#388E3C", "active_fg": "white", "width": 12, "height": 2},
+    "prefill": {"size": 12, "bg": "#E0E0E0", "active_bg": "#BDBDBD", "width": 10},   # fills the form from the last entry
+    "buttons": {"layout": "pair", "pad": (20, 10), "size": 14, "width": 18, "height": 2, "padx": 3,
+                "add_bg": "#03A9F4", "add_active": "#0288D1"},
+}
+
+# (messagebox title, text); formatted with label (the row, group or field label), key, min and max
+MESSAGES = {
+    "int": ("Invalid Input", "Please enter a whole number for '{label} - {key}'."),
+    "range": ("Invalid Input", "{label} '{key}' must be a number from {min} to {max}."),
+    "required": ("Missing Input", "Please fill in '{label} - {key}'."),
+}
+
+FIELD_KINDS = ("text", "required", "int", "digits", "choice")
+
+# Quiet time after an edit before the window's fields are journaled as a draft
+DRAFT_DELAY_MS = 400
+
+def field(key, label, width=None, kind="text", **options):
+    """One input. kind is "text" (blank -> "N/A"), "required", "int", "digits"
+    (checked like int but kept as text) or "choice" (options["choices"]).
+
+    options: range=(min, max) for int, error=(title, text) to override the
+    schema's message, strip=False to validate the raw text, autocomplete=True
+    to suggest the field's past values while typing (in repeat sections).
+    """
+    if kind not in FIELD_KINDS:
+        raise ValueError(f"{key}: kind must be one of {FIELD_KINDS}, not {kind!r}")
+    return dict(options, key=key, label=label, width=width, kind=kind)
+
+def repeat(prefix, fields, key=None, row=0, add=None, remove=None, initial=1):
+    """Rows labelled "<prefix> A", "<prefix> B", ... added and removed by buttons.
+
+    Each row's values go into result["<prefix> A"], or result[key]["<prefix> A"]
+    when key is given. add/remove are button texts, or (text, bg, fg) tuples.
+    """
+    return {"kind": "repeat", "prefix": prefix, "fields": fields, "key": key, "row": row,
+            "add": add or f"Add Another {prefix}", "remove": remove or f"Remove Last {prefix}", "initial": initial}
+
+def group(label, fields, row=0, row_label=None):
+    """A single fixed row whose values go into result[label]."""
+    return {"kind": "group", "label": label, "fields": fields, "row": row, "row_label": row_label}
+
+def optional(label, fields, row, toggle=None, toggle_row=None, toggle_size=None, row_label=None):
+    """A row shown by a checkbox; result[label] is only filled while it is checked.
+
+    The checkbox sits in the grid at toggle_row, or in a frame below the date
+    picker when toggle_row is None.
+    """
+    return {"kind": "optional", "label": label, "fields": fields, "row": row, "toggle": toggle or label,
+            "toggle_row": toggle_row, "toggle_size": toggle_size, "row_label": row_label}
+
+def values(fields, key=None, row=0, column=0, pady=0, sticky=False):
+    """Plain fields, one per grid row, straight into result (or result[key]) by field key."""
+    return {"kind": "values", "fields": fields, "key": key, "row": row, "column": column, "pady": pady, "sticky": sticky}
+
+def checklist(items):
+    """A checkbox per (name, fields) item; checked items fill result[name] with their fields."""
+    return {"kind": "checklist", "items": items}
+
+class InvalidInput(Exception):
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+        self.message = message
+
+def _validator(spec, messages):
+    # Turn a field spec into validate(raw, label) -> stored value, raising InvalidInput
+    kind = spec["kind"]
+    strip = spec.get("strip", True)
+    bounds = spec.get("range")
+    if kind == "choice":
+        return lambda raw, label: raw
+    if kind == "text":
+        return lambda raw, label: (raw.strip() if strip else raw) or "N/A"
+
+    title, template = spec.get("error") or messages["range" if bounds else "int" if kind in ("int", "digits") else "required"]
+    key = spec["key"]
+
+    def fail(label):
+        low, high = bounds or (None, None)
+        raise InvalidInput(title, template.format(label=label, key=key, min=low, max=high))
+
+    if kind == "required":
+        def validate(raw, label):
+            value = raw.strip() if strip else raw
+            if not value:
+                fail(label)
+            return value
+    else:
+        def validate(raw, label):
+            value = raw.strip() if strip else raw
+            if not value.isdigit() or (bounds and not bounds[0] <= int(value) <= bounds[1]):
+                fail(label)
+            return int(value) if kind == "int" else value
+    return validate
+
+class CompiledForm:
+    """A schema with its style merged, fonts built and validators compiled; shared by every window opened for it."""
+
+    def __init__(self, schema):
+        self.schema = schema
+        style = dict(STYLE, **schema.get("style", {}))
+        style["submit"] = dict(STYLE["submit"], **schema.get("style", {}).get("submit", {}))
+        style["buttons"] = dict(STYLE["buttons"], **schema.get("style", {}).get("buttons", {}))
+        style["prefill"] = dict(STYLE["prefill"], **schema.get("style", {}).get("prefill", {}))
+        self.style = style
+        messages = dict(MESSAGES, **schema.get("messages", {}))
+
+        # Row labels get a fixed width so the rows of every section line up in columns
+        self.row_label_width = max((len(section["prefix"]) + 2 for section in schema["sections"] if section["kind"] == "repeat"),
+                                   default=None)
+        self.title_font = ("Helvetica", style["title_size"], "bold")
+        self.row_label_font = ("Helvetica", style["row_label"][0], "bold")
+        self.label_font = ("Helvetica", style["label_size"])
+        self.entry_font = ("Helvetica", style["entry_size"])
+        # Autocomplete fields by id (category, section key or row prefix, field key), with the
+        # pattern of their flat history columns ("Meals - Meal B - type", "Song C - song")
+        self.autocomplete = {}
+        self.autocomplete_fields = []
+        for section in schema["sections"]:
+            if section["kind"] != "repeat":
+                continue
+            for spec in section["fields"]:
+                if spec.get("autocomplete"):
+                    field_id = (schema["category"], section["key"] or section["prefix"], spec["key"])
+                    columns = f"{re.escape(section['prefix'])} . - {re.escape(spec['key'])}"
+                    if section["key"]:
+                        columns = f"{re.escape(section['key'])} - {columns}"
+                    self.autocomplete[field_id] = f"^{columns}$"
+                    self.autocomplete_fields.append((section, spec, field_id))
+
+        self.validators = {}
+        for section in schema["sections"]:
+            field_lists = [fields for _, fields in section["items"]] if section["kind"] == "checklist" else [section["fields"]]
+            for fields in field_lists:
+                for spec in fields:
+                    self.validators[id(spec)] = _validator(spec, messages)
+
+    def read(self, fields, entries, label):
+        """Validated values of one row, in field order."""
+        return {spec["key"]: self.validators[id(spec)](entries[spec["key"]].get(), label) for spec in fields}
+
+_compiled = {}
+
+def compile_schema(schema):
+    key = id(schema)
+    if key not in _compiled:
+        _compiled[key] = CompiledForm(schema)
+    return _compiled[key]
+
+def center_window(top):
+    screen_width = top.winfo_screenwidth()
+    screen_height = top.winfo_screenheight()
+    window_width = screen_width // 2
+    window_height = screen_height // 2
+    x = (screen_width - window_width) // 2
+    y = (screen_height - window_height) // 2
+    top.geometry(f"{window_width}x{window_height}+{x}+{y}")
+
+def date_picker(parent):
+    date_frame = tk.Frame(parent)
+    date_frame.pack(pady=5)
+
+    tk.Label(date_frame, text="Select Date:", font=("Helvetica", 14)).pack(side="left", padx=5)
+
+    picker = DateEntry(
+        date_frame,
+        width=12,
+        font=("Helvetica", 14),
+        background="darkblue",
+        foreground="white",
+        borderwidth=2,
+        year=date.today().year,
+        month=date.today().month,
+        day=date.today().day,
+        date_pattern="yyyy-mm-dd"
+    )
+    picker.pack(side="left", padx=5)
+    return picker
+
+def button(parent, text, command, bg, fg, size=14, width=None, height=2, active_bg=None, active_fg="white", **options):
+    return tk.Button(
+        parent,
+        text=text,
+        font=("Helvetica", size, "bold"),
+        bg=bg,
+        fg=fg,
+        width=width,
+        height=height,
+        relief="raised",
+        bd=5,
+        activebackground=active_bg or bg,
+        activeforeground=active_fg,
+        command=command,
+        **options
+    )
+
+class RowContainer:
+    """The rows of one repeat section, stacked in a scrollable canvas.
+
+    Each row is its own frame at a fixed offset, so adding or removing the last
+    row only touches that row, and a removed row is pooled for the next add
+    instead of being destroyed. Only the rows in view are mapped: scrolling
+    shows and hides the rows entering and leaving the viewport, so a section
+    with 30 rows lays out like one with `visible`.
+    """
+
+    def __init__(self, parent, build_row, visible):
+        # build_row(parent) -> {"frame": Frame, ...}; the frame is placed by the container
+        self.build_row = build_row
+        self.visible = visible
+        self.rows = []
+        self.pool = []
+        self.shown = range(0)
+        self.row_height = None
+        self.scrolling = False
+
+        self.frame = tk.Frame(parent)
+        self.canvas = tk.Canvas(self.frame, highlightthickness=0, width=1, height=1)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self._yview)
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.bind("<Configure>", lambda event: self._refresh())
+        self.frame.bind("<Enter>", self._bind_wheel)
+        self.frame.bind("<Leave>", self._unbind_wheel)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def add(self):
+        if self.pool:
+            row = self.pool.pop()
+        else:
+            row = self.build_row(self.canvas)
+            row["item"] = self.canvas.create_window(0, 0, window=row["frame"], anchor="nw", state="hidden")
+            if self.row_height is None:
+                # Every row of a section has the same widgets, so the first one sizes them all
+                row["frame"].update_idletasks()
+                self.row_height = row["frame"].winfo_reqheight()
+                self.canvas.configure(width=row["frame"].winfo_reqwidth(), yscrollincrement=self.row_height)
+        self.canvas.coords(row["item"], 0, len(self.rows) * self.row_height)
+        self.rows.append(row)
+        self._resize()
+        if len(self.rows) > self.visible:
+            self.canvas.yview_moveto(1.0)
+        self._refresh()
+        return row
+
+    def remove(self):
+        """Hide and pool the last row; returns it (None if there are no rows) so its inputs can be cleared."""
+        if not self.rows:
+            return None
+        row = self.rows.pop()
+        self.canvas.itemconfigure(row["item"], state="hidden")
+        self.pool.append(row)
+        self._resize()
+        self._refresh()
+        return row
+
+    def _resize(self):
+        count = len(self.rows)
+        height = self.row_height or 0
+        self.canvas.configure(height=max(min(count, self.visible) * height, 1),
+                              scrollregion=(0, 0, self.canvas.cget("width"), count * height))
+        if (count > self.visible) != self.scrolling:
+            self.scrolling = not self.scrolling
+            if self.scrolling:
+                self.scrollbar.pack(side="right", fill="y")
+            else:
+                self.scrollbar.pack_forget()
+
+    def _refresh(self):
+        # Map the rows overlapping the viewport, unmap the ones that left it
+        if not self.row_height:
+            return
+        # Clamped like the canvas's own confine, which may not have caught up with a shrunk scrollregion yet
+        first = min(int(self.canvas.canvasy(0)) // self.row_height, len(self.rows) - self.visible)
+        first = max(first, 0)
+        shown = range(first, min(first + self.visible + 1, len(self.rows)))
+        for i in self.shown:
+            if i not in shown and i < len(self.rows):
+                self.canvas.itemconfigure(self.rows[i]["item"], state="hidden")
+        for i in shown:
+            if i not in self.shown:
+                self.canvas.itemconfigure(self.rows[i]["item"], state="normal")
+        self.shown = shown
+
+    def _yview(self, *args):
+        self.canvas.yview(*args)
+        self._refresh()
+
+    def _wheel(self, event):
+        if not self.scrolling:
+            return
+        step = -1 if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0 else 1
+        self._yview("scroll", step, "units")
+
+    def _bind_wheel(self, event):
+        # Windows/macOS send <MouseWheel>, X11 sends buttons 4 and 5
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind_all(sequence, self._wheel)
+
+    def _unbind_wheel(self, event):
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.unbind_all(sequence)
+
+class AutocompleteEntry(tk.Entry):
+    """An Entry listing suggest(text)'s completions under itself while typing.
+
+    Up/Down move through the list, Return or a click takes the highlighted
+    one, Escape or leaving the field closes it.
+    """
+
+    KEYS_IGNORED = {"Up", "Down", "Return", "KP_Enter", "Escape", "Tab", "Shift_L", "Shift_R",
+                    "Control_L", "Control_R", "Alt_L", "Alt_R", "Left", "Right", "Home", "End"}
+
+    def __init__(self, parent, suggest, **options):
+        super().__init__(parent, **options)
+        self.suggest = suggest
+        self.listbox = None
+        self.bind("<KeyRelease>", self._typed)
+        self.bind("<Down>", lambda event: self._move(1))
+        self.bind("<Up>", lambda event: self._move(-1))
+        self.bind("<Return>", self._accept)
+        self.bind("<KP_Enter>", self._accept)
+        self.bind("<Escape>", lambda event: self._hide())
+        # A click on the list moves focus first; let it land before deciding to close
+        self.bind("<FocusOut>", lambda event: self.after(150, self._hide_unless_focused))
+
+    def _typed(self, event):
+        if event.keysym in self.KEYS_IGNORED:
+            return
+        text = self.get()
+        matches = self.suggest(text) if text.strip() else []
+        if matches:
+            self._show(matches)
+        else:
+            self._hide()
+
+    def _show(self, matches):
+        if self.listbox is None:
+            self.listbox = tk.Listbox(self.winfo_toplevel(), font=self.cget("font"), exportselection=False, takefocus=0)
+            self.listbox.bind("<ButtonRelease-1>", self._accept)
+        self.listbox.delete(0, "end")
+        for match in matches:
+            self.listbox.insert("end", match)
+        self.listbox.config(height=len(matches), width=max(int(self.cget("width")), max(len(match) for match in matches)))
+        self.listbox.place(in_=self, x=0, rely=1.0, anchor="nw")
+        self.listbox.lift()
+
+    def _hide(self):
+        if self.listbox is not None:
+            self.listbox.place_forget()
+
+    def _hide_unless_focused(self):
+        if self.focus_get() is not self:
+            self._hide()
+
+    def _visible(self):
+        return self.listbox is not None and bool(self.listbox.place_info())
+
+    def _move(self, step):
+        if not self._visible():
+            return None
+        current = self.listbox.curselection()
+        index = min(max((current[0] + step) if current else (0 if step > 0 else self.listbox.size() - 1), 0),
+                    self.listbox.size() - 1)
+        self.listbox.selection_clear(0, "end")
+        self.listbox.selection_set(index)
+        self.listbox.see(index)
+        return "break"
+
+    def _accept(self, event=None):
+        if not self._visible():
+            return None
+        current = self.listbox.curselection()
+        if current:
+            self.delete(0, "end")
+            self.insert(0, self.listbox.get(current[0]))
+            self.icursor("end")
+        self._hide()
+        self.focus_set()
+        return "break"
+
+class FormWindow:
+    """A category window rendered from `schema`; subclasses only set the schema."""
+
+    schema = None
+
+    def __init__(self, master, callback):
+        self.top = master
+        self.callback = callback
+        self.form = compile_schema(self.schema)
+        self.top.title(self.schema["title"])
+        center_window(self.top)
+        HISTORY.load_latest(self.schema["category"])
+        if self.form.autocomplete:
+            # Past values load in the background; suggestions fill in as they arrive
+            HISTORY.load(self.schema["category"], self.form.autocomplete)
+
+        # Per section, in schema order: list of rows (repeat), entries dict
+        # (group, values, optional; None while unchecked) or {name: entries} (checklist)
+        self.state = [None] * len(self.schema["sections"])
+        self.toggles = {}
+        self.optional_widgets = {}
+        # Set by keep_drafts(); edits are only journaled once the launcher names the window
+        self.draft_key = None
+        self.draft_job = None
+        if self.form.style["layout"] == "stacked":
+            self._build_stacked()
+        else:
+            self._build_grid()
+
+    # --- Layout ---
+    def _build_stacked(self):
+        form = self.form
+        submit = form.style["submit"]
+        tk.Label(self.top, text=self.schema["header"], font=form.title_font).pack(pady=20)
+        for index, section in enumerate(self.schema["sections"]):
+            entries = {}
+            for spec in section["fields"]:
+                tk.Label(self.top, text=spec["label"], font=form.label_font).pack(pady=5)
+                entries[spec["key"]] = tk.Entry(self.top, font=form.entry_font, width=spec["width"])
+                entries[spec["key"]].pack(pady=5)
+            self.state[index] = entries
+        button(self.top, "SUBMIT", self.submit, submit["bg"], "green", size=submit["size"], width=None, height=None,
+               active_bg=submit["active_bg"], active_fg=submit["active_fg"], padx=30, pady=15).pack(pady=30)
+        self._prefill_button(self.top).pack(pady=(0, 10))
+        self.date_picker = date_picker(self.top)
+
+    def _build_grid(self):
+        form, style = self.form, self.form.style
+        padx, pady = style["pad"]
+        submit = style["submit"]
+
+        header_frame = tk.Frame(self.top)
+        header_frame.pack(fill="x", padx=padx, pady=pady)
+        tk.Label(header_frame, text=self.schema["header"], font=form.title_font).pack(side="left")
+        button(header_frame, "SUBMIT", self.submit, submit["bg"], "green", size=submit["size"], width=submit["width"],
+               height=submit["height"], active_bg=submit["active_bg"], active_fg=submit["active_fg"]).pack(side="right")
+        self._prefill_button(header_frame).pack(side="right", padx=10)
+
+        if style["date_first"]:
+            self.date_picker = date_picker(self.top)
+
+        self.grid_frame = tk.Frame(self.top)
+        self.grid_frame.pack(padx=padx, pady=pady, fill="both", expand=True)
+
+        for index, section in enumerate(self.schema["sections"]):
+            build = getattr(self, f"_build_{section['kind']}")
+            self.state[index] = build(index, section)
+
+        repeats = [(index, section) for index, section in enumerate(self.schema["sections"]) if section["kind"] == "repeat"]
+        if repeats:
+            self._build_row_buttons(repeats)
+
+        if not style["date_first"]:
+            self.date_picker = date_picker(self.top)
+
+        frame_toggles = [(index, section) for index, section in enumerate(self.schema["sections"])
+                         if section["kind"] == "optional" and section["toggle_row"] is None]
+        if frame_toggles:
+            optional_frame = tk.Frame(self.top)
+            optional_frame.pack(fill="x", padx=padx, pady=pady)
+            for index, section in frame_toggles:
+                tk.Checkbutton(optional_frame, text=section["toggle"], variable=self.toggles[index],
+                               command=lambda i=index: self.toggle(i)).pack(side="left", padx=5)
+
+    def _prefill_button(self, parent):
+        prefill = self.form.style["prefill"]
+        return button(parent, "Same as Last", self.prefill_last, prefill["bg"], "black", size=prefill["size"],
+                      width=prefill["width"], height=None, active_bg=prefill["active_bg"], active_fg="black")
+
+    def _build_row_buttons(self, repeats):
+        buttons = self.form.style["buttons"]
+        button_frame = tk.Frame(self.top)
+        button_frame.pack(fill="x", padx=buttons["pad"][0], pady=buttons["pad"][1])
+        for index, section in repeats:
+            for action, command in (("add", lambda i=index: self.add_row(i)), ("remove", lambda i=index: self.remove_row(i))):
+                spec = section[action]
+                if isinstance(spec, str):
+                    if action == "add":
+                        spec = (spec, buttons["add_bg"], "blue", buttons["add_active"])
+                    else:
+                        spec = (spec, "#F44336", "red", "#D32F2F")
+                text, bg, fg, active_bg = (tuple(spec) + (None,))[:4]
+                widget = button(button_frame, text, command, bg, fg, size=buttons["size"], width=buttons["width"],
+                                height=buttons["height"], active_bg=active_bg)
+                if buttons["layout"] == "pair":
+                    widget.pack(side="left" if action == "add" else "right")
+                else:
+                    widget.pack(side="left", padx=buttons["padx"])
+
+    def _grid_fields(self, parent, row, fields, widgets, column=1, group=None):
+        # Label/entry pairs across one grid row; returns {key: Entry or StringVar}.
+        # group (a repeat section's key or prefix) enables its autocomplete fields
+        form, padx = self.form, self.form.style["padx"]
+        entries = {}
+        for spec in fields:
+            label = tk.Label(parent, text=spec["label"], font=form.label_font)
+            label.grid(row=row, column=column, sticky="w", padx=padx)
+            if spec["kind"] == "choice":
+                var = tk.StringVar(value=spec["choices"][0])
+                var.trace_add("write", lambda *args: self._edited())
+                widget = tk.OptionMenu(parent, var, *spec["choices"])
+                widget.config(font=form.entry_font)
+                entries[spec["key"]] = var
+            elif group and spec.get("autocomplete"):
+                field_id = (self.schema["category"], group, spec["key"])
+                widget = AutocompleteEntry(parent, lambda text, field_id=field_id: HISTORY.suggest(field_id, text),
+                                           font=form.entry_font, width=spec["width"])
+                entries[spec["key"]] = widget
+            else:
+                widget = tk.Entry(parent, font=form.entry_font, width=spec["width"])
+                entries[spec["key"]] = widget
+            widget.grid(row=row, column=column + 1, padx=padx)
+            widgets += [label, widget]
+            column += 2
+        return entries
+
+    def _row_label(self, parent, row, text, row_label=None, width=None):
+        if row_label:
+            font, padx = ("Helvetica", row_label[0], "bold"), row_label[1]
+        else:
+            font, padx = self.form.row_label_font, self.form.style["row_label"][1]
+        label = tk.Label(parent, text=text, font=font, width=width, anchor="w")
+        label.grid(row=row, column=0, padx=padx, sticky="w")
+        return label
+
+    def _build_repeat(self, index, section):
+        container = RowContainer(self.grid_frame, lambda parent: self._new_row(parent, section), self.form.style["visible_rows"])
+        container.frame.grid(row=section["row"], column=0, columnspan=2 * len(section["fields"]) + 1, sticky="w")
+        self.state[index] = container
+        for _ in range(section["initial"]):
+            self.add_row(index)
+        return container
+
+    def _new_row(self, parent, section):
+        frame = tk.Frame(parent)
+        label = self._row_label(frame, 0, "", width=self.form.row_label_width)
+        entries = self._grid_fields(frame, 0, section["fields"], [], group=section["key"] or section["prefix"])
+        return {"frame": frame, "label": label, "entries": entries}
+
+    def _build_group(self, index, section):
+        widgets = [self._row_label(self.grid_frame, section["row"], section["label"], section["row_label"])]
+        return self._grid_fields(self.grid_frame, section["row"], section["fields"], widgets)
+
+    def _build_optional(self, index, section):
+        self.toggles[index] = tk.BooleanVar()
+        if section["toggle_row"] is not None:
+            font = ("Helvetica", section["toggle_size"] or self.form.style["label_size"])
+            tk.Checkbutton(self.grid_frame, text=section["toggle"], variable=self.toggles[index], font=font,
+                           command=lambda: self.toggle(index)).grid(row=section["toggle_row"], column=0, columnspan=2,
+                                                                    sticky="w", padx=5, pady=10)
+        return None
+
+    def _build_values(self, index, section):
+        form, padx = self.form, self.form.style["padx"]
+        column, pady = section["column"], section["pady"]
+        entries = {}
+        for offset, spec in enumerate(section["fields"]):
+            row = section["row"] + offset
+            tk.Label(self.grid_frame, text=spec["label"], font=form.label_font).grid(
+                row=row, column=column, sticky="e" if section["sticky"] else "w", padx=padx, pady=pady)
+            entry = tk.Entry(self.grid_frame, font=form.entry_font, width=spec["width"])
+            entry.grid(row=row, column=column + 1, padx=padx, pady=pady, sticky="w" if section["sticky"] else "")
+            entries[spec["key"]] = entry
+        return entries
+
+    def _build_checklist(self, index, section):
+        self.toggles[index] = {}
+        font = ("Helvetica", self.form.style["check_size"])
+        for row, (name, _) in enumerate(section["items"]):
+            var = tk.BooleanVar()
+            tk.Checkbutton(self.grid_frame, text=name, variable=var, font=font,
+                           command=lambda i=index, r=row: self.toggle_item(i, r)).grid(row=row, column=0, sticky="w", padx=5, pady=5)
+            self.toggles[index][name] = var
+        return {}
+
+    # --- Rows ---
+    def add_row(self, index):
+        section = self.schema["sections"][index]
+        container = self.state[index]
+        row = container.add()
+        row["label"].config(text=f"{section['prefix']} {chr(65 + len(container) - 1)}")
+        return row
+
+    def remove_row(self, index):
+        row = self.state[index].remove()
+        if row is None:
+            return
+        # Pooled rows come back empty, like new ones
+        for spec in self.schema["sections"][index]["fields"]:
+            entry = row["entries"][spec["key"]]
+            if spec["kind"] == "choice":
+                entry.set(spec["choices"][0])
+            else:
+                entry.delete(0, "end")
+
+    def toggle(self, index):
+        section = self.schema["sections"][index]
+        if self.toggles[index].get():
+            widgets = [self._row_label(self.grid_frame, section["row"], section["label"], section["row_label"])]
+            self.state[index] = self._grid_fields(self.grid_frame, section["row"], section["fields"], widgets)
+            self.optional_widgets[index] = widgets
+        else:
+            for widget in self.optional_widgets.pop(index, []):
+                widget.destroy()
+            self.state[index] = None
+
+    def toggle_item(self, index, row):
+        name, fields = self.schema["sections"][index]["items"][row]
+        checked = self.state[index]
+        for widget in checked.pop(name, {}).get("widgets", []):
+            widget.destroy()
+        if self.toggles[index][name].get():
+            widgets = []
+            entries = self._grid_fields(self.grid_frame, row, fields, widgets)
+            checked[name] = {"widgets": widgets, "entries": entries}
+
+    # --- Prefill ---
+    def prefill_last(self):
+        row = HISTORY.latest(self.schema["category"])
+        if row is None:
+            messagebox.showinfo("Nothing to Prefill", f"There is no earlier {self.schema['category']} entry yet.")
+            return
+        self.prefill(row)
+
+    def prefill(self, row, keep_blank=False):
+        """Fill the fields from a flat history row ("Section - Sublabel - Key" columns); the date is left alone.
+
+        Repeat sections get as many rows as the entry had, optional rows and
+        checklist items are checked if it filled them, and "N/A" comes back blank.
+        With keep_blank, a blank column still counts as filled (drafts hold
+        every open row, while stored rows pad absent ones with blanks).
+        """
+        def cells(prefix, fields):
+            return {spec["key"]: row.get(f"{prefix}{spec['key']}") for spec in fields}
+
+        def present(values):
+            return any(value is not None and (keep_blank or value != "") for value in values.values())
+
+        for index, section in enumerate(self.schema["sections"]):
+            kind = section["kind"]
+            if kind == "repeat":
+                base = f"{section['key']} - " if section["key"] else ""
+                filled = [cells(f"{base}{section['prefix']} {chr(65 + i)} - ", section["fields"]) for i in range(26)]
+                count = max((i + 1 for i, values in enumerate(filled) if present(values)), default=0)
+                container = self.state[index]
+                while len(container) < count:
+                    self.add_row(index)
+                while len(container) > count:
+                    self.remove_row(index)
+                for entries, values in zip(container, filled):
+                    self._fill(section["fields"], entries["entries"], values)
+            elif kind in ("group", "optional"):
+                values = cells(f"{section['label']} - ", section["fields"])
+                if kind == "optional" and self.toggles[index].get() != present(values):
+                    self.toggles[index].set(present(values))
+                    self.toggle(index)
+                if self.state[index] is not None:
+                    self._fill(section["fields"], self.state[index], values)
+            elif kind == "values":
+                values = cells(f"{section['key']} - " if section["key"] else "", section["fields"])
+                self._fill(section["fields"], self.state[index], values)
+            elif kind == "checklist":
+                for position, (name, fields) in enumerate(section["items"]):
+                    values = cells(f"{name} - ", fields)
+                    if self.toggles[index][name].get() != present(values):
+                        self.toggles[index][name].set(present(values))
+                        self.toggle_item(index, position)
+                    if name in self.state[index]:
+                        self._fill(fields, self.state[index][name]["entries"], values)
+
+    def _fill(self, fields, entries, values):
+        for spec in fields:
+            value = values[spec["key"]]
+            text = "" if value is None or str(value) == "N/A" else str(value)
+            widget = entries[spec["key"]]
+            if spec["kind"] == "choice":
+                if text in spec["choices"]:
+                    widget.set(text)
+            else:
+                widget.delete(0, "end")
+                widget.insert(0, text)
+
+    # --- Drafts ---
+    def keep_drafts(self, key):
+        """Journal the fields under key as they are edited, first restoring the draft a crash left under it."""
+        self.draft_key = key
+        draft = DRAFTS.draft(key)
+        if draft is not None:
+            self.restore(draft)
+        self.top.bind("<KeyRelease>", self._edited, add="+")
+        self.top.bind("<ButtonRelease>", self._edited, add="+")
+        self.date_picker.bind("<<DateEntrySelected>>", self._edited, add="+")
+
+    def discard_draft(self):
+        """The window is closing without a submit; its draft goes with it."""
+        if self.draft_key is not None:
+            self._cancel_draft_job()
+            DRAFTS.discard(self.draft_key)
+
+    def snapshot(self):
+        """The fields' current text, unvalidated, as a flat row in the columns prefill() reads."""
+        row = {"Date": self.date_picker.get_date().isoformat()}
+
+        def put(prefix, fields, entries):
+            for spec in fields:
+                row[f"{prefix}{spec['key']}"] = entries[spec["key"]].get()
+
+        for section, state in zip(self.schema["sections"], self.state):
+            kind = section["kind"]
+            if kind == "repeat":
+                base = f"{section['key']} - " if section["key"] else ""
+                for i, entries in enumerate(state):
+                    put(f"{base}{section['prefix']} {chr(65 + i)} - ", section["fields"], entries["entries"])
+            elif kind == "group" or (kind == "optional" and state is not None):
+                put(f"{section['label']} - ", section["fields"], state)
+            elif kind == "values":
+                put(f"{section['key']} - " if section["key"] else "", section["fields"], state)
+            elif kind == "checklist":
+                for name, fields in section["items"]:
+                    if name in state:
+                        put(f"{name} - ", fields, state[name]["entries"])
+        return row
+
+    def restore(self, row):
+        self.prefill(row, keep_blank=True)
+        if row.get("Date"):
+            self.date_picker.set_date(date.fromisoformat(row["Date"]))
+
+    def _edited(self, event=None):
+        # Many edits in a row cost one scheduled save
+        if self.draft_key is not None and self.draft_job is None:
+            self.draft_job = self.top.after(DRAFT_DELAY_MS, self._save_draft)
+
+    def _save_draft(self):
+        self.draft_job = None
+        DRAFTS.save(self.draft_key, self.snapshot())
+
+    def _cancel_draft_job(self):
+        if self.draft_job is not None:
+            self.top.after_cancel(self.draft_job)
+            self.draft_job = None
+
+    # --- Result ---
+    def collect(self):
+        """The nested result dict handed to the callback; raises InvalidInput at the first bad field."""
+        form = self.form
+        result = {"Date": self.date_picker.get_date().isoformat()}
+        for index, (section, state) in enumerate(zip(self.schema["sections"], self.state)):
+            kind = section["kind"]
+            if kind == "repeat":
+                target = result.setdefault(section["key"], {}) if section["key"] else result
+                for i, row in enumerate(state):
+                    label = f"{section['prefix']} {chr(65 + i)}"
+                    target[label] = form.read(section["fields"], row["entries"], label)
+            elif kind == "group" or (kind == "optional" and state is not None):
+                result[section["label"]] = form.read(section["fields"], state, section["label"])
+            elif kind == "values":
+                target = result.setdefault(section["key"], {}) if section["key"] else result
+                for spec in section["fields"]:
+                    target[spec["key"]] = form.validators[id(spec)](state[spec["key"]].get(), spec["label"])
+            elif kind == "checklist":
+                for name, fields in section["items"]:
+                    if name in state:
+                        result[name] = form.read(fields, state[name]["entries"], name)
+        return result
+
+    def submit(self):
+        try:
+            result = self.collect()
+        except InvalidInput as e:
+            messagebox.showerror(e.title, e.message)
+            return
+        if self.form.autocomplete_fields:
+            HISTORY.record(result["Date"], self._autocomplete_values(result))
+        if self.draft_key is not None:
+            # Kept until the session's commit lands, in case it never does
+            self._cancel_draft_job()
+            DRAFTS.save(self.draft_key, self.snapshot(), submitted=True)
+        self.callback(self.schema["category"], result)
+        self.top.destroy()
+
+    def _autocomplete_values(self, result):
+        # (field id, value) for every autocomplete field filled in the submitted rows
+        values = []
+        for section, spec, field_id in self.form.autocomplete_fields:
+            rows = result[section["key"]] if section["key"] else result
+            for label, row in rows.items():
+                if label[:-1] == section["prefix"] + " " and isinstance(row, dict):
+                    values.append((field_id, row[spec["key"]]))
+        return values